@@ -14,4 +14,4 @@ cd server
 flask db upgrade
 
 # Optional: Seed database (uncomment after first deploy if needed)
-# python seed_kenya_events.py
+# flask seed
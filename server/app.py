@@ -3,8 +3,9 @@ load_dotenv()
 
 import os
 import logging
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, jsonify, request
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
@@ -14,14 +15,26 @@ from server.auth import auth_bp
 from server.events import events_bp
 from server.tickets import tickets_bp
 from server.eventbrite import eventbrite_bp
+from server.cli import inventory_cli, search_cli, eventbrite_cli, geo_cli, holds_cli, seed_command
+from server.services.search_service import include_in_autogenerate
+from server.instrumentation import init_instrumentation
+from server.cache import init_cache
+from server.passwords import init_password_hasher
+from server.ratelimit import init_rate_limiter
+from server.identity import init_identity
+from server.uploads import init_uploads
+from server.waiting_room import init_waiting_room
+from server.idempotency import init_idempotency
 
 from server.config import DevelopmentConfig, ProductionConfig, TestingConfig
 
-def create_app():
+def create_app(config_class=None):
     app = Flask(__name__)
 
     env = os.environ.get('FLASK_ENV', 'development')
-    if env == 'production':
+    if config_class is not None:
+        app.config.from_object(config_class)
+    elif env == 'production':
         app.config.from_object(ProductionConfig)
     elif env == 'testing':
         app.config.from_object(TestingConfig)
@@ -30,7 +43,7 @@ def create_app():
     
 
     basedir = os.path.abspath(os.path.dirname(__file__))
-    app.config['UPLOAD_FOLDER'] = os.path.join(basedir, 'uploads')
+    app.config.setdefault('UPLOAD_FOLDER', os.path.join(basedir, 'uploads'))
 
     # Configure logging
     if not app.debug:
@@ -38,12 +51,26 @@ def create_app():
         log_handler.setLevel(logging.ERROR)
         app.logger.addHandler(log_handler)
     
-    CORS(app, resources={r"/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE"], "allow_headers": ["Content-Type", "Authorization"]}})
+    # Behind a proxy, the client address (used by rate limits) comes from X-Forwarded-For
+    proxy_count = app.config.get('TRUSTED_PROXY_COUNT', 0)
+    if proxy_count:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxy_count, x_proto=proxy_count, x_host=proxy_count)
+
+    CORS(app, resources={r"/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE"], "allow_headers": ["Content-Type", "Authorization", "X-Queue-Token", "Idempotency-Key"], "expose_headers": ["Idempotent-Replayed", "Retry-After"]}})
 
     # Initialize extensions
     db.init_app(app)
-    Migrate(app, db)
-    JWTManager(app)
+    Migrate(app, db, include_object=include_in_autogenerate)
+    jwt = JWTManager(app)
+    init_identity(app, jwt)
+    init_uploads(app)
+    init_cache(app)
+    init_password_hasher(app)
+    init_rate_limiter(app)
+    init_waiting_room(app)
+    init_idempotency(app)
+    if app.config['METRICS_ENABLED']:
+        init_instrumentation(app)
 
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix='/auth')
@@ -51,6 +78,14 @@ def create_app():
     app.register_blueprint(tickets_bp, url_prefix='/tickets')
     app.register_blueprint(eventbrite_bp, url_prefix='/eventbrite')
 
+    # CLI commands
+    app.cli.add_command(inventory_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(eventbrite_cli)
+    app.cli.add_command(geo_cli)
+    app.cli.add_command(holds_cli)
+    app.cli.add_command(seed_command)
+
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -61,10 +96,6 @@ def create_app():
         app.logger.error(f'Internal server error: {error}')
         return jsonify({'error': 'Internal server error'}), 500
 
-    @app.route('/uploads/<filename>')#for uploading profile pics
-    def uploaded_file(filename):
-        return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
-
     return app
 
 if __name__ == '__main__':
@@ -1,16 +1,23 @@
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from flask_jwt_extended import create_access_token, current_user, jwt_required
 from datetime import timedelta
 from server.models import db, User
+from server.passwords import PasswordHasherBusy, get_password_hasher
+from server.ratelimit import client_ip, rate_limit, request_email
+from server.identity import invalidate_user
+from server.uploads import UnsupportedImage, UploadTooLarge, get_thumbnail_worker, save_image
 import re
-import os
-from werkzeug.utils import secure_filename
 
 auth_bp = Blueprint('auth', __name__)
 
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
 
+@auth_bp.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(error):
+    response = jsonify({'error': 'Server is busy, please try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -20,6 +27,7 @@ def is_valid_email(email):
     return re.match(pattern, email) is not None
 
 @auth_bp.route('/register', methods=['POST'])
+@rate_limit('register_ip', client_ip)
 def register():
     data = request.get_json()
 
@@ -52,7 +60,7 @@ def register():
         username=data['username'],
         email=data['email']
     )
-    new_user.password = data['password']  # This will hash the password
+    new_user.password_hash = get_password_hasher().hash(data['password'])
 
     try:
         db.session.add(new_user)
@@ -60,7 +68,7 @@ def register():
         
         # Create access token
         access_token = create_access_token(
-            identity=new_user.id,
+            identity=str(new_user.id),
             expires_delta=timedelta(days=1)
         )
         
@@ -75,6 +83,8 @@ def register():
         return jsonify({'error': 'Registration failed'}), 500
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit('login_ip', client_ip)
+@rate_limit('login_email', request_email)
 def login():
     data = request.get_json()
 
@@ -86,12 +96,22 @@ def login():
     user = User.query.filter_by(email=data['email']).first()
 
     # Verify user and password
-    if not user or not user.verify_password(data['password']):
+    hasher = get_password_hasher()
+    if not user or not hasher.verify(user.password_hash, data['password']):
         return jsonify({'error': 'Invalid email or password'}), 401
 
+    # Upgrade hashes made with older cost settings while we have the plaintext
+    if hasher.needs_rehash(user.password_hash):
+        user.password_hash = hasher.hash(data['password'])
+        try:
+            db.session.commit()
+            invalidate_user(user.id)
+        except Exception:
+            db.session.rollback()
+
     # Create access token
     access_token = create_access_token(
-        identity=user.id,
+        identity=str(user.id),
         expires_delta=timedelta(days=1)
     )
 
@@ -104,19 +124,13 @@ def login():
 @auth_bp.route('/profile', methods=['GET'])
 @jwt_required()
 def get_profile():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({'error': 'User not found'}), 404
+    user = current_user
     return jsonify(user.to_dict()), 200
 
 @auth_bp.route('/profile', methods=['PUT'])
 @jwt_required()
 def update_profile():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({'error': 'User not found'}), 404
+    user = current_user
     data = request.get_json()
     updated = False
     if 'username' in data and data['username']:
@@ -124,12 +138,13 @@ def update_profile():
         updated = True
     if 'email' in data and data['email']:
         # Check for email uniqueness
-        if User.query.filter(User.email == data['email'], User.id != user_id).first():
+        if User.query.filter(User.email == data['email'], User.id != user.id).first():
             return jsonify({'error': 'Email already in use'}), 400
         user.email = data['email']
         updated = True
     if updated:
         db.session.commit()
+        invalidate_user(user.id)
         return jsonify(user.to_dict()), 200
     else:
         return jsonify({'error': 'No valid fields to update'}), 400
@@ -137,21 +152,32 @@ def update_profile():
 @auth_bp.route('/profile/picture', methods=['POST'])
 @jwt_required()
 def upload_profile_picture():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({'error': 'User not found'}), 404
+    user = current_user
+    max_bytes = current_app.config['PROFILE_PICTURE_MAX_BYTES']
+
+    # Refuse oversized bodies before the multipart parser spools them to disk
+    if request.content_length is None:
+        return jsonify({'error': 'Content-Length required'}), 411
+    if request.content_length > max_bytes + 16 * 1024:  # Allow for multipart framing
+        return jsonify({'error': f'File is larger than {max_bytes // (1024 * 1024)} MB'}), 413
 
     if 'file' not in request.files:
         return jsonify({'error': 'No file part'}), 400
     file = request.files['file']
     if file.filename == '':
         return jsonify({'error': 'No selected file'}), 400
-    if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        file.save(os.path.join(current_app.config['UPLOAD_FOLDER'], filename))
-        user.profile_picture = filename
-        db.session.commit()
-        return jsonify(user.to_dict()), 200
-    else:
-        return jsonify({'error': 'File type not allowed'}), 400 
\ No newline at end of file
+    if not allowed_file(file.filename):
+        return jsonify({'error': 'File type not allowed'}), 400
+
+    try:
+        path = save_image(file.stream, current_app.config['UPLOAD_FOLDER'], max_bytes)
+    except UploadTooLarge:
+        return jsonify({'error': f'File is larger than {max_bytes // (1024 * 1024)} MB'}), 413
+    except UnsupportedImage:
+        return jsonify({'error': 'File type not allowed'}), 400
+
+    user.profile_picture = path
+    db.session.commit()
+    invalidate_user(user.id)
+    get_thumbnail_worker().submit(path)
+    return jsonify(user.to_dict()), 200
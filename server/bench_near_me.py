@@ -0,0 +1,116 @@
+"""
+Benchmark for the local near-me radius search
+Run with: python -m server.bench_near_me [--events 100000] [--queries 200]
+Loads synthetic events into a throwaway SQLite database and compares the
+geohash-indexed search with a full scan + haversine over every event.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from server import geo
+from server.app import create_app
+from server.config import TestingConfig
+from server.models import db, User, Event
+
+# Roughly Kenya, densest around Nairobi
+CITIES = [(-1.2921, 36.8219), (-4.0435, 39.6682), (-0.0917, 34.7680), (-0.3031, 36.0800), (0.5143, 35.2698)]
+
+
+class BenchConfig(TestingConfig):
+    CACHE_BACKEND = 'none'
+
+
+def _synthetic_events(count, rng):
+    now = datetime.utcnow()
+    for i in range(count):
+        if rng.random() < 0.7:
+            city_lat, city_lng = rng.choice(CITIES)
+            lat, lng = rng.gauss(city_lat, 0.3), rng.gauss(city_lng, 0.3)
+        else:
+            lat, lng = rng.uniform(-4.7, 4.6), rng.uniform(33.9, 41.9)
+        yield {
+            'name': f'Event {i}',
+            'location': 'Kenya',
+            'location_lat': lat,
+            'location_lng': lng,
+            'geohash': geo.encode(lat, lng),
+            'description': 'Synthetic event',
+            'date': now + timedelta(days=rng.randint(1, 365)),
+            'price': 500.0,
+            'capacity': 100,
+            'status': 'upcoming',
+            'category': rng.choice(['Music', 'Tech', 'Food', 'Art']),
+            'user_id': 1
+        }
+
+
+def _brute_force(query, lat, lng, radius_km, limit):
+    matches = []
+    for event in query.all():
+        distance = geo.haversine_km(lat, lng, event.location_lat, event.location_lng)
+        if distance <= radius_km:
+            matches.append((event, distance))
+    return sorted(matches, key=lambda match: match[1])[:limit]
+
+
+def _time(fn, points):
+    timings = []
+    for lat, lng in points:
+        started = time.perf_counter()
+        fn(lat, lng)
+        timings.append(time.perf_counter() - started)
+        db.session.expunge_all()
+    return timings
+
+
+def run(event_count, query_count, radius_km, seed=42):
+    rng = random.Random(seed)
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    BenchConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(BenchConfig)
+    try:
+        with app.app_context():
+            db.create_all()
+            db.session.execute(insert(User), [{'username': 'bench', 'email': 'bench@test.com', 'password_hash': 'x'}])
+            events = list(_synthetic_events(event_count, rng))
+            for start in range(0, len(events), 10000):
+                db.session.execute(insert(Event), events[start:start + 10000])
+            db.session.commit()
+            db.session.connection().exec_driver_sql('ANALYZE')
+            db.session.commit()
+
+            points = [rng.choice(CITIES) for _ in range(query_count)]
+            points = [(lat + rng.uniform(-0.2, 0.2), lng + rng.uniform(-0.2, 0.2)) for lat, lng in points]
+            base = Event.query.filter(Event.status == 'upcoming')
+
+            indexed = _time(lambda lat, lng: geo.nearby(base, Event.id, Event.geohash, Event.location_lat, Event.location_lng, lat, lng, radius_km, 20), points)
+            scanned = _time(lambda lat, lng: _brute_force(base, lat, lng, radius_km, 20), points[:max(query_count // 10, 1)])
+
+            print(f'{event_count} events, radius {radius_km} km')
+            for label, timings in (('geohash index', indexed), ('full scan', scanned)):
+                print(f'  {label:<14} median {statistics.median(timings) * 1000:8.1f} ms   '
+                      f'max {max(timings) * 1000:8.1f} ms   ({len(timings)} queries)')
+            db.session.remove()
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--radius', type=float, default=25)
+    args = parser.parse_args()
+    run(args.events, args.queries, args.radius)
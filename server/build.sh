@@ -11,4 +11,4 @@ pip install -r requirements.txt
 flask db upgrade
 
 # Optional: Seed database (comment out after first deploy)
-# python seed_kenya_events.py
+# flask seed
@@ -0,0 +1,200 @@
+"""
+Response caching for public, read-mostly endpoints
+Backends: an in-process LRU with per-entry TTL (default) or any Redis-compatible
+client (get / set(ex=) / delete) shared between workers.
+Entries are grouped into namespaces ('events', 'event:<id>'); writes
+invalidate a namespace by bumping its generation, which orphans every key in
+it without having to find them.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries=1024, default_ttl=None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (expires_at or None, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def add(self, key, value, ttl=None):
+        """Sets `key` only if it is absent or expired. Returns True if it was set."""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                return False
+            self._entries[key] = (now + ttl if ttl else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCache:
+    """Adapter for a Redis-compatible client; values are stored as JSON."""
+
+    def __init__(self, client, prefix='ticketi:', default_ttl=None):
+        self.client = client
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+
+    def get(self, key, default=None):
+        raw = self.client.get(self.prefix + key)
+        return default if raw is None else json.loads(raw)
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        self.client.set(self.prefix + key, json.dumps(value), ex=ttl or None)
+
+    def add(self, key, value, ttl=None):
+        """SET NX: sets `key` only if it is absent. Returns True if it was set."""
+        ttl = self.default_ttl if ttl is None else ttl
+        return bool(self.client.set(self.prefix + key, json.dumps(value), ex=ttl or None, nx=True))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+
+class ResponseCache:
+    """Namespaced response cache on top of an LRUCache or RedisCache backend."""
+
+    def __init__(self, backend, default_ttl=30):
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    def _generation(self, namespace):
+        generation = self.backend.get(f'gen:{namespace}')
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(f'gen:{namespace}', generation, ttl=0)
+        return generation
+
+    def key_for(self, namespace, path, args):
+        normalized = '&'.join(f'{name}={value}' for name, value in sorted(args))
+        return f'resp:{namespace}:{self._generation(namespace)}:{path}?{normalized}'
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.backend.set(key, value, ttl=self.default_ttl if ttl is None else ttl)
+
+    def invalidate(self, *namespaces):
+        for namespace in namespaces:
+            self.backend.set(f'gen:{namespace}', uuid.uuid4().hex, ttl=0)
+
+
+def init_cache(app):
+    """Creates the response cache selected by CACHE_BACKEND ('memory', 'redis' or 'none')."""
+    backend_name = app.config.get('CACHE_BACKEND', 'memory')
+    default_ttl = app.config.get('CACHE_DEFAULT_TTL', 30)
+
+    if backend_name == 'none':
+        return None
+
+    if backend_name == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND='redis' requires the redis package")
+        backend = RedisCache(redis.Redis.from_url(app.config['CACHE_REDIS_URL']))
+    else:
+        backend = LRUCache(max_entries=app.config.get('CACHE_MAX_ENTRIES', 1024))
+
+    cache = ResponseCache(backend, default_ttl=default_ttl)
+    app.extensions['response_cache'] = cache
+    return cache
+
+
+def invalidate(*namespaces):
+    """Drops cached responses for the given namespaces (no-op without a cache)."""
+    cache = current_app.extensions.get('response_cache')
+    if cache is not None:
+        cache.invalidate(*namespaces)
+
+
+def invalidate_event(event_id):
+    """Drops cached listings and every cached response about one event."""
+    invalidate('events', f'event:{event_id}')
+
+
+def cached_response(namespace, ttl=None):
+    """Caches a view's successful responses, keyed on path and query string.
+
+    `namespace` is a string or a function of the view's URL arguments.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions.get('response_cache')
+            if cache is None:
+                return view(*args, **kwargs)
+
+            name = namespace(**kwargs) if callable(namespace) else namespace
+            key = cache.key_for(name, request.path, request.args.items(multi=True))
+
+            hit = cache.get(key)
+            if hit is not None:
+                if hit.get('etag') and request.if_none_match.contains(hit['etag']):
+                    response = current_app.response_class(status=304)
+                else:
+                    response = current_app.response_class(hit['body'], status=hit['status'], mimetype=hit['mimetype'])
+                if hit.get('etag'):
+                    response.set_etag(hit['etag'])
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                cache.set(key, {
+                    'body': response.get_data(as_text=True),
+                    'status': response.status_code,
+                    'mimetype': response.mimetype,
+                    'etag': response.get_etag()[0]
+                }, ttl=ttl)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,138 @@
+"""
+Flask CLI commands for Ticketi
+Run with `flask --app server.app <group> <command>`
+"""
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import bindparam, update
+from server import geo
+from server.cache import invalidate
+from server.seed import has_data, reset_database, seed_database
+from server.models import db, Event
+from server.services.event_service import virtualize_inventory
+from server.services.search_service import rebuild_index
+from server.services.eventbrite_service import eventbrite_service
+from server.services.eventbrite_ingest import IngestionWorker, ingest_events
+from server.services.hold_service import HoldSweeper, release_expired_holds
+
+inventory_cli = AppGroup('inventory', help='Manage ticket inventory.')
+search_cli = AppGroup('search', help='Manage the event search index.')
+eventbrite_cli = AppGroup('eventbrite', help='Mirror Eventbrite events locally.')
+geo_cli = AppGroup('geo', help='Manage the event location index.')
+holds_cli = AppGroup('holds', help='Manage ticket holds.')
+
+
+@inventory_cli.command('virtualize')
+@click.option('--event-id', type=int, help='Only convert this event.')
+def virtualize_command(event_id):
+    """Convert materialized events to counter-based (virtual) inventory."""
+    query = Event.query.filter(Event.inventory_mode == 'materialized')
+    if event_id:
+        query = query.filter(Event.id == event_id)
+
+    converted = 0
+    for event in query.all():
+        _, error = virtualize_inventory(event)
+        if error:
+            click.echo(f"Event {event.id}: {error['error']}", err=True)
+            continue
+        converted += 1
+
+    click.echo(f'Converted {converted} event(s) to virtual inventory')
+
+
+@search_cli.command('reindex')
+def reindex_command():
+    """Rebuild the event full-text index from the events table."""
+    rebuild_index()
+    click.echo('Event search index rebuilt')
+
+
+@eventbrite_cli.command('sync')
+def eventbrite_sync_command():
+    """Run one ingestion pass over EVENTBRITE_SYNC_LOCATIONS."""
+    stats = ingest_events(
+        eventbrite_service,
+        current_app.config['EVENTBRITE_SYNC_LOCATIONS'],
+        max_pages=current_app.config['EVENTBRITE_SYNC_MAX_PAGES']
+    )
+    click.echo(f"Mirrored {stats['events']} events from {stats['pages']} pages, pruned {stats['pruned']}")
+    for location, page in stats['resume_from'].items():
+        click.echo(f"Eventbrite errored on page {page} of {location}; see the log", err=True)
+
+
+@eventbrite_cli.command('run-worker')
+def eventbrite_worker_command():
+    """Ingest every EVENTBRITE_SYNC_INTERVAL seconds until interrupted."""
+    worker = IngestionWorker(
+        current_app._get_current_object(),
+        eventbrite_service,
+        current_app.config['EVENTBRITE_SYNC_LOCATIONS'],
+        interval=current_app.config['EVENTBRITE_SYNC_INTERVAL'],
+        max_pages=current_app.config['EVENTBRITE_SYNC_MAX_PAGES']
+    )
+    click.echo(f"Syncing {', '.join(worker.locations)} every {worker.interval}s")
+    worker.run_forever()
+
+
+@holds_cli.command('sweep')
+@click.option('--batch-size', type=int, help='Holds expired per UPDATE (default: HOLD_SWEEP_BATCH_SIZE).')
+def holds_sweep_command(batch_size):
+    """Release every hold past its expiry time."""
+    released = release_expired_holds(batch_size=batch_size or current_app.config['HOLD_SWEEP_BATCH_SIZE'])
+    click.echo(f'Released {released} expired hold(s)')
+
+
+@holds_cli.command('run-sweeper')
+def holds_sweeper_command():
+    """Release expired holds every HOLD_SWEEP_INTERVAL seconds until interrupted."""
+    sweeper = HoldSweeper(
+        current_app._get_current_object(),
+        interval=current_app.config['HOLD_SWEEP_INTERVAL'],
+        batch_size=current_app.config['HOLD_SWEEP_BATCH_SIZE']
+    )
+    click.echo(f'Sweeping expired holds every {sweeper.interval}s')
+    sweeper.run_forever()
+
+
+@geo_cli.command('backfill')
+@click.option('--batch-size', default=1000, show_default=True)
+def geo_backfill_command(batch_size):
+    """Compute the geohash of every event with coordinates."""
+    rows = db.session.execute(
+        db.select(Event.id, Event.location_lat, Event.location_lng).where(
+            Event.location_lat.isnot(None), Event.location_lng.isnot(None)
+        )
+    ).all()
+
+    statement = update(Event).where(Event.id == bindparam('event_id')).values(geohash=bindparam('hash'))
+    for start in range(0, len(rows), batch_size):
+        db.session.connection().execute(statement, [
+            {'event_id': event_id, 'hash': geo.encode(lat, lng)}
+            for event_id, lat, lng in rows[start:start + batch_size]
+        ])
+        db.session.commit()
+
+    invalidate('events')
+    click.echo(f'Geohashed {len(rows)} event(s)')
+
+
+@click.command('seed')
+@click.option('--scale', default=1, show_default=True, type=click.IntRange(1, 1000), help='Copies of the events catalog to load.')
+@click.option('--seed', 'rng_seed', default=42, show_default=True, help='Random seed; the same seed gives the same data.')
+@click.option('--batch-size', default=10000, show_default=True, type=click.IntRange(1))
+@click.option('--reset', is_flag=True, help='Delete existing users, events, tickets and transactions first.')
+def seed_command(scale, rng_seed, batch_size, reset):
+    """Load demo or load-test data."""
+    if has_data():
+        if not reset:
+            raise click.ClickException('Database already has data; pass --reset to replace it')
+        reset_database()
+
+    stats = seed_database(scale=scale, seed=rng_seed, batch_size=batch_size)
+    click.echo(
+        f"Seeded {stats['users']} users, {stats['events']} events, {stats['tickets']} tickets "
+        f"({stats['resale']} listed for resale) and {stats['transactions']} transactions"
+    )
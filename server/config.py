@@ -9,6 +9,54 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=1)
+    MAX_TICKETS_PER_ORDER = int(os.environ.get('MAX_TICKETS_PER_ORDER', 10))
+    TICKET_INVENTORY_MODE = os.environ.get('TICKET_INVENTORY_MODE', 'virtual')  # 'virtual' or 'materialized'
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'  # Serve /metrics and Server-Timing
+    METRICS_SLOW_STATEMENTS = 10  # Slowest SQL statements kept for /metrics
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')  # 'memory', 'redis' or 'none'
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_DEFAULT_TTL = int(os.environ.get('CACHE_DEFAULT_TTL', 30))  # Seconds
+    CACHE_MAX_ENTRIES = 1024  # In-process backend only
+    EVENTBRITE_SYNC_LOCATIONS = [loc.strip() for loc in os.environ.get('EVENTBRITE_SYNC_LOCATIONS', 'Nairobi, Kenya').split(';') if loc.strip()]
+    EVENTBRITE_SYNC_INTERVAL = int(os.environ.get('EVENTBRITE_SYNC_INTERVAL', 900))  # Seconds between ingestion runs
+    EVENTBRITE_SYNC_MAX_PAGES = int(os.environ.get('EVENTBRITE_SYNC_MAX_PAGES', 10))
+    EVENTBRITE_MIRROR_MAX_AGE = int(os.environ.get('EVENTBRITE_MIRROR_MAX_AGE', 3 * EVENTBRITE_SYNC_INTERVAL))  # Older mirrors send the mixed feed to the live API
+    EVENTBRITE_SERVE_FROM_MIRROR = os.environ.get('EVENTBRITE_SERVE_FROM_MIRROR', 'false').lower() == 'true'  # /eventbrite/events reads the mirror; the mixed feed does whenever it is fresh
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')  # werkzeug method string; changing it rehashes on next login
+    PASSWORD_HASH_EXECUTOR = os.environ.get('PASSWORD_HASH_EXECUTOR', 'process')  # 'process', 'thread' or 'inline'
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0)) or None  # Defaults to the CPU count
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 32))  # Queued hashes before answering 503
+    PASSWORD_HASH_QUEUE_TIMEOUT = 0.5  # Seconds to wait for a queue slot
+    RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', 'true').lower() == 'true'
+    RATELIMIT_BACKEND = os.environ.get('RATELIMIT_BACKEND', 'memory')  # 'memory' (per worker) or 'redis' (shared)
+    RATELIMIT_REDIS_URL = os.environ.get('RATELIMIT_REDIS_URL', CACHE_REDIS_URL)
+    RATELIMIT_MAX_KEYS = 10000  # In-process backend only
+    RATELIMIT_LOGIN_IP = os.environ.get('RATELIMIT_LOGIN_IP', '20/minute')
+    RATELIMIT_LOGIN_EMAIL = os.environ.get('RATELIMIT_LOGIN_EMAIL', '5/minute')  # Credential stuffing against one account
+    RATELIMIT_REGISTER_IP = os.environ.get('RATELIMIT_REGISTER_IP', '10/hour')
+    TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', 0))  # Reverse proxies whose X-Forwarded-* headers are believed
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))  # Seconds a JWT's user is served without a query
+    USER_CACHE_MAX_ENTRIES = 1024
+    MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 100 * 1024 * 1024))  # Largest request body (event imports); werkzeug answers 413 past it
+    PROFILE_PICTURE_MAX_BYTES = int(os.environ.get('PROFILE_PICTURE_MAX_BYTES', 5 * 1024 * 1024))
+    PROFILE_THUMBNAIL_SIZES = (64, 160)  # Square bounding boxes, in pixels
+    IMPORT_BATCH_SIZE = 1000  # Events written per COPY / INSERT
+    IMPORT_MAX_REPORTED_ERRORS = 1000
+    HOLD_TTL_SECONDS = int(os.environ.get('HOLD_TTL_SECONDS', 600))  # How long a checkout cart keeps its seats
+    HOLD_MAX_SECONDS = int(os.environ.get('HOLD_MAX_SECONDS', 1800))  # Extensions stop this long after the hold was placed
+    HOLD_SWEEP_INTERVAL = int(os.environ.get('HOLD_SWEEP_INTERVAL', 15))  # Seconds between expiry sweeps
+    HOLD_SWEEP_BATCH_SIZE = 1000  # Holds expired per UPDATE
+    WAITING_ROOM_ENABLED = os.environ.get('WAITING_ROOM_ENABLED', 'false').lower() == 'true'  # Queue tokens for purchases and holds
+    WAITING_ROOM_ADMIT_RATE = float(os.environ.get('WAITING_ROOM_ADMIT_RATE', 5))  # Buyers admitted per second, per event and worker
+    WAITING_ROOM_ADMIT_BURST = int(os.environ.get('WAITING_ROOM_ADMIT_BURST', 20))  # Admitted at once into an idle event
+    WAITING_ROOM_MAX_CONCURRENT = int(os.environ.get('WAITING_ROOM_MAX_CONCURRENT', 8))  # Purchase transactions in flight per worker
+    WAITING_ROOM_QUEUE_TIMEOUT = 2.0  # Seconds an admitted request waits for a slot before 503
+    WAITING_ROOM_TOKEN_TTL = 1800  # Seconds a queue token stays valid
+    IDEMPOTENCY_BACKEND = os.environ.get('IDEMPOTENCY_BACKEND', 'memory')  # 'memory' (per worker) or 'redis' (shared)
+    IDEMPOTENCY_REDIS_URL = os.environ.get('IDEMPOTENCY_REDIS_URL', CACHE_REDIS_URL)
+    IDEMPOTENCY_TTL = int(os.environ.get('IDEMPOTENCY_TTL', 86400))  # Seconds a response is replayed for its key
+    IDEMPOTENCY_MAX_KEYS = 10000  # In-process backend only
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'  # Let the front server send uploads
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -19,6 +67,8 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     JWT_SECRET_KEY = 'test-secret-key' # Simple key for tests
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'  # Cheap hashes keep the suite fast
+    PASSWORD_HASH_EXECUTOR = 'inline'
 
 class ProductionConfig(Config):
     """Production configuration."""
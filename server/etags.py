@@ -0,0 +1,30 @@
+"""
+Conditional GET helpers
+ETags are computed from row versions, so a matching If-None-Match is
+answered with 304 before the payload is ever serialised.
+"""
+
+import hashlib
+import json
+from flask import current_app, jsonify, request
+
+
+def event_etag(event):
+    return f'event-{event.id}-v{event.version}'
+
+
+def events_etag(events, **meta):
+    """ETag for a list page: the (id, version) of each row plus page metadata."""
+    state = json.dumps([[event.id, event.version] for event in events] + [sorted(meta.items())], default=str)
+    return 'events-' + hashlib.sha1(state.encode()).hexdigest()
+
+
+def conditional_json(etag, build_payload, status=200):
+    """Returns 304 if the client already has `etag`, else the JSON from `build_payload()`."""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(build_payload())
+        response.status_code = status
+    response.set_etag(etag)
+    return response
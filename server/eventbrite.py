@@ -3,12 +3,37 @@ Eventbrite API endpoints blueprint
 Provides access to Eventbrite events data
 """
 
-from flask import Blueprint, jsonify, request
+import math
+from datetime import datetime, timedelta
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import exists, literal, union_all
+from server.models import db, Event, ExternalEvent
+from server.pagination import keyset_page
 from server.services.eventbrite_service import eventbrite_service
+from server.services.search_service import apply_search
 
 eventbrite_bp = Blueprint('eventbrite', __name__)
 
 
+def _mirror_query(location=None, category=None, start_date=None, end_date=None):
+    """Upcoming mirrored Eventbrite events, filtered like the live API search."""
+    query = ExternalEvent.query.filter(ExternalEvent.date >= datetime.utcnow())
+    
+    if location:
+        query = query.filter(ExternalEvent.region == location)
+    
+    if category:
+        query = query.filter(ExternalEvent.category == category)
+    
+    if start_date:
+        query = query.filter(ExternalEvent.date >= datetime.strptime(start_date, '%Y-%m-%d'))
+    
+    if end_date:
+        query = query.filter(ExternalEvent.date <= datetime.strptime(f'{end_date} 23:59:59', '%Y-%m-%d %H:%M:%S'))
+    
+    return query
+
+
 @eventbrite_bp.route('/events', methods=['GET'])
 def get_eventbrite_events():
     """
@@ -28,6 +53,18 @@ def get_eventbrite_events():
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     
+    if current_app.config['EVENTBRITE_SERVE_FROM_MIRROR']:
+        pagination = _mirror_query(location, category, start_date, end_date).order_by(
+            ExternalEvent.date, ExternalEvent.id
+        ).paginate(page=page, per_page=per_page, error_out=False)
+        
+        return jsonify({
+            'events': [event.to_dict() for event in pagination.items],
+            'total_pages': pagination.pages,
+            'current_page': page,
+            'source': 'eventbrite'
+        })
+    
     result = eventbrite_service.search_events(
         location=location,
         category=category,
@@ -86,61 +123,150 @@ def get_nearby_events():
 def get_mixed_events():
     """
     Get mixed events from both local database and Eventbrite
-    Prioritizes Kenya/Nairobi events
-    Query params: same as /events endpoint
+    Prioritizes Kenya/Nairobi events. Eventbrite events come from the mirror
+    kept by `flask eventbrite run-worker`, so both sources are merged and
+    paged in the database; while the mirror has nothing fresh for the
+    location, they are fetched live instead (page mode only).
+    Query params: same as /events endpoint, plus
+        - cursor: Opaque cursor for streaming pages (empty for the first page)
     """
-    from server.models import Event as LocalEvent
-    
     # Get query params
     location = request.args.get('location', 'Nairobi, Kenya')
     category = request.args.get('category')
     page = int(request.args.get('page', 1))
     per_page = int(request.args.get('per_page', 12))
     search = request.args.get('search', '')
+    cursor = request.args.get('cursor')
     
-    # Fetch local events
-    local_query = LocalEvent.query
+    if not _mirror_is_fresh(location):
+        return _mixed_events_live(location, category, search, page, per_page)
     
+    return _mixed_events_from_mirror(location, category, search, page, per_page, cursor)
+
+
+def _mirror_is_fresh(location):
+    """Whether ingestion has synced `location` within EVENTBRITE_MIRROR_MAX_AGE seconds."""
+    synced_since = datetime.utcnow() - timedelta(seconds=current_app.config['EVENTBRITE_MIRROR_MAX_AGE'])
+    return db.session.query(exists().where(
+        ExternalEvent.region == location,
+        ExternalEvent.synced_at >= synced_since
+    )).scalar()
+
+
+def _local_mixed_query(category, search):
+    query = Event.query.filter(Event.date >= datetime.utcnow())
     if search:
-        local_query = local_query.filter(
-            LocalEvent.name.ilike(f'%{search}%') |
-            LocalEvent.description.ilike(f'%{search}%')
-        )
-    
+        query = apply_search(query, search, ranked=False)
     if category:
-        local_query = local_query.filter_by(category=category)
+        query = query.filter(Event.category == category)
+    return query
+
+
+def _mixed_events_live(location, category, search, page, per_page):
+    """Merges local events with events fetched live from Eventbrite, latest date first.
+
+    Page `page` is drawn from the first page * per_page events of each source,
+    so both are asked for exactly that many; the Eventbrite pages are fetched
+    in parallel with the local query, up to EVENTBRITE_SYNC_MAX_PAGES of them.
+    """
+    page, per_page = max(page, 1), min(max(per_page, 1), 100)
+    window = page * per_page
+    remote_page_size = min(window, 50)  # Eventbrite max is 50
+    remote_pages = min(math.ceil(window / remote_page_size), current_app.config['EVENTBRITE_SYNC_MAX_PAGES'])
+    
+    # Start the Eventbrite fetches first so they overlap with the local query
+    futures = [
+        eventbrite_service.search_events_async(
+            location=location,
+            category=category,
+            page=remote_page,
+            per_page=remote_page_size,
+            start_date=datetime.utcnow().strftime('%Y-%m-%d'),
+            sort_by='-date'
+        )
+        for remote_page in range(1, remote_pages + 1)
+    ]
     
-    local_events = local_query.order_by(LocalEvent.date.desc()).limit(per_page // 2).all()
-    local_events_data = [
+    local = _local_mixed_query(category, search)
+    local_total = local.order_by(None).count()
+    local_events = [
         {**event.to_dict(), 'source': 'local'}
-        for event in local_events
+        for event in local.order_by(Event.date.desc(), Event.id.desc()).limit(window)
     ]
     
-    # Fetch Eventbrite events
-    eventbrite_result = eventbrite_service.search_events(
-        location=location,
-        category=category,
-        page=1,
-        per_page=per_page // 2
+    results = [future.result() for future in futures]
+    now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+    remote_events = [event for result in results for event in result['events'] if (event.get('date') or '') >= now]
+    remote_total = results[0]['pagination'].get('object_count', len(remote_events))
+    
+    merged = sorted(local_events + remote_events, key=lambda event: (event.get('date') or '', event.get('source') == 'local'), reverse=True)
+    events = merged[window - per_page:window]
+    total = local_total + remote_total
+    
+    return jsonify({
+        'events': events,
+        'total_pages': math.ceil(total / per_page),
+        'current_page': page,
+        'total_events': total,
+        'local_count': sum(1 for event in events if event.get('source') == 'local'),
+        'eventbrite_count': sum(1 for event in events if event.get('source') != 'local')
+    })
+
+
+def _mixed_events_from_mirror(location, category, search, page, per_page, cursor):
+    """Merges upcoming local and mirrored events in the database, latest date first.
+
+    Both sides are date-ordered index scans under a UNION ALL, so the
+    database merges them (Merge Append on Postgres) and stops after one page;
+    neither source is read past the rows that page needs.
+    """
+    local = _local_mixed_query(category, search).with_entities(
+        Event.date.label('sort_date'),
+        literal('local').label('source'),
+        Event.id.label('row_id')
+    )
+    
+    remote = _mirror_query(location, category).with_entities(
+        ExternalEvent.date.label('sort_date'),
+        literal('eventbrite').label('source'),
+        ExternalEvent.id.label('row_id')
     )
-    eventbrite_events = eventbrite_result['events']
     
-    # Merge and sort by date
-    all_events = local_events_data + eventbrite_events
-    all_events.sort(key=lambda x: x.get('date', ''), reverse=True)
+    merged = union_all(local.statement, remote.statement).subquery('merged')
+    order = [merged.c.sort_date, merged.c.source, merged.c.row_id]
+    query = db.session.query(*order)
     
-    # Paginate
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    paginated_events = all_events[start_idx:end_idx]
+    if cursor is not None:
+        try:
+            rows, next_cursor = keyset_page(query, order, cursor, min(max(per_page, 1), 100), descending=True)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        meta = {'next_cursor': next_cursor, 'has_next': next_cursor is not None}
+    else:
+        pagination = query.order_by(*[column.desc() for column in order]).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        rows = pagination.items
+        meta = {
+            'total_pages': pagination.pages,
+            'current_page': page,
+            'total_events': pagination.total
+        }
+    
+    local_ids = [row.row_id for row in rows if row.source == 'local']
+    remote_ids = [row.row_id for row in rows if row.source == 'eventbrite']
+    local_events = {event.id: event for event in Event.query.filter(Event.id.in_(local_ids))} if local_ids else {}
+    remote_events = {event.id: event for event in ExternalEvent.query.filter(ExternalEvent.id.in_(remote_ids))} if remote_ids else {}
     
-    total_pages = (len(all_events) + per_page - 1) // per_page
+    events = [
+        {**local_events[row.row_id].to_dict(), 'source': 'local'} if row.source == 'local'
+        else remote_events[row.row_id].to_dict()
+        for row in rows
+    ]
     
     return jsonify({
-        'events': paginated_events,
-        'total_pages': total_pages,
-        'current_page': page,
-        'total_events': len(all_events),
-        'local_count': len(local_events_data),
-        'eventbrite_count': len(eventbrite_events)
+        'events': events,
+        **meta,
+        'local_count': len(local_ids),
+        'eventbrite_count': len(remote_ids)
     })
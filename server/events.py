@@ -1,8 +1,14 @@
+import math
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, current_user
 from datetime import datetime
 from server.models import db, Event, Ticket, User
-from sqlalchemy import or_
+from server.services.search_service import apply_search
+from server.pagination import keyset_page
+from server import geo
+from server.cache import cached_response
+from server.etags import conditional_json, event_etag, events_etag
+from server.services.import_service import import_events
 from server.services.event_service import create_event as create_event_service, update_event as update_event_service, delete_event as delete_event_service
 
 events_bp = Blueprint('events', __name__)
@@ -15,6 +21,7 @@ def is_valid_date(date_str): #helper function to check if the date is after now
         return False
 
 @events_bp.route('/', methods=['GET'])
+@cached_response('events')
 def get_events():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
@@ -23,17 +30,12 @@ def get_events():
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     category = request.args.get('category')
+    cursor = request.args.get('cursor')  # Present (even empty) selects cursor pagination
     
     query = Event.query
     
     if search:
-        query = query.filter(
-            or_(
-                Event.name.ilike(f'%{search}%'),
-                Event.description.ilike(f'%{search}%'),
-                Event.location.ilike(f'%{search}%')
-            )
-        )
+        query = apply_search(query, search, ranked=cursor is None)
     
     if status:
         query = query.filter(Event.status == status)
@@ -46,22 +48,72 @@ def get_events():
 
     if category:
         query = query.filter(Event.category == category)
+
+    if cursor is not None:
+        try:
+            events, next_cursor = keyset_page(query, [Event.date, Event.id], cursor, min(max(per_page, 1), 100))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+        return conditional_json(events_etag(events, next_cursor=next_cursor), lambda: {
+            'events': [event.to_dict() for event in events],
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        })
     
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     events = pagination.items
     
-    return jsonify({
+    etag = events_etag(events, total_pages=pagination.pages, current_page=pagination.page)
+    return conditional_json(etag, lambda: {
         'events': [event.to_dict() for event in events],
         'total_pages': pagination.pages,
         'current_page': pagination.page,
         'has_next': pagination.has_next,
         'has_prev': pagination.has_prev
-    }), 200
+    })
 
 @events_bp.route('/<int:event_id>', methods=['GET'])
+@cached_response(lambda event_id: f'event:{event_id}')
 def get_event(event_id):
     event = Event.query.get_or_404(event_id)
-    return jsonify(event.to_dict()), 200
+    return conditional_json(event_etag(event), event.to_dict)
+
+@events_bp.route('/near-me', methods=['GET'])
+@cached_response('events')
+def get_nearby_events():
+    """
+    Upcoming local events within a radius, nearest first
+    Query params: lat, lng (required), radius in km (default: 25),
+    category, limit (default: 20)
+    """
+    try:
+        lat = float(request.args.get('lat'))
+        lng = float(request.args.get('lng'))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Valid lat and lng parameters required'}), 400
+    if not (math.isfinite(lat) and math.isfinite(lng) and -90 <= lat <= 90 and -180 <= lng <= 180):
+        return jsonify({'error': 'Valid lat and lng parameters required'}), 400
+
+    radius = request.args.get('radius', 25, type=float)
+    if not math.isfinite(radius):
+        return jsonify({'error': 'radius must be a finite number of km'}), 400
+    radius = min(max(radius, 0), 20000)
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    category = request.args.get('category')
+
+    query = Event.query.filter(Event.status == 'upcoming', Event.date >= datetime.utcnow())
+    if category:
+        query = query.filter(Event.category == category)
+
+    matches = geo.nearby(query, Event.id, Event.geohash, Event.location_lat, Event.location_lng, lat, lng, radius, limit)
+
+    return jsonify({
+        'events': [dict(event.to_dict(), distance_km=round(distance, 2)) for event, distance in matches],
+        'location': {'lat': lat, 'lng': lng},
+        'radius_km': radius,
+        'source': 'local'
+    })
 
 
 ########################################
@@ -72,7 +124,7 @@ def get_event(event_id):
 @events_bp.route('/', methods=['POST'])
 @jwt_required()
 def create_event():
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
     data = request.get_json()
 
     # Validate required fields
@@ -89,15 +141,30 @@ def create_event():
     return jsonify(event.to_dict()), 201
 
 
-# Update event 
+# Bulk import events from CSV or NDJSON
+@events_bp.route('/import', methods=['POST'])
+@jwt_required()
+def import_events_route():
+    fmt = request.args.get('format')
+    if fmt is None:
+        fmt = 'csv' if request.mimetype == 'text/csv' else 'ndjson' if request.mimetype in ('application/x-ndjson', 'application/jsonl') else None
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({'error': 'Send text/csv or application/x-ndjson (or ?format=csv|ndjson)'}), 415
+
+    report = import_events(request.stream, fmt, current_user.id)
+
+    return jsonify(report), 201 if report['imported'] else 400
+
+
+
 @events_bp.route('/<int:event_id>', methods=['PUT'])
 @jwt_required()
 def update_event(event_id):
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
     event = Event.query.get_or_404(event_id)
 
     # Check if user owns the event
-    if event.user_id != current_user_.id:
+    if event.user_id != current_user_id:
         return jsonify({'error': 'Unauthorized'}), 403
 
     data = request.get_json()
@@ -113,7 +180,7 @@ def update_event(event_id):
 @events_bp.route('/<int:event_id>', methods=['DELETE'])
 @jwt_required()
 def delete_event(event_id):
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
     event = Event.query.get_or_404(event_id)
 
     # Check if user owns the event
@@ -130,7 +197,7 @@ def delete_event(event_id):
 @events_bp.route('/my-events', methods=['GET'])
 @jwt_required()
 def get_my_events():
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
     events = Event.query.filter_by(user_id=current_user_id).all()
     return jsonify([event.to_dict() for event in events]), 200 
 
@@ -0,0 +1,126 @@
+"""
+Geohash helpers for radius searches
+Events store the geohash of their coordinates in an indexed column. A radius
+query becomes a handful of index range scans over the cells covering the
+search circle, followed by an exact haversine check on the candidates.
+"""
+
+import heapq
+import math
+from sqlalchemy import and_, or_
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9  # ~5m cells; queries use a prefix of this
+KM_PER_LAT_DEGREE = 110.574
+MAX_COVERING_CELLS = 16
+
+
+def encode(lat, lng, precision=GEOHASH_PRECISION):
+    """Geohash of a coordinate, `precision` characters long."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # Geohash interleaves bits starting with longitude
+
+    while len(chars) < precision:
+        value, bounds = (lng, lng_range) if even else (lat, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def cell_size_degrees(precision):
+    """(lat_degrees, lng_degrees) covered by one cell."""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = math.floor(precision * 5 / 2)
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two coordinates in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def covering_cells(lat, lng, radius_km, max_cells=MAX_COVERING_CELLS):
+    """Geohash prefixes whose cells together contain the whole search circle.
+
+    Uses the finest precision at which the circle's bounding box is covered by
+    at most `max_cells` cells. Returns [''] (match everything) when the
+    radius is too large for any prefix to help.
+    """
+    lat_delta = radius_km / KM_PER_LAT_DEGREE
+    min_lat, max_lat = max(lat - lat_delta, -90.0), min(lat + lat_delta, 90.0)
+    # Longitude degrees shrink towards the poles; size the box for the widest point
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 89.0:
+        return ['']
+    lng_delta = radius_km / (KM_PER_LAT_DEGREE * math.cos(math.radians(widest)))
+    if lng_delta >= 180.0:
+        return ['']
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lng_deg = cell_size_degrees(precision)
+        lat_rows = range(int((min_lat + 90.0) // lat_deg), int((max_lat + 90.0) // lat_deg) + 1)
+        lng_cols = range(int((lng - lng_delta + 180.0) // lng_deg), int((lng + lng_delta + 180.0) // lng_deg) + 1)
+        if len(lat_rows) * len(lng_cols) > max_cells:
+            continue
+
+        cells = set()
+        for row in lat_rows:
+            cell_lat = min(-90.0 + (row + 0.5) * lat_deg, 90.0)
+            for col in lng_cols:
+                cell_lng = (-180.0 + (col + 0.5) * lng_deg + 180.0) % 360.0 - 180.0
+                cells.add(encode(cell_lat, cell_lng, precision))
+        return sorted(cells)
+
+    return ['']
+
+
+def nearby(query, id_column, geohash_column, lat_column, lng_column, lat, lng, radius_km, limit=20):
+    """Runs `query` restricted to rows within `radius_km` of (lat, lng).
+
+    The covering cells become prefix range scans on the indexed
+    `geohash_column`; candidates are checked exactly using only their id and
+    coordinates, and just the nearest `limit` rows are loaded in full.
+    Returns (row, distance_km) pairs, nearest first.
+    """
+    cells = covering_cells(lat, lng, radius_km)
+    if cells == ['']:
+        filtered = query.filter(geohash_column.isnot(None))
+    else:
+        # '{' sorts right after 'z', so [cell, cell + '{') is every hash starting with cell
+        filtered = query.filter(or_(*[
+            and_(geohash_column >= cell, geohash_column < cell + '{') for cell in cells
+        ]))
+
+    distances = {}
+    for row_id, row_lat, row_lng in filtered.with_entities(id_column, lat_column, lng_column):
+        distance = haversine_km(lat, lng, row_lat, row_lng)
+        if distance <= radius_km:
+            distances[row_id] = distance
+
+    nearest = heapq.nsmallest(limit, distances, key=distances.get)
+    if not nearest:
+        return []
+
+    rows = {getattr(row, id_column.key): row for row in query.filter(id_column.in_(nearest))}
+    return [(rows[row_id], distances[row_id]) for row_id in nearest]
@@ -0,0 +1,128 @@
+"""
+Idempotency keys for ticket writes
+A client that sends `Idempotency-Key: <key>` with a purchase or listing
+change can retry it safely: the first request runs, and its response is kept
+for IDEMPOTENCY_TTL seconds and replayed to any repeat with the same key,
+user, endpoint and body, without running the view again. A repeat that
+arrives while the first is still running gets 409; reusing a key for a
+different request gets 422. Keys live in an in-process LRU per worker, or in
+a Redis-compatible store shared by all workers.
+"""
+
+import hashlib
+from functools import wraps
+from flask import current_app, jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity
+from server.cache import LRUCache, RedisCache
+
+KEY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+PENDING_TTL = 60  # Seconds a key stays locked if its first request never finishes
+
+# Answers that depend on the moment (queueing, throttling, contention) are not replayed
+TRANSIENT_STATUSES = {409, 423, 429}
+
+
+class IdempotencyStore:
+    """Pending markers and finished responses over an LRUCache or RedisCache backend."""
+
+    def __init__(self, backend, ttl=86400):
+        self.backend = backend
+        self.ttl = ttl
+
+    def begin(self, key, fingerprint):
+        """Claims `key` for a new request.
+
+        Returns None if claimed, else the stored entry: {'fingerprint', and
+        'response' once the first request has finished}.
+        """
+        if self.backend.add(key, {'fingerprint': fingerprint}, ttl=PENDING_TTL):
+            return None
+        entry = self.backend.get(key)
+        if entry is None:  # Expired in between; try once more
+            return None if self.backend.add(key, {'fingerprint': fingerprint}, ttl=PENDING_TTL) else self.backend.get(key)
+        return entry
+
+    def finish(self, key, fingerprint, response):
+        if response.status_code >= 500 or response.status_code in TRANSIENT_STATUSES:
+            self.backend.delete(key)  # Let the client retry for real
+            return
+        self.backend.set(key, {
+            'fingerprint': fingerprint,
+            'response': {
+                'status': response.status_code,
+                'body': response.get_data(as_text=True),
+                'mimetype': response.mimetype
+            }
+        }, ttl=self.ttl)
+
+    def abandon(self, key):
+        self.backend.delete(key)
+
+
+def init_idempotency(app):
+    """Creates the key store selected by IDEMPOTENCY_BACKEND ('memory' or 'redis')."""
+    if app.config.get('IDEMPOTENCY_BACKEND', 'memory') == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("IDEMPOTENCY_BACKEND='redis' requires the redis package")
+        backend = RedisCache(redis.Redis.from_url(app.config['IDEMPOTENCY_REDIS_URL']))
+    else:
+        backend = LRUCache(max_entries=app.config.get('IDEMPOTENCY_MAX_KEYS', 10000))
+
+    store = IdempotencyStore(backend, ttl=app.config.get('IDEMPOTENCY_TTL', 86400))
+    app.extensions['idempotency'] = store
+    return store
+
+
+def _fingerprint():
+    digest = hashlib.sha256()
+    for part in (request.method, request.full_path):
+        digest.update(part.encode())
+        digest.update(b'\0')
+    digest.update(request.get_data())  # Cached, so the view can still read the body
+    return digest.hexdigest()
+
+
+def idempotent(view):
+    """Replays the stored response for a repeated Idempotency-Key.
+
+    Keys are scoped to the JWT identity, so goes inside jwt_required.
+    Requests without the header run as usual.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        store = current_app.extensions.get('idempotency')
+        client_key = request.headers.get(KEY_HEADER)
+        if store is None or client_key is None:
+            return view(*args, **kwargs)
+
+        if not client_key or len(client_key) > MAX_KEY_LENGTH:
+            return jsonify({'error': f'{KEY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters'}), 400
+
+        key = f'idem:{get_jwt_identity()}:{request.endpoint}:{client_key}'
+        fingerprint = _fingerprint()
+        entry = store.begin(key, fingerprint)
+
+        if entry is not None:
+            if entry['fingerprint'] != fingerprint:
+                return jsonify({'error': f'{KEY_HEADER} was already used for a different request'}), 422
+            if 'response' not in entry:
+                response = jsonify({'error': 'A request with this Idempotency-Key is still in progress'})
+                response.headers['Retry-After'] = '1'
+                return response, 409
+
+            stored = entry['response']
+            response = current_app.response_class(stored['body'], status=stored['status'], mimetype=stored['mimetype'])
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except BaseException:
+            store.abandon(key)
+            raise
+        store.finish(key, fingerprint, response)
+        return response
+    return wrapper
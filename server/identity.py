@@ -0,0 +1,60 @@
+"""
+JWT identity -> User resolution
+Registered as the JWTManager's user loader, so protected routes can use
+flask_jwt_extended.current_user. Users are cached per process for a short
+TTL as plain column values and re-attached to each request's session
+without a SELECT; profile changes call invalidate_user().
+"""
+
+from flask import current_app, jsonify
+from sqlalchemy.orm import make_transient_to_detached
+from server.cache import LRUCache
+from server.models import db, User
+
+
+def _snapshot(user):
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+def _attach(values):
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+def init_identity(app, jwt):
+    """Registers the cached user loader with `jwt` (a JWTManager)."""
+    cache = LRUCache(
+        max_entries=app.config.get('USER_CACHE_MAX_ENTRIES', 1024),
+        default_ttl=app.config.get('USER_CACHE_TTL', 60)
+    )
+    app.extensions['user_cache'] = cache
+
+    @jwt.user_lookup_loader
+    def load_user(jwt_header, jwt_data):
+        try:
+            user_id = int(jwt_data[app.config.get('JWT_IDENTITY_CLAIM', 'sub')])
+        except (TypeError, ValueError):
+            return None
+
+        values = cache.get(user_id)
+        if values is not None:
+            return _attach(values)
+
+        user = db.session.get(User, user_id)
+        if user is not None:
+            cache.set(user_id, _snapshot(user))
+        return user
+
+    @jwt.user_lookup_error_loader
+    def user_not_found(jwt_header, jwt_data):
+        return jsonify({'error': 'User not found'}), 404
+
+    return cache
+
+
+def invalidate_user(user_id):
+    """Drops a cached user after their row changes (call after commit)."""
+    cache = current_app.extensions.get('user_cache')
+    if cache is not None:
+        cache.delete(int(user_id))
@@ -0,0 +1,165 @@
+"""
+Request and SQL instrumentation
+Opt-in (METRICS_ENABLED) per-endpoint request latency, SQL statement counts,
+DB time and the slowest statements seen. Exposed at /metrics in Prometheus
+text format and per response as a Server-Timing header.
+Metrics are kept per process; scrape every worker.
+"""
+
+import bisect
+import heapq
+import threading
+import time
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from server.models import db
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+class Metrics:
+    """Thread-safe in-process store for request and statement metrics."""
+
+    def __init__(self, slow_statement_limit=10):
+        self.slow_statement_limit = slow_statement_limit
+        self._lock = threading.Lock()
+        self._requests = {}  # (endpoint, method, status) -> count
+        self._latency = {}  # (endpoint, method) -> histogram
+        self._statements = {}  # endpoint -> [statement count, db seconds]
+        self._slowest = []  # min-heap of (seconds, statement)
+
+    def observe_request(self, endpoint, method, status, seconds, statements, db_seconds):
+        with self._lock:
+            key = (endpoint, method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+            latency = self._latency.setdefault((endpoint, method), {
+                'buckets': [0] * len(LATENCY_BUCKETS), 'sum': 0.0, 'count': 0
+            })
+            bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+            if bucket < len(LATENCY_BUCKETS):
+                latency['buckets'][bucket] += 1
+            latency['sum'] += seconds
+            latency['count'] += 1
+
+            totals = self._statements.setdefault(endpoint, [0, 0.0])
+            totals[0] += statements
+            totals[1] += db_seconds
+
+    def observe_statement(self, statement, seconds):
+        entry = (seconds, ' '.join(statement.split())[:200])
+        with self._lock:
+            if len(self._slowest) < self.slow_statement_limit:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def render(self):
+        """Renders all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                '# HELP ticketi_http_requests_total HTTP requests handled.',
+                '# TYPE ticketi_http_requests_total counter'
+            ]
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                lines.append(f'ticketi_http_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+            lines += [
+                '# HELP ticketi_http_request_duration_seconds Request latency.',
+                '# TYPE ticketi_http_request_duration_seconds histogram'
+            ]
+            for (endpoint, method), latency in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, latency['buckets']):
+                    cumulative += count
+                    lines.append(f'ticketi_http_request_duration_seconds_bucket{_labels(endpoint=endpoint, method=method, le=bound)} {cumulative}')
+                lines.append(f'ticketi_http_request_duration_seconds_bucket{_labels(endpoint=endpoint, method=method, le="+Inf")} {latency["count"]}')
+                lines.append(f'ticketi_http_request_duration_seconds_sum{_labels(endpoint=endpoint, method=method)} {latency["sum"]:.6f}')
+                lines.append(f'ticketi_http_request_duration_seconds_count{_labels(endpoint=endpoint, method=method)} {latency["count"]}')
+
+            lines += [
+                '# HELP ticketi_db_statements_total SQL statements executed while handling requests.',
+                '# TYPE ticketi_db_statements_total counter'
+            ]
+            for endpoint, (count, _) in sorted(self._statements.items()):
+                lines.append(f'ticketi_db_statements_total{_labels(endpoint=endpoint)} {count}')
+
+            lines += [
+                '# HELP ticketi_db_time_seconds_total Time spent executing SQL while handling requests.',
+                '# TYPE ticketi_db_time_seconds_total counter'
+            ]
+            for endpoint, (_, seconds) in sorted(self._statements.items()):
+                lines.append(f'ticketi_db_time_seconds_total{_labels(endpoint=endpoint)} {seconds:.6f}')
+
+            lines += [
+                '# HELP ticketi_db_slowest_statement_seconds Slowest SQL statements seen by this process.',
+                '# TYPE ticketi_db_slowest_statement_seconds gauge'
+            ]
+            for seconds, statement in sorted(self._slowest, reverse=True):
+                lines.append(f'ticketi_db_slowest_statement_seconds{_labels(statement=statement)} {seconds:.6f}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def init_instrumentation(app):
+    """Hooks request timing and SQL counting into the app and adds /metrics."""
+    metrics = Metrics(app.config.get('METRICS_SLOW_STATEMENTS', 10))
+    app.extensions['metrics'] = metrics
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - context._query_start
+        metrics.observe_statement(statement, seconds)
+        if has_request_context() and 'request_start' in g:
+            g.sql_statements += 1
+            g.sql_seconds += seconds
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(db.engine, 'after_cursor_execute', after_cursor_execute)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+        g.sql_statements = 0
+        g.sql_seconds = 0.0
+
+    @app.after_request
+    def record_request(response):
+        if 'request_start' not in g:
+            return response
+
+        seconds = time.perf_counter() - g.request_start
+        metrics.observe_request(
+            request.endpoint or 'unmatched',
+            request.method,
+            response.status_code,
+            seconds,
+            g.sql_statements,
+            g.sql_seconds
+        )
+        response.headers['Server-Timing'] = (
+            f'app;dur={seconds * 1000:.1f}, '
+            f'db;dur={g.sql_seconds * 1000:.1f};desc="{g.sql_statements} queries"'
+        )
+        return response
+
+    @app.route('/metrics')
+    def prometheus_metrics():
+        body = metrics.render()
+        limiter = app.extensions.get('rate_limiter')
+        if limiter is not None:
+            body += limiter.render()
+        return Response(body, mimetype='text/plain; version=0.0.4')
+
+    return metrics
@@ -0,0 +1,31 @@
+"""Add inventory_mode to Event model
+
+Revision ID: 3c7d2a9e41f0
+Revises: 01e762918f6f
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c7d2a9e41f0'
+down_revision = '01e762918f6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing events already have one ticket row per seat, so they start out
+    # materialized. Convert them with `flask inventory virtualize`.
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('inventory_mode', sa.String(), nullable=True, server_default='materialized'))
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.alter_column('inventory_mode', server_default=None)
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('inventory_mode')
@@ -0,0 +1,50 @@
+"""Add indexes for hot API queries
+
+Revision ID: 5b9e0f6c2d18
+Revises: 3c7d2a9e41f0
+Create Date: 2026-10-18 10:04:51.662310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e0f6c2d18'
+down_revision = '3c7d2a9e41f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_username', ['username'], unique=False)
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_status_date', ['status', 'date'], unique=False)
+        batch_op.create_index('ix_events_category', ['category'], unique=False)
+        batch_op.create_index('ix_events_user_id', ['user_id'], unique=False)
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_event_id_status', ['event_id', 'status'], unique=False)
+        batch_op.create_index('ix_tickets_user_id', ['user_id'], unique=False)
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_transactions_ticket_id', ['ticket_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_ticket_id')
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.drop_index('ix_tickets_user_id')
+        batch_op.drop_index('ix_tickets_event_id_status')
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_user_id')
+        batch_op.drop_index('ix_events_category')
+        batch_op.drop_index('ix_events_status_date')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_username')
@@ -0,0 +1,49 @@
+"""Add full-text search index for events
+
+Revision ID: 7f41d3b8a6c5
+Revises: 5b9e0f6c2d18
+Create Date: 2026-10-18 11:22:07.903415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f41d3b8a6c5'
+down_revision = '5b9e0f6c2d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("""
+            ALTER TABLE events ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(location, '')), 'B') ||
+                setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+            ) STORED
+        """)
+        op.execute('CREATE INDEX ix_events_search_vector ON events USING GIN (search_vector)')
+
+    elif dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE events_fts USING fts5(name, description, location, tokenize='unicode61')")
+        op.execute(
+            'INSERT INTO events_fts (rowid, name, description, location) '
+            'SELECT id, name, description, location FROM events'
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_events_search_vector')
+        op.execute('ALTER TABLE events DROP COLUMN IF EXISTS search_vector')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS events_fts')
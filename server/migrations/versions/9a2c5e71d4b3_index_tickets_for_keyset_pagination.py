@@ -0,0 +1,28 @@
+"""Index tickets by owner and purchase date for keyset pagination
+
+Revision ID: 9a2c5e71d4b3
+Revises: 7f41d3b8a6c5
+Create Date: 2026-10-18 12:40:15.284117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a2c5e71d4b3'
+down_revision = '7f41d3b8a6c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_user_id_purchase_date', ['user_id', 'purchase_date', 'id'], unique=False)
+        batch_op.drop_index('ix_tickets_user_id')
+
+
+def downgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_user_id', ['user_id'], unique=False)
+        batch_op.drop_index('ix_tickets_user_id_purchase_date')
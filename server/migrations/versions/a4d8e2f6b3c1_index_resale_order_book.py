@@ -0,0 +1,28 @@
+"""Index tickets by resale price for the resale order book
+
+Revision ID: a4d8e2f6b3c1
+Revises: f2b7c9e4a1d6
+Create Date: 2026-10-18 20:11:37.592604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d8e2f6b3c1'
+down_revision = 'f2b7c9e4a1d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_event_id_status_resale_price', ['event_id', 'status', 'resale_price', 'id'], unique=False)
+        batch_op.drop_index('ix_tickets_event_id_status')
+
+
+def downgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_event_id_status', ['event_id', 'status'], unique=False)
+        batch_op.drop_index('ix_tickets_event_id_status_resale_price')
@@ -0,0 +1,53 @@
+"""Add external_events mirror table
+
+Revision ID: c1d7a3e5f902
+Revises: b8e4f1a09c27
+Create Date: 2026-10-18 15:31:12.057384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c1d7a3e5f902'
+down_revision = 'b8e4f1a09c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('external_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('external_id', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('region', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('location_lat', sa.Float(), nullable=True),
+        sa.Column('location_lng', sa.Float(), nullable=True),
+        sa.Column('price', sa.Float(), nullable=True),
+        sa.Column('capacity', sa.Integer(), nullable=True),
+        sa.Column('tickets_sold', sa.Integer(), nullable=True),
+        sa.Column('image', sa.String(), nullable=True),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('external_url', sa.String(), nullable=True),
+        sa.Column('is_free', sa.Boolean(), nullable=True),
+        sa.Column('synced_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('external_id')
+    )
+    with op.batch_alter_table('external_events', schema=None) as batch_op:
+        batch_op.create_index('ix_external_events_region_date', ['region', 'date'], unique=False)
+        batch_op.create_index('ix_external_events_category_date', ['category', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('external_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_external_events_category_date')
+        batch_op.drop_index('ix_external_events_region_date')
+
+    op.drop_table('external_events')
@@ -0,0 +1,34 @@
+"""Index events and mirrored events for the date-ordered mixed feed
+
+Revision ID: d3f9b2c6e814
+Revises: c1d7a3e5f902
+Create Date: 2026-10-18 16:48:26.731052
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3f9b2c6e814'
+down_revision = 'c1d7a3e5f902'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_date_id', ['date', 'id'], unique=False)
+
+    with op.batch_alter_table('external_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_external_events_region_date')
+        batch_op.create_index('ix_external_events_region_date', ['region', 'date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('external_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_external_events_region_date')
+        batch_op.create_index('ix_external_events_region_date', ['region', 'date'], unique=False)
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_date_id')
@@ -0,0 +1,30 @@
+"""Add a geohash column to events for radius searches
+
+Revision ID: e5a1c8d4f273
+Revises: d3f9b2c6e814
+Create Date: 2026-10-18 17:22:09.418375
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a1c8d4f273'
+down_revision = 'd3f9b2c6e814'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('geohash', sa.String(length=12), nullable=True))
+        batch_op.create_index('ix_events_geohash', ['geohash'], unique=False)
+
+    # Existing rows are filled in by `flask geo backfill`
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_geohash')
+        batch_op.drop_column('geohash')
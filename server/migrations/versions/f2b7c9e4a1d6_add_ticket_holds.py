@@ -0,0 +1,48 @@
+"""Add ticket holds and the events.tickets_held counter
+
+Revision ID: f2b7c9e4a1d6
+Revises: e5a1c8d4f273
+Create Date: 2026-10-18 19:04:51.236810
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7c9e4a1d6'
+down_revision = 'e5a1c8d4f273'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('tickets_held', sa.Integer(), server_default='0', nullable=False))
+
+    op.create_table('ticket_holds',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ticket_holds', schema=None) as batch_op:
+        batch_op.create_index('ix_ticket_holds_status_expires_at', ['status', 'expires_at'], unique=False)
+        batch_op.create_index('ix_ticket_holds_event_id_status', ['event_id', 'status'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ticket_holds', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_holds_event_id_status')
+        batch_op.drop_index('ix_ticket_holds_status_expires_at')
+
+    op.drop_table('ticket_holds')
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('tickets_held')
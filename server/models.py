@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import literal_column
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -6,6 +7,9 @@ db = SQLAlchemy()
 
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_username', 'username'),
+    )
 
     id = db.Column(db.Integer, primary_key = True)
     username = db.Column(db.String(20), nullable = False)
@@ -42,26 +46,42 @@ class User(db.Model):
 
 class Event(db.Model):
     __tablename__ = 'events'
+    __table_args__ = (
+        db.Index('ix_events_status_date', 'status', 'date'),  # Default listing: upcoming events by date
+        db.Index('ix_events_date_id', 'date', 'id'),  # Unfiltered date-ordered scans (mixed feed)
+        db.Index('ix_events_category', 'category'),
+        db.Index('ix_events_user_id', 'user_id'),
+        db.Index('ix_events_geohash', 'geohash'),  # Prefix range scans for radius search
+    )
 
     id = db.Column(db.Integer, primary_key = True)
     name = db.Column(db.String(100), nullable = False)
     location = db.Column(db.String, nullable = False)
     location_lat = db.Column(db.Float)
     location_lng = db.Column(db.Float)
+    geohash = db.Column(db.String(12))  # Derived from location_lat/lng by the event service
     description = db.Column(db.String, nullable = False)
     date = db.Column(db.DateTime, nullable = False)  # Changed to DateTime
     price = db.Column(db.Float, nullable = False)
     image = db.Column(db.String)
     capacity = db.Column(db.Integer, nullable = False)  # Total available tickets
     tickets_sold = db.Column(db.Integer, default=0)  # Counter for sold tickets
+    tickets_held = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Seats in active holds (carts)
+    inventory_mode = db.Column(db.String, default='virtual')  # 'virtual' (counter only) or 'materialized' (one row per seat)
     status = db.Column(db.String, default='upcoming')  # 'upcoming', 'ongoing', 'completed'
     category = db.Column(db.String)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = db.Column(db.Integer, nullable=False, default=1, onupdate=literal_column('version + 1'))  # Bumped by every UPDATE, ORM or Core; feeds ETags
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
 
     # Relationships
     tickets = db.relationship('Ticket', backref='event', lazy=True)
 
+    @property
+    def available_tickets(self):
+        return self.capacity - (self.tickets_sold or 0) - (self.tickets_held or 0)
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -75,6 +95,7 @@ class Event(db.Model):
             'image': self.image,
             'capacity': self.capacity,
             'tickets_sold': self.tickets_sold,
+            'tickets_held': self.tickets_held,
             'status': self.status,
             'category': self.category,
             'created_at': self.created_at.isoformat() if self.created_at else None,
@@ -83,6 +104,10 @@ class Event(db.Model):
 
 class Ticket(db.Model):
     __tablename__ = 'tickets'
+    __table_args__ = (
+        db.Index('ix_tickets_event_id_status_resale_price', 'event_id', 'status', 'resale_price', 'id'),  # Availability lookups; covers the resale order book
+        db.Index('ix_tickets_user_id_purchase_date', 'user_id', 'purchase_date', 'id'),  # My tickets, newest first
+    )
        
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'))
@@ -101,6 +126,9 @@ class Ticket(db.Model):
 
 class Transaction(db.Model):
     __tablename__ = 'transactions'
+    __table_args__ = (
+        db.Index('ix_transactions_ticket_id', 'ticket_id'),
+    )
        
     id = db.Column(db.Integer, primary_key=True)
     ticket_id = db.Column(db.Integer, db.ForeignKey('tickets.id'))
@@ -117,4 +145,77 @@ class Transaction(db.Model):
     # Example: transaction1.seller or transaction1.buyer
 
 
+class TicketHold(db.Model):
+    """Seats set aside for a buyer until expires_at (a checkout cart)."""
+    __tablename__ = 'ticket_holds'
+    __table_args__ = (
+        db.Index('ix_ticket_holds_status_expires_at', 'status', 'expires_at'),  # Expiry sweeps
+        db.Index('ix_ticket_holds_event_id_status', 'event_id', 'status'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String, nullable=False, default='active')  # 'active', 'converted', 'released', 'expired'
+    expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'hold_id': self.id,
+            'event_id': self.event_id,
+            'quantity': self.quantity,
+            'status': self.status,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
+class ExternalEvent(db.Model):
+    """Local mirror of events ingested from third-party sources (Eventbrite)."""
+    __tablename__ = 'external_events'
+    __table_args__ = (
+        db.Index('ix_external_events_region_date', 'region', 'date', 'id'),
+        db.Index('ix_external_events_category_date', 'category', 'date'),
+    )
 
+    id = db.Column(db.Integer, primary_key=True)
+    external_id = db.Column(db.String, unique=True, nullable=False)  # e.g. 'eb_123', as returned to clients
+    source = db.Column(db.String, nullable=False, default='eventbrite')
+    region = db.Column(db.String, nullable=False)  # Location searched when this event was ingested
+    name = db.Column(db.String, nullable=False)
+    description = db.Column(db.String)
+    date = db.Column(db.DateTime, nullable=False)
+    location = db.Column(db.String)
+    location_lat = db.Column(db.Float)
+    location_lng = db.Column(db.Float)
+    price = db.Column(db.Float)
+    capacity = db.Column(db.Integer)
+    tickets_sold = db.Column(db.Integer, default=0)
+    image = db.Column(db.String)
+    category = db.Column(db.String)
+    status = db.Column(db.String, default='upcoming')
+    external_url = db.Column(db.String)
+    is_free = db.Column(db.Boolean, default=False)
+    synced_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.external_id,
+            'name': self.name,
+            'description': self.description,
+            'date': self.date.strftime('%Y-%m-%d %H:%M:%S') if self.date else None,
+            'location': self.location,
+            'location_lat': self.location_lat,
+            'location_lng': self.location_lng,
+            'price': self.price,
+            'capacity': self.capacity,
+            'tickets_sold': self.tickets_sold,
+            'image': self.image,
+            'category': self.category,
+            'status': self.status,
+            'source': self.source,
+            'external_url': self.external_url,
+            'is_free': self.is_free
+        }
@@ -0,0 +1,73 @@
+"""
+Keyset (cursor) pagination helpers
+Pages are fetched with `WHERE (sort keys) > (last seen keys)` instead of
+OFFSET, so every page costs the same and no COUNT(*) is needed.
+"""
+
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import tuple_
+
+
+def encode_cursor(values):
+    """Packs the sort-key values of the last row into an opaque token."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, columns):
+    """Unpacks a token made by encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (TypeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if not isinstance(payload, list) or len(payload) != len(columns):
+        raise ValueError('Invalid cursor')
+
+    # Each value must match its column's type, or the database would reject the comparison
+    values = []
+    for column, value in zip(columns, payload):
+        try:
+            expected = column.type.python_type
+        except NotImplementedError as e:
+            raise ValueError('Invalid cursor') from e
+
+        if isinstance(value, bool) and expected is not bool:
+            raise ValueError('Invalid cursor')
+        if expected is datetime:
+            if not isinstance(value, str):
+                raise ValueError('Invalid cursor')
+            value = datetime.fromisoformat(value)
+        elif expected in (float, Decimal):
+            if not isinstance(value, (int, float)):
+                raise ValueError('Invalid cursor')
+            value = expected(value)
+        elif not isinstance(value, expected):
+            raise ValueError('Invalid cursor')
+        values.append(value)
+    return values
+
+
+def keyset_page(query, columns, cursor=None, per_page=10, descending=False):
+    """Fetches one page of `query` ordered by `columns`.
+
+    `columns` must be unique together (end with the primary key) and
+    non-null. Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    key = tuple_(*columns)
+    if cursor:
+        last_seen = tuple_(*decode_cursor(cursor, columns))
+        query = query.filter(key < last_seen if descending else key > last_seen)
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    items = query.order_by(None).order_by(*ordering).limit(per_page + 1).all()
+
+    if len(items) <= per_page:
+        return items, None
+
+    items = items[:per_page]
+    return items, encode_cursor([getattr(items[-1], column.key) for column in columns])
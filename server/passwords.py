@@ -0,0 +1,92 @@
+"""
+Password hashing off the request thread
+scrypt/pbkdf2 are deliberately slow, so a burst of logins would otherwise pin
+every web worker on CPU. Hashes run in a small pool ('process', 'thread' or
+'inline') behind a bounded queue; when the queue is full callers get
+PasswordHasherBusy straight away instead of piling up.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords with werkzeug in a bounded worker pool."""
+
+    def __init__(self, method='scrypt', executor='process', max_workers=None, max_pending=32, queue_timeout=0.5):
+        self.method = method
+        self.executor_kind = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(self.max_workers + max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+
+    @cached_property
+    def hash_prefix(self):
+        """Algorithm and cost parameters as they appear in generated hashes."""
+        return generate_password_hash('', method=self.method).split('$', 1)[0]
+
+    def _get_executor(self):
+        # Pools don't survive a fork, so each (gunicorn) worker process builds its own
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                if self.executor_kind == 'process':
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hasher')
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _run(self, fn, *args):
+        if self.executor_kind == 'inline':
+            return fn(*args)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PasswordHasherBusy()
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True if the hash was made with a different method or cost than configured."""
+        return password_hash.split('$', 1)[0] != self.hash_prefix
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+def init_password_hasher(app):
+    """Creates the hasher configured by the PASSWORD_HASH_* settings."""
+    hasher = PasswordHasher(
+        method=app.config.get('PASSWORD_HASH_METHOD', 'scrypt'),
+        executor=app.config.get('PASSWORD_HASH_EXECUTOR', 'process'),
+        max_workers=app.config.get('PASSWORD_HASH_WORKERS'),
+        max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 32),
+        queue_timeout=app.config.get('PASSWORD_HASH_QUEUE_TIMEOUT', 0.5)
+    )
+    app.extensions['password_hasher'] = hasher
+    return hasher
+
+
+def get_password_hasher():
+    return current_app.extensions['password_hasher']
@@ -0,0 +1,133 @@
+"""
+Token-bucket rate limiting
+Each rule ('login_ip', 'login_email', ...) refills at a configured rate up to
+a burst size; a request spends one token or is answered 429. Buckets live in
+the same backends as the response cache: an in-process LRU per worker, or a
+Redis-compatible store shared by all workers.
+"""
+
+import math
+import re
+import threading
+import time
+from functools import wraps
+from flask import current_app, jsonify, request
+from server.cache import LRUCache, RedisCache
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(limit):
+    """Parses '5/minute' into (tokens per second, burst)."""
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(second|minute|hour|day)\s*', limit)
+    if not match:
+        raise ValueError(f'Invalid rate limit: {limit!r}')
+    count, period = int(match.group(1)), PERIODS[match.group(2)]
+    return count / period, count
+
+
+class RateLimiter:
+    """Token buckets over an LRUCache or RedisCache backend.
+
+    The shared backend reads and writes a bucket without a transaction, so
+    workers racing on the same key can let a request or two extra through.
+    """
+
+    def __init__(self, backend, clock=time.time):
+        self.backend = backend
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._counts = {}  # rule -> [allowed, limited]
+
+    def consume(self, rule, key, rate, burst):
+        """Takes a token from `rule`'s bucket for `key`.
+
+        Returns (allowed, retry_after_seconds).
+        """
+        bucket_key = f'ratelimit:{rule}:{key}'
+        with self._lock:
+            now = self.clock()
+            state = self.backend.get(bucket_key)
+            if state is None:
+                tokens = float(burst)
+            else:
+                tokens = min(float(burst), state[0] + (now - state[1]) * rate)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.backend.set(bucket_key, [tokens, now], ttl=math.ceil(burst / rate) + 1)
+
+            counts = self._counts.setdefault(rule, [0, 0])
+            counts[0 if allowed else 1] += 1
+
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def stats(self):
+        with self._lock:
+            return {rule: {'allowed': allowed, 'limited': limited} for rule, (allowed, limited) in self._counts.items()}
+
+    def render(self):
+        """Renders the allowed/limited counters in the Prometheus text format."""
+        lines = [
+            '# HELP ticketi_rate_limit_requests_total Requests checked by each rate limit rule.',
+            '# TYPE ticketi_rate_limit_requests_total counter'
+        ]
+        for rule, counts in sorted(self.stats().items()):
+            for result, count in counts.items():
+                lines.append(f'ticketi_rate_limit_requests_total{{rule="{rule}",result="{result}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def init_rate_limiter(app):
+    """Creates the limiter selected by RATELIMIT_BACKEND ('memory' or 'redis')."""
+    if not app.config.get('RATELIMIT_ENABLED', True):
+        return None
+
+    if app.config.get('RATELIMIT_BACKEND', 'memory') == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RATELIMIT_BACKEND='redis' requires the redis package")
+        backend = RedisCache(redis.Redis.from_url(app.config['RATELIMIT_REDIS_URL']))
+    else:
+        backend = LRUCache(max_entries=app.config.get('RATELIMIT_MAX_KEYS', 10000))
+
+    limiter = RateLimiter(backend)
+    app.extensions['rate_limiter'] = limiter
+    return limiter
+
+
+def client_ip():
+    """The client's address; set TRUSTED_PROXY_COUNT behind a reverse proxy."""
+    return request.remote_addr or 'unknown'
+
+
+def request_email():
+    """Email from the JSON body, so one account can't be guessed at from many IPs."""
+    data = request.get_json(silent=True) or {}
+    email = data.get('email')
+    return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+def rate_limit(rule, key_func):
+    """Limits a view with the RATELIMIT_<RULE> setting (e.g. '5/minute').
+
+    `key_func` picks the bucket (client_ip, request_email, ...); requests it
+    returns None for are not limited by this rule.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            limiter = current_app.extensions.get('rate_limiter')
+            key = key_func() if limiter is not None else None
+            if key is not None:
+                rate, burst = parse_limit(current_app.config[f'RATELIMIT_{rule.upper()}'])
+                allowed, retry_after = limiter.consume(rule, key, rate, burst)
+                if not allowed:
+                    response = jsonify({'error': 'Too many requests, please try again later'})
+                    response.headers['Retry-After'] = str(math.ceil(retry_after))
+                    return response, 429
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,784 @@
+"""
+Database seeding for demos and load tests
+`flask seed` loads the Kenyan events catalog below, optionally repeated
+`--scale` times with jittered dates and venues, plus organizers, buyers and
+sold tickets with their transactions. A fixed `--seed` always produces the
+same data. Rows are written with executemany INSERTs in batches, so
+millions of tickets take minutes, not hours.
+"""
+
+import random
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import delete, func, insert, select, text
+from werkzeug.security import generate_password_hash
+from server import geo
+from server.cache import invalidate
+from server.models import db, User, Event, Ticket, TicketHold, Transaction
+from server.services.search_service import rebuild_index
+
+SEED_PASSWORD = 'password123'
+ORGANIZERS = ['john_organizer', 'jane_organizer', 'mike_organizer']
+BUYERS_PER_SCALE = 50
+
+# Authentic Kenyan Events Database
+KENYAN_EVENTS = [
+    # MUSIC & CONCERTS (20 events)
+    {
+        'name': 'Sauti Sol Live in Nairobi',
+        'description': 'East Africa\'s biggest afro-pop band returns home for an unforgettable night of live music. Experience hits like "Suzanna" and "Melanin" performed with a full live band at the iconic Carnivore grounds.',
+        'category': 'Music',
+        'price': 2500,
+        'capacity': 5000,
+        'location': 'Carnivore Grounds, Nairobi',
+        'lat': -1.3280,
+        'lng': 36.8520,
+        'image': 'https://images.unsplash.com/photo-1540039155733-5bb30b53aa14?w=800',  # Concert crowd
+        'days_from_now': 14
+    },
+    {
+        'name': 'Nairobi Blankets & Wine Festival',
+        'description': 'Kenya\'s premier outdoor music and lifestyle festival featuring top local and regional artists. Enjoy great music, gourmet food, wine tasting, and art installations in beautiful garden settings.',
+        'category': 'Music',
+        'price': 3000,
+        'capacity': 3000,
+        'location': 'Uhuru Gardens, Nairobi',
+        'lat': -1.3018,
+        'lng': 36.7854,
+        'image': 'https://images.unsplash.com/photo-1533174072545-7a4b6ad7a6c3?w=800',  # Outdoor festival
+        'days_from_now': 7
+    },
+    {
+        'name': 'Nyege Nyege Festival Kenya Edition',
+        'description': 'Four days of non-stop music celebrating African electronic music, traditional fusion, and experimental sounds. Camp under the stars and dance with thousands of music lovers from across the continent.',
+        'category': 'Music',
+        'price': 8000,
+        'capacity': 2000,
+        'location': 'Lake Naivasha, Nakuru County',
+        'lat': -0.7667,
+        'lng': 36.4333,
+        'image': 'https://images.unsplash.com/photo-1514525253161-7a46d19cd819?w=800',  # Music festival
+        'days_from_now': 30
+    },
+    {
+        'name': 'Koroga Festival - Afrobeats Night',
+        'description': 'Monthly celebration of Afrobeats, Amapiano, and dancehall music. Featuring DJ Moh Spice, DJ Crème de la Crème, and special guest artists. Food trucks, cocktails, and good vibes guaranteed.',
+        'category': 'Music',
+        'price': 1500,
+        'capacity': 1500,
+        'location': 'Ngong Racecourse, Nairobi',
+        'lat': -1.3167,
+        'lng': 36.7833,
+        'image': 'https://images.unsplash.com/photo-1470229722913-7c0e2dbbafd3?w=800',  # DJ performance
+        'days_from_now': 3
+    },
+    {
+        'name': 'Jazz In The Park - Sunday Sessions',
+        'description': 'Relax to smooth jazz under the African sun. Local and international jazz musicians perform classics and contemporary pieces. BYO picnic baskets welcome. Family-friendly event.',
+        'category': 'Music',
+        'price': 1000,
+        'capacity': 800,
+        'location': 'Nairobi Arboretum',
+        'lat': -1.2756,
+        'lng': 36.8106,
+        'image': 'https://images.unsplash.com/photo-1415201364774-f6f0bb35f28f?w=800',  # Jazz band
+        'days_from_now': 2
+    },
+    
+    # TECH & INNOVATION (15 events)
+    {
+        'name': 'Nairobi Tech Week 2025',
+        'description': 'Kenya\'s largest tech conference bringing together developers, entrepreneurs, investors, and innovators. Keynotes from Silicon Savannah leaders, startup pitches, and networking sessions. Focus on AI, fintech, and agritech solutions for Africa.',
+        'category': 'Tech',
+        'price': 5000,
+        'capacity': 2000,
+        'location': 'KICC, Nairobi',
+        'lat': -1.2921,
+        'lng': 36.8219,
+        'image': 'https://images.unsplash.com/photo-1540575467063-178a50c2df87?w=800',  # Tech conference
+        'days_from_now': 21
+    },
+    {
+        'name': 'iHub Developer Meetup: React & Next.js',
+        'description': 'Monthly meetup for frontend developers. Learn best practices for building modern web apps with React and Next.js. Includes live coding sessions, Q&A, and networking with Nairobi\'s dev community.',
+        'category': 'Tech',
+        'price': 0,
+        'capacity': 150,
+        'location': 'iHub, Ngong Road, Nairobi',
+        'lat': -1.2965,
+        'lng': 36.7878,
+        'image': 'https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=800',  # Developer meeting
+        'days_from_now': 5
+    },
+    {
+        'name': 'Startup Grind Nairobi: Founder Stories',
+        'description': 'Hear from successful Kenyan startup founders who\'ve raised funding and scaled their businesses. Learn from their failures and successes. Includes networking session and pitch practice for early-stage founders.',
+        'category': 'Tech',
+        'price': 1000,
+        'capacity': 200,
+        'location': 'Nai Garage, Nairobi',
+        'lat': -1.2830,
+        'lng': 36.8224,
+        'image': 'https://images.unsplash.com/photo-1556761175-4b46a572b786?w=800',  # Startup presentation
+        'days_from_now': 8
+    },
+    {
+        'name': 'Women in Tech Kenya Summit',
+        'description': 'Annual summit celebrating and empowering women in Kenya\'s tech ecosystem. Workshops on career development, mentorship sessions, and panel discussions on closing the gender gap in technology.',
+        'category': 'Tech',
+        'price': 2000,
+        'capacity': 500,
+        'location': 'Radisson Blu Hotel, Upper Hill',
+        'lat': -1.2935,
+        'lng': 36.817,
+        'image': 'https://images.unsplash.com/photo-1591115765373-5207764f72e7?w=800',  # Women in tech
+        'days_from_now': 35
+    },
+    {
+        'name': 'Blockchain Africa Conference',
+        'description': 'East Africa\'s premier blockchain and cryptocurrency conference. Explore real-world use cases of blockchain in finance, supply chain, and governance. Features workshops on smart contracts and DeFi.',
+        'category': 'Tech',
+        'price': 15000,
+        'capacity': 800,
+        'location': 'Villa Rosa Kempinski, Nairobi',
+        'lat': -1.2667,
+        'lng': 36.8033,
+        'image': 'https://images.unsplash.com/photo-1639762681485-074b7f938ba0?w=800',  # Blockchain conference
+        'days_from_now': 45
+    },
+
+    # FOOD & DRINK (12 events)
+    {
+        'name': 'Nairobi Street Food Festival',
+        'description': 'Celebrate Kenya\'s vibrant street food culture! Sample nyama choma, mutura, samosas, bhajias, and more from 50+ vendors. Live cooking demos, eating competitions, and traditional music performances.',
+        'category': 'Food',
+        'price': 500,
+        'capacity': 5000,
+        'location': 'Uhuru Park, Nairobi',
+        'lat': -1.2864,
+        'lng': 36.8246,
+        'image': 'https://images.unsplash.com/photo-1555939594-58d7cb561ad1?w=800',  # Street food
+        'days_from_now': 10
+    },
+    {
+        'name': 'Nairobi Coffee Festival',
+        'description': 'Discover Kenya\'s world-renowned coffee culture. Tastings from top local coffee roasters, barista championships, coffee farm tours, and workshops on brewing techniques. Meet the farmers behind your morning cup.',
+        'category': 'Food',
+        'price': 1500,
+        'capacity': 2000,
+        'location': 'Nairobi National Museum',
+        'lat': -1.2718,
+        'lng': 36.8162,
+        'image': 'https://images.unsplash.com/photo-1511920179716-5d9a50bdd8df?w=800',  # Coffee
+        'days_from_now': 18
+    },
+    {
+        'name': 'Kilimanjaro Jamii Food Fair',
+        'description': 'Family picnic celebrating East African cuisine. Enjoy ugali, sukuma wiki, pilau, and mandazi from different regions. Kids activities, traditional dance performances, and cooking classes.',
+        'category': 'Food',
+        'price': 800,
+        'capacity': 1000,
+        'location': 'Karura Forest, Nairobi',
+        'lat': -1.2465,
+        'lng': 36.8402,
+        'image': 'https://images.unsplash.com/photo-1555939594-58d7cb561ad1?w=800',  # Family food event
+        'days_from_now': 6
+    },
+
+    # CULTURE & ART (15 events)
+    {
+        'name': 'Art Nairobi Gallery Night',
+        'description': 'Contemporary East African art exhibition featuring paintings, sculptures, and installations from emerging and established artists. Wine reception, artist talks, and live auction.',
+        'category': 'Art',
+        'price': 2000,
+        'capacity': 300,
+        'location': 'Circle Art Gallery, Nairobi',
+        'lat': -1.2843,
+        'lng': 36.8172,
+        'image': 'https://images.unsplash.com/photo-1531243269054-5ebf6f34081e?w=800',  # Art gallery
+        'days_from_now': 12
+    },
+    {
+        'name': 'Lamu Cultural Festival',
+        'description': 'Annual celebration of Swahili culture on the UNESCO World Heritage island of Lamu. Traditional dhow races, donkey races, henna painting, taarab music, and authentic coastal cuisine.',
+        'category': 'Culture',
+        'price': 3000,
+        'capacity': 1500,
+        'location': 'Lamu Island',
+        'lat': -2.2717,
+        'lng': 40.9020,
+        'image': 'https://images.unsplash.com/photo-1523805009345-7448845a9e53?w=800',  # Cultural festival
+        'days_from_now': 60
+    },
+    {
+        'name': 'Maasai Market Cultural Experience',
+        'description': 'Interactive cultural experience with Maasai community. Traditional beadwork workshops, warrior dance performances, storytelling sessions, and authentic Maasai cuisine. Proceeds support local education programs.',
+        'category': 'Culture',
+        'price': 1200,
+        'capacity': 200,
+        'location': 'Village Market, Nairobi',
+        'lat': -1.2244,
+        'lng': 36.8050,
+        'image': 'https://images.unsplash.com/photo-1523805009345-7448845a9e53?w=800',  # Cultural event
+        'days_from_now': 9
+    },
+
+    # SPORTS & FITNESS (12 events)
+    {
+        'name': 'Nairobi City Marathon',
+        'description': 'Annual marathon through the heart of Nairobi. Full marathon (42km), half marathon (21km), and 10km fun run options. Routes pass iconic landmarks. Professional timing, medals, and post-race celebrations.',
+        'category': 'Sports',
+        'price': 2000,
+        'capacity': 10000,
+        'location': 'Nyayo Stadium Start Point',
+        'lat': -1.3014,
+        'lng': 36.8254,
+        'image': 'https://images.unsplash.com/photo-1552674605-db6ffd4facb5?w=800',  # Marathon
+        'days_from_now': 42
+    },
+    {
+        'name': 'Karura Forest Trail Run',
+        'description': 'Morning trail run through Nairobi\'s urban forest. 5km and 10km routes on natural trails. Post-run breakfast, smoothies, and wellness talks. Perfect for fitness enthusiasts and nature lovers.',
+        'category': 'Sports',
+        'price': 800,
+        'capacity': 500,
+        'location': 'Karura Forest Main Gate',
+        'lat': -1.2465,
+        'lng': 36.8402,
+        'image': 'https://images.unsplash.com/photo-1571008887538-b36bb32f4571?w=800',  # Trail running
+        'days_from_now': 4
+    },
+    {
+        'name': 'Safari Sevens Rugby Tournament',
+        'description': 'Kenya\'s premier rugby sevens tournament attracting teams from across Africa and beyond. Two days of high-energy rugby action, after-parties, and carnival atmosphere.',
+        'category': 'Sports',
+        'price': 1500,
+        'capacity': 15000,
+        'location': 'Nyayo National Stadium',
+        'lat': -1.3014,
+        'lng': 36.8254,
+        'image': 'https://images.unsplash.com/photo-1517466787929-bc90951d0974?w=800',  # Rugby
+        'days_from_now': 28
+    },
+
+    # BUSINESS & NETWORKING (10 events)
+    {
+        'name': 'Kenya Business Summit',
+        'description': 'High-level business conference for corporate leaders, entrepreneurs, and policymakers. Topics include economic growth, investment opportunities, and sustainable business practices in East Africa.',
+        'category': 'Corporate',
+        'price': 25000,
+        'capacity': 1000,
+        'location': 'Kenyatta International Convention Centre',
+        'lat': -1.2921,
+        'lng': 36.8219,
+        'image': 'https://images.unsplash.com/photo-1511578314322-379afb476865?w=800',  # Business conference
+        'days_from_now': 50
+    },
+    {
+        'name': 'Nairobi SME Expo',
+        'description': 'Showcase for small and medium enterprises across various sectors. B2B networking, supplier meetups, and workshops on accessing finance, digital marketing, and business growth strategies.',
+        'category': 'Corporate',
+        'price': 3000,
+        'capacity': 2000,
+        'location': 'Sarit Centre Exhibition Hall',
+        'lat': -1.2614,
+        'lng': 36.7899,
+        'image': 'https://images.unsplash.com/photo-1505373877841-8d25f7d46678?w=800',  # Business expo
+        'days_from_now': 25
+    },
+
+    # EDUCATION & WORKSHOPS (10 events)
+    {
+        'name': 'Digital Marketing Masterclass',
+        'description': 'Full-day intensive workshop on modern digital marketing strategies. Learn SEO, social media marketing, email campaigns, and analytics. Includes certification and course materials.',
+        'category': 'Education',
+        'price': 5000,
+        'capacity': 100,
+        'location': 'Strathmore Business School',
+        'lat': -1.3108,
+        'lng': 36.8106,
+        'image': 'https://images.unsplash.com/photo-1552664730-d307ca884978?w=800',  # Workshop
+        'days_from_now': 15
+    },
+    {
+        'name': 'Photography Workshop: Capturing Nairobi',
+        'description': 'Learn street photography and urban landscape techniques with professional photographers. Morning session covers theory, afternoon is a photo walk through Nairobi\'s vibrant streets. All skill levels welcome.',
+        'category': 'Education',
+        'price': 3500,
+        'capacity': 25,
+        'location': 'Kenya National Archives',
+        'lat': -1.2832,
+        'lng': 36.8244,
+        'image': 'https://images.unsplash.com/photo-1542038784456-1ea8e935640e?w=800',  # Photography workshop
+        'days_from_now': 11
+    },
+
+    # WELLNESS & LIFESTYLE (8 events)
+    {
+        'name': 'Karura Forest Yoga & Meditation Retreat',
+        'description': 'Full weekend wellness retreat in nature. Daily yoga sessions, guided meditation, forest bathing walks, healthy meals, and mindfulness workshops. Disconnect to reconnect.',
+        'category': 'Wellness',
+        'price': 12000,
+        'capacity': 50,
+        'location': 'Karura Forest Nature Centre',
+        'lat': -1.2465,
+        'lng': 36.8402,
+        'image': 'https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=800',  # Yoga in nature
+        'days_from_now': 20
+    },
+    {
+        'name': 'Nairobi Wellness Expo',
+        'description': 'Health and wellness expo featuring fitness demos, nutrition talks, mental health awareness sessions, and exhibitors offering health products and services. Free health screenings available.',
+        'category': 'Wellness',
+        'price': 500,
+        'capacity': 3000,
+        'location': 'Sarit Centre Expo Hall',
+        'lat': -1.2614,
+        'lng': 36.7899,
+        'image': 'https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800',  # Wellness expo
+        'days_from_now': 17
+    },
+
+    # FASHION (8 events)
+    {
+        'name': 'Nairobi Fashion Week',
+        'description': 'Showcase of Kenya\'s top fashion designers and emerging talent. Three days of runway shows featuring contemporary African fashion, sustainable design, and streetwear. Industry networking and buyer meetups.',
+        'category': 'Fashion',
+        'price': 5000,
+        'capacity': 800,
+        'location': 'Villa Rosa Kempinski, Nairobi',
+        'lat': -1.2667,
+        'lng': 36.8033,
+        'image': 'https://images.unsplash.com/photo-1469334031218-e382a71b716b?w=800',  # Fashion show
+        'days_from_now': 40
+    },
+
+    # COMEDY & ENTERTAINMENT (5 events)
+    {
+        'name': 'Churchill Show Live',
+        'description': 'Kenya\'s most popular comedy show comes to you live! Featuring the best local comedians including MC Jessy, Chipukeezy, and surprise guest appearances. Expect rib-cracking jokes about life in Nairobi.',
+        'category': 'Comedy',
+        'price': 1500,
+        'capacity': 2000,
+        'location': 'KICC, Nairobi',
+        'lat': -1.2921,
+        'lng': 36.8219,
+        'image': 'https://images.unsplash.com/photo-1585699324551-f6c309eedeca?w=800',  # Comedy show
+        'days_from_now': 13
+    },
+
+    # FROM THE ORIGINAL DEMO SEED
+    {
+        'name': 'Nairobi Afrobeat Festival 2025',
+        'description': "Experience three days of electrifying Afrobeat, Gengetone, and Amapiano performances featuring Kenya's hottest artists and international acts. Food vendors, art installations, and cultural showcases throughout.",
+        'category': 'Music',
+        'price': 2500,
+        'capacity': 5000,
+        'location': 'Uhuru Gardens, Nairobi',
+        'lat': -1.3142,
+        'lng': 36.8194,
+        'image': 'https://images.unsplash.com/photo-1533174072545-7a4b6ad7a6c3?w=800',
+        'days_from_now': 45
+    },
+    {
+        'name': 'Tech Safari Summit Nairobi',
+        'description': "East Africa's premier tech conference bringing together innovators, investors, and entrepreneurs. Keynotes from Silicon Savannah leaders, startup pitches, and networking sessions. Learn about AI, fintech, and agritech solutions shaping Kenya's future.",
+        'category': 'Tech',
+        'price': 8500,
+        'capacity': 800,
+        'location': 'Kenyatta International Convention Centre (KICC), Nairobi',
+        'lat': -1.2921,
+        'lng': 36.8219,
+        'image': 'https://images.unsplash.com/photo-1540575467063-178a50c2df87?w=800',
+        'days_from_now': 30
+    },
+    {
+        'name': 'Coastal Vibes: Mombasa Reggae Night',
+        'description': "Beach sunset reggae session featuring local DJs and live bands. Chill vibes, ocean breeze, and authentic coastal cuisine. Special performance by Mombasa's finest reggae collective.",
+        'category': 'Music',
+        'price': 1500,
+        'capacity': 300,
+        'location': 'Nyali Beach, Mombasa',
+        'lat': -4.0435,
+        'lng': 39.7224,
+        'image': 'https://images.unsplash.com/photo-1506157786151-b8491531f063?w=800',
+        'days_from_now': 15
+    },
+    {
+        'name': 'Nairobi Art Week: Contemporary East African Exhibition',
+        'description': 'Week-long celebration of contemporary art from Kenyan and East African artists. Gallery exhibitions, artist talks, live painting sessions, and art market. Explore the vibrant creative scene of Nairobi.',
+        'category': 'Art',
+        'price': 1000,
+        'capacity': 200,
+        'location': 'The Nairobi Gallery, Nairobi',
+        'lat': -1.2864,
+        'lng': 36.8172,
+        'image': 'https://images.unsplash.com/photo-1460661419201-fd4cecdf8a8b?w=800',
+        'days_from_now': 20
+    },
+    {
+        'name': 'Karura Forest Wellness Retreat',
+        'description': "Full-day wellness experience in Nairobi's urban forest. Yoga sessions, guided nature walks, meditation workshops, and healthy local cuisine. Reconnect with nature without leaving the city.",
+        'category': 'Wellness',
+        'price': 3500,
+        'capacity': 50,
+        'location': 'Karura Forest, Nairobi',
+        'lat': -1.2503,
+        'lng': 36.8345,
+        'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?w=800',
+        'days_from_now': 12
+    },
+    {
+        'name': 'Kisumu Jazz & Wine Festival',
+        'description': 'Lakeside jazz festival featuring smooth jazz, soul, and R&B performances. Wine tastings from local and international vineyards, gourmet food pairings, and sunset views over Lake Victoria.',
+        'category': 'Music',
+        'price': 4500,
+        'capacity': 400,
+        'location': 'Dunga Beach, Kisumu',
+        'lat': -0.0917,
+        'lng': 34.768,
+        'image': 'https://images.unsplash.com/photo-1511735111819-9a3f7709049c?w=800',
+        'days_from_now': 60
+    },
+    {
+        'name': 'Startup Grind Nairobi: Pitching Masterclass',
+        'description': "Learn from successful founders and investors. Interactive workshop on pitch deck creation, storytelling for fundraising, and navigating Kenya's startup ecosystem. Networking happy hour included.",
+        'category': 'Tech',
+        'price': 2000,
+        'capacity': 100,
+        'location': 'iHub, Nairobi',
+        'lat': -1.2897,
+        'lng': 36.7836,
+        'image': 'https://images.unsplash.com/photo-1559136555-9303baea8ebd?w=800',
+        'days_from_now': 18
+    },
+    {
+        'name': 'Lamu Cultural Festival 2025',
+        'description': 'Annual celebration of Swahili culture and heritage. Traditional dhow races, donkey races, Swahili poetry, henna painting, and authentic coastal cuisine. Immerse yourself in centuries-old traditions.',
+        'category': 'Culture',
+        'price': 6000,
+        'capacity': 500,
+        'location': 'Lamu Town, Lamu Island',
+        'lat': -2.2717,
+        'lng': 40.902,
+        'image': 'https://images.unsplash.com/photo-1609137144813-7d9921338f24?w=800',
+        'days_from_now': 90
+    },
+    {
+        'name': 'Nairobi Fashion Week: Emerging Designers Showcase',
+        'description': "Runway shows featuring Kenya's next generation of fashion designers. Witness innovative designs blending traditional African aesthetics with contemporary fashion. VIP after-party with designers and industry leaders.",
+        'category': 'Fashion',
+        'price': 5000,
+        'capacity': 250,
+        'location': 'Sarit Centre, Nairobi',
+        'lat': -1.2618,
+        'lng': 36.7876,
+        'image': 'https://images.unsplash.com/photo-1558769132-cb1aea3c3e44?w=800',
+        'days_from_now': 35
+    },
+    {
+        'name': 'Rift Valley Marathon & Music Festival',
+        'description': "Combine fitness and fun! Morning marathon through scenic Rift Valley landscapes, followed by afternoon music festival with local and regional artists. Family-friendly with kids' activities.",
+        'category': 'Sports',
+        'price': 3000,
+        'capacity': 1000,
+        'location': 'Lake Naivasha, Naivasha',
+        'lat': -0.7667,
+        'lng': 36.4333,
+        'image': 'https://images.unsplash.com/photo-1532444458054-01a7dd3e9fca?w=800',
+        'days_from_now': 50
+    },
+    {
+        'name': 'Nairobi Comedy Night: LOL Edition',
+        'description': "Kenya's funniest stand-up comedians in one epic night! Featuring Churchill Show alumni and rising stars. Unlimited laughs, great food, and full bar. Adults only.",
+        'category': 'Comedy',
+        'price': 2000,
+        'capacity': 400,
+        'location': 'Kenya National Theatre, Nairobi',
+        'lat': -1.2814,
+        'lng': 36.8253,
+        'image': 'https://images.unsplash.com/photo-1585699324551-f6c309eedeca?w=800',
+        'days_from_now': 7
+    },
+    {
+        'name': 'Blockchain & Crypto Summit Kenya',
+        'description': 'Explore the future of finance in Africa. Expert panels on cryptocurrency adoption, blockchain use cases for African challenges, NFTs, and DeFi. Networking with crypto enthusiasts and investors.',
+        'category': 'Tech',
+        'price': 12000,
+        'capacity': 300,
+        'location': 'Villa Rosa Kempinski, Nairobi',
+        'lat': -1.2674,
+        'lng': 36.8075,
+        'image': 'https://images.unsplash.com/photo-1639762681485-074b7f938ba0?w=800',
+        'days_from_now': 25
+    },
+    {
+        'name': 'Kenyan Film Festival: New Voices',
+        'description': 'Week-long festival showcasing emerging Kenyan filmmakers. Feature films, documentaries, and shorts exploring contemporary Kenyan stories. Q&A sessions with directors and industry workshops.',
+        'category': 'Film',
+        'price': 1500,
+        'capacity': 150,
+        'location': 'Alliance Française, Nairobi',
+        'lat': -1.2793,
+        'lng': 36.8115,
+        'image': 'https://images.unsplash.com/photo-1489599849927-2ee91cede3ba?w=800',
+        'days_from_now': 40
+    },
+    {
+        'name': 'Nairobi Rooftop Sessions: Acoustic Sundown',
+        'description': 'Intimate acoustic performances on a stunning Nairobi rooftop. Local singer-songwriters, city skyline views, craft cocktails, and tapas. Limited capacity for exclusive experience.',
+        'category': 'Music',
+        'price': 3500,
+        'capacity': 80,
+        'location': 'Westlands, Nairobi',
+        'lat': -1.2676,
+        'lng': 36.8074,
+        'image': 'https://images.unsplash.com/photo-1514525253161-7a46d19cd819?w=800',
+        'days_from_now': 10
+    },
+    {
+        'name': 'Maasai Market Artisan Fair',
+        'description': 'Shop directly from Kenyan artisans! Handmade jewelry, textiles, leather goods, paintings, and sculptures. Live cultural performances, traditional food stalls, and meet-the-maker sessions.',
+        'category': 'Culture',
+        'price': 500,
+        'capacity': 2000,
+        'location': 'Village Market, Nairobi',
+        'lat': -1.2245,
+        'lng': 36.8058,
+        'image': 'https://images.unsplash.com/photo-1567696911980-2eed69a46042?w=800',
+        'days_from_now': 5
+    },
+    {
+        'name': 'Nairobi Book Fair & Author Meet',
+        'description': 'Celebrate Kenyan literature! Book signings with bestselling Kenyan authors, poetry slams, writing workshops, and panel discussions on African storytelling. Discounted books and literary marketplace.',
+        'category': 'Literature',
+        'price': 1000,
+        'capacity': 600,
+        'location': 'Sarit Expo Centre, Nairobi',
+        'lat': -1.2618,
+        'lng': 36.7876,
+        'image': 'https://images.unsplash.com/photo-1507842217343-583bb7270b66?w=800',
+        'days_from_now': 28
+    },
+    {
+        'name': 'Electronic Dance Music Festival Nairobi',
+        'description': "Kenya's biggest EDM event! International and local DJs, massive light shows, multiple stages, VIP areas, and unforgettable vibes. Dance till dawn with thousands of music lovers.",
+        'category': 'Music',
+        'price': 4000,
+        'capacity': 8000,
+        'location': 'Carnivore Grounds, Nairobi',
+        'lat': -1.3439,
+        'lng': 36.8361,
+        'image': 'https://images.unsplash.com/photo-1470229722913-7c0e2dbbafd3?w=800',
+        'days_from_now': 70
+    },
+]
+
+# Weekly events, repeated on each of RECURRING_DAYS
+RECURRING_EVENTS = [
+    {
+        'name': 'Salsa Saturday at Brew Bistro',
+        'description': 'Every Saturday night salsa dancing with live Latin band and professional instructors. Beginners welcome - free salsa lesson from 8-9pm. Cocktails and tapas available.',
+        'category': 'Music',
+        'price': 500,
+        'capacity': 200,
+        'location': 'Brew Bistro, Fortis Tower',
+        'lat': -1.2668,
+        'lng': 36.7791,
+        'image': 'https://images.unsplash.com/photo-1504609773096-104ff2c73ba4?w=800',
+    },
+    {
+        'name': 'Sunday Farmers Market',
+        'description': 'Weekly farmers market with fresh organic produce from Kenyan farms. Local honey, free-range eggs, artisan breads, and handmade crafts. Live acoustic music.',
+        'category': 'Food',
+        'price': 0,
+        'capacity': 1000,
+        'location': 'Village Market Parking',
+        'lat': -1.2244,
+        'lng': 36.8050,
+        'image': 'https://images.unsplash.com/photo-1488459716781-31db52582fe9?w=800',
+    },
+    {
+        'name': 'Poetry Night at The Alchemist',
+        'description': 'Spoken word and poetry open mic night. Share your work or just enjoy performances from Nairobi\'s creative community. Craft cocktails and good vibes.',
+        'category': 'Art',
+        'price': 300,
+        'capacity': 150,
+        'location': 'The Alchemist, Westlands',
+        'lat': -1.2656,
+        'lng': 36.8084,
+        'image': 'https://images.unsplash.com/photo-1475721027785-f74eccf877e2?w=800',
+    },
+]
+
+RECURRING_DAYS = [1, 8, 15, 22, 29]
+
+
+def _catalog():
+    events = list(KENYAN_EVENTS)
+    for days in RECURRING_DAYS:
+        events.extend(dict(template, days_from_now=days) for template in RECURRING_EVENTS)
+    return events
+
+
+class _Ids:
+    """Hands out primary keys for one table.
+
+    Rows are inserted with explicit ids instead of INSERT ... RETURNING,
+    which keeps executemany batches cheap; sync() then moves the Postgres
+    sequence past them.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.last = db.session.scalar(select(func.max(model.id))) or 0
+
+    def take(self):
+        self.last += 1
+        return self.last
+
+    def sync(self):
+        if db.session.get_bind().dialect.name == 'postgresql':
+            table = self.model.__tablename__
+            db.session.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), :last)"), {'last': max(self.last, 1)})
+
+
+def _insert_users(usernames, password_hash, user_ids, batch_size):
+    rows = [{'id': user_ids.take(), 'username': name, 'email': f'{name}@ticketi.com', 'password_hash': password_hash} for name in usernames]
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(insert(User), rows[start:start + batch_size])
+    db.session.commit()
+    return [row['id'] for row in rows]
+
+
+def _event_rows(scale, rng, organizer_ids, event_ids, now, inventory_mode):
+    """Yields Event rows: the catalog as is, then `scale - 1` jittered copies."""
+    catalog = _catalog()
+    for copy in range(scale):
+        for template in catalog:
+            days = template['days_from_now'] if copy == 0 else rng.randint(1, 365)
+            lat = template['lat'] if copy == 0 else template['lat'] + rng.uniform(-0.05, 0.05)
+            lng = template['lng'] if copy == 0 else template['lng'] + rng.uniform(-0.05, 0.05)
+            capacity = template['capacity']
+            yield {
+                'id': event_ids.take(),
+                'name': template['name'] if copy == 0 else f"{template['name']} #{copy + 1}",
+                'description': template['description'],
+                'location': template['location'],
+                'location_lat': lat,
+                'location_lng': lng,
+                'geohash': geo.encode(lat, lng),
+                'date': now + timedelta(days=days, hours=rng.randint(0, 12)),
+                'price': float(template['price']),
+                'capacity': capacity,
+                'tickets_sold': int(capacity * rng.uniform(0.2, 0.9)),
+                'inventory_mode': inventory_mode,
+                'image': template['image'],
+                'category': template['category'],
+                'status': 'upcoming',
+                'user_id': rng.choice(organizer_ids),
+                'created_at': now,
+                'updated_at': now,
+                'version': 1
+            }
+
+
+def reset_database():
+    """Deletes everything the seeder creates, children first."""
+    for model in (Transaction, Ticket, TicketHold, Event, User):
+        db.session.execute(delete(model))
+    db.session.commit()
+
+
+def seed_database(scale=1, seed=42, batch_size=10000, resale_ratio=0.1):
+    """Seeds an empty database. Returns counts of what was created.
+
+    Materialized events (TICKET_INVENTORY_MODE) also get a row for every
+    unsold seat.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    inventory_mode = current_app.config['TICKET_INVENTORY_MODE']
+    stats = {'users': 0, 'events': 0, 'tickets': 0, 'transactions': 0, 'resale': 0}
+
+    # One hash shared by every seeded account; hashing per user would dominate the run
+    password_hash = generate_password_hash(SEED_PASSWORD, method=current_app.config['PASSWORD_HASH_METHOD'])
+    user_ids, event_ids, ticket_ids = _Ids(User), _Ids(Event), _Ids(Ticket)
+    organizer_ids = _insert_users(ORGANIZERS, password_hash, user_ids, batch_size)
+    buyer_ids = _insert_users([f'buyer{i}' for i in range(1, BUYERS_PER_SCALE * scale + 1)], password_hash, user_ids, batch_size)
+    stats['users'] = len(organizer_ids) + len(buyer_ids)
+
+    tickets, seat_rows = [], []
+
+    def flush_tickets():
+        if seat_rows:
+            db.session.execute(insert(Ticket), seat_rows)
+            stats['tickets'] += len(seat_rows)
+            seat_rows.clear()
+        if tickets:
+            db.session.execute(insert(Ticket), [row for row, _ in tickets])
+            db.session.execute(insert(Transaction), [
+                {
+                    'ticket_id': row['id'],
+                    'seller_id': seller_id,
+                    'buyer_id': row['user_id'],
+                    'price': row['price'],
+                    'transaction_type': 'primary',
+                    'status': 'completed',
+                    'timestamp': row['purchase_date']
+                }
+                for row, seller_id in tickets
+            ])
+            stats['tickets'] += len(tickets)
+            stats['transactions'] += len(tickets)
+            tickets.clear()
+        db.session.commit()
+
+    def flush_events(rows):
+        db.session.execute(insert(Event), rows)
+        stats['events'] += len(rows)
+
+        for row in rows:
+            event_id = row['id']
+            for _ in range(row['tickets_sold']):
+                resale = rng.random() < resale_ratio
+                tickets.append(({
+                    'id': ticket_ids.take(),
+                    'event_id': event_id,
+                    'user_id': rng.choice(buyer_ids),
+                    'price': row['price'],
+                    'status': 'resale' if resale else 'sold',
+                    'resale_price': round(row['price'] * rng.uniform(0.8, 1.5), 2) if resale else None,
+                    'created_at': now,
+                    'purchase_date': now - timedelta(days=rng.randint(1, 30), minutes=rng.randint(0, 1439))
+                }, row['user_id']))
+                stats['resale'] += resale
+                if len(tickets) >= batch_size:
+                    flush_tickets()
+
+            if inventory_mode == 'materialized':
+                for _ in range(row['capacity'] - row['tickets_sold']):
+                    seat_rows.append({'id': ticket_ids.take(), 'event_id': event_id, 'price': row['price'], 'status': 'available', 'created_at': now})
+                    if len(seat_rows) >= batch_size:
+                        flush_tickets()
+        flush_tickets()
+
+    rows = []
+    for row in _event_rows(scale, rng, organizer_ids, event_ids, now, inventory_mode):
+        rows.append(row)
+        if len(rows) >= batch_size:
+            flush_events(rows)
+            rows = []
+    if rows:
+        flush_events(rows)
+
+    for ids in (user_ids, event_ids, ticket_ids):
+        ids.sync()
+    db.session.commit()
+    rebuild_index()
+    invalidate('events')
+    return stats
+
+
+def has_data():
+    return db.session.scalar(select(func.count()).select_from(User)) > 0
@@ -1,5 +1,17 @@
 from datetime import datetime
+from flask import current_app
+from sqlalchemy import func
 from server.models import db, Event, Ticket
+from server.services.search_service import index_event, remove_event
+from server.cache import invalidate_event
+from server import geo
+
+def _update_geohash(event):
+    """Keeps the indexed geohash in step with the event's coordinates."""
+    if event.location_lat is None or event.location_lng is None:
+        event.geohash = None
+    else:
+        event.geohash = geo.encode(float(event.location_lat), float(event.location_lng))
 
 def create_event(data, user_id):
     """Creates a new event and its associated tickets."""
@@ -26,11 +38,20 @@ def create_event(data, user_id):
             capacity=capacity,
             image=data.get('image'),
             user_id=user_id,
-            status='upcoming'
+            status='upcoming',
+            inventory_mode=current_app.config['TICKET_INVENTORY_MODE']
         )
+        _update_geohash(new_event)
         
         db.session.add(new_event)
+        db.session.flush()
+        index_event(new_event)
         db.session.commit()
+        invalidate_event(new_event.id)
+
+        if new_event.inventory_mode == 'virtual':
+            # Tickets are created when they are bought
+            return new_event, None
 
         tickets = []
         for _ in range(capacity):
@@ -74,8 +95,12 @@ def update_event(event, data):
             event.image = data['image']
         if 'status' in data:
             event.status = data['status']
+        if 'location_lat' in data or 'location_lng' in data:
+            _update_geohash(event)
 
+        index_event(event)
         db.session.commit()
+        invalidate_event(event.id)
         return event, None
 
     except (ValueError, TypeError):
@@ -88,10 +113,44 @@ def update_event(event, data):
 def delete_event(event):
     """Deletes an event."""
     try:
+        event_id = event.id
+        remove_event(event_id)
         db.session.delete(event)
         db.session.commit()
+        invalidate_event(event_id)
         return True, None
     except Exception as e:
         db.session.rollback()
         # In a real app, you'd want to log this error
         return False, {'error': f'Failed to delete event: {str(e)}'}
+
+def virtualize_inventory(event):
+    """Converts a materialized event to virtual inventory.
+
+    Drops the never-sold 'available' rows and resyncs tickets_sold with the
+    tickets that actually changed hands.
+    """
+    if event.inventory_mode == 'virtual':
+        return event, None
+
+    try:
+        Ticket.query.filter(
+            Ticket.event_id == event.id,
+            Ticket.status == 'available',
+            ~Ticket.transactions.any()
+        ).delete(synchronize_session=False)
+
+        event.tickets_sold = db.session.query(func.count(Ticket.id)).filter(
+            Ticket.event_id == event.id,
+            Ticket.status != 'available'
+        ).scalar()
+        event.inventory_mode = 'virtual'
+
+        db.session.commit()
+        invalidate_event(event.id)
+        return event, None
+
+    except Exception as e:
+        db.session.rollback()
+        # In a real app, you'd want to log this error
+        return None, {'error': f'Failed to convert event inventory: {str(e)}'}
@@ -0,0 +1,178 @@
+"""
+Eventbrite ingestion into the local external_events mirror
+Pages through EventbriteService.search_events for each configured location
+and upserts the transformed events, so eventbrite_bp can answer from an
+indexed local table instead of proxying every request to the API.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+import requests
+from flask import current_app
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from server.models import db, ExternalEvent
+
+UPSERT_COLUMNS = (
+    'source', 'region', 'name', 'description', 'date', 'location', 'location_lat',
+    'location_lng', 'price', 'capacity', 'tickets_sold', 'image', 'category',
+    'status', 'external_url', 'is_free', 'synced_at'
+)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def _to_row(event, region, synced_at):
+    try:
+        date = datetime.strptime(event['date'], '%Y-%m-%d %H:%M:%S')
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    return {
+        'external_id': event['id'],
+        'source': event.get('source', 'eventbrite'),
+        'region': region,
+        'name': event['name'],
+        'description': event.get('description'),
+        'date': date,
+        'location': event.get('location'),
+        'location_lat': event.get('location_lat'),
+        'location_lng': event.get('location_lng'),
+        'price': event.get('price'),
+        'capacity': event.get('capacity'),
+        'tickets_sold': event.get('tickets_sold', 0),
+        'image': event.get('image'),
+        'category': event.get('category'),
+        'status': event.get('status', 'upcoming'),
+        'external_url': event.get('external_url'),
+        'is_free': bool(event.get('is_free')),
+        'synced_at': synced_at
+    }
+
+
+def upsert_events(rows):
+    """Inserts rows, updating in place any whose external_id already exists."""
+    if not rows:
+        return
+
+    upsert_insert = UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+    if upsert_insert is None:
+        _select_then_write(rows)
+        return
+
+    statement = upsert_insert(ExternalEvent)
+    statement = statement.on_conflict_do_update(
+        index_elements=['external_id'],
+        set_={column: statement.excluded[column] for column in UPSERT_COLUMNS}
+    )
+    db.session.execute(statement, rows)
+
+
+def _select_then_write(rows):
+    # Portable fallback: one lookup, then bulk UPDATE by id and bulk INSERT.
+    # Assumes a single ingester, as a concurrent one could insert in between.
+    existing = dict(db.session.execute(
+        select(ExternalEvent.external_id, ExternalEvent.id)
+        .where(ExternalEvent.external_id.in_([row['external_id'] for row in rows]))
+    ).all())
+
+    updates = [
+        {'id': existing[row['external_id']], **{column: row[column] for column in UPSERT_COLUMNS}}
+        for row in rows if row['external_id'] in existing
+    ]
+    inserts = [row for row in rows if row['external_id'] not in existing]
+    if updates:
+        db.session.execute(update(ExternalEvent), updates)
+    if inserts:
+        db.session.execute(insert(ExternalEvent), inserts)
+
+
+def ingest_events(service, locations, max_pages=10, per_page=50, resume_from=None):
+    """Mirrors upcoming Eventbrite events for `locations`. Returns per-run stats.
+
+    An API error is logged and ends that location's run; stats['resume_from']
+    maps it to the failed page, to be passed as `resume_from` next time.
+    """
+    stats = {'pages': 0, 'events': 0, 'skipped': 0, 'pruned': 0, 'resume_from': {}}
+    synced_at = datetime.utcnow()
+    resume_from = resume_from or {}
+
+    for location in locations:
+        page = resume_from.get(location, 1)
+        while page <= max_pages:
+            try:
+                result = service.search_events(
+                    location=location, page=page, per_page=per_page, use_cache=False, raise_errors=True
+                )
+            except requests.exceptions.RequestException as e:
+                current_app.logger.error(f'Eventbrite ingestion of {location} stopped at page {page}: {e}')
+                stats['resume_from'][location] = page
+                break
+            rows = []
+            seen = set()
+            for event in result['events']:
+                row = _to_row(event, location, synced_at)
+                if row is None or row['external_id'] in seen:
+                    stats['skipped'] += 1
+                    continue
+                seen.add(row['external_id'])
+                rows.append(row)
+
+            upsert_events(rows)
+            db.session.commit()
+
+            stats['pages'] += 1
+            stats['events'] += len(rows)
+
+            if page >= result['pagination'].get('page_count', 0):
+                break
+            page += 1
+
+    # Keep a day of history so "today" listings stay stable, then drop past events
+    stats['pruned'] = ExternalEvent.query.filter(
+        ExternalEvent.date < synced_at - timedelta(days=1)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+
+    return stats
+
+
+class IngestionWorker:
+    """Runs ingest_events every `interval` seconds until stopped."""
+
+    def __init__(self, app, service, locations, interval=900, max_pages=10):
+        self.app = app
+        self.service = service
+        self.locations = locations
+        self.interval = interval
+        self.max_pages = max_pages
+        self.resume_from = {}  # location -> page an API error stopped at
+        self._stop = threading.Event()
+
+    def run_once(self):
+        with self.app.app_context():
+            try:
+                stats = ingest_events(self.service, self.locations, max_pages=self.max_pages, resume_from=self.resume_from)
+                self.resume_from = stats['resume_from']
+                return stats
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f'Eventbrite ingestion failed: {e}')
+                return None
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.run_once()
+            self._stop.wait(max(self.interval - (time.monotonic() - started), 0))
+
+    def start(self):
+        """Runs the loop on a daemon thread."""
+        thread = threading.Thread(target=self.run_forever, name='eventbrite-ingest', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
@@ -5,23 +5,59 @@ Fetches real events from Eventbrite with focus on Kenya/Nairobi
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from server.cache import LRUCache
 
 class EventbriteService:
     """Service for fetching events from Eventbrite API"""
     
     BASE_URL = "https://www.eventbriteapi.com/v3"
+    TIMEOUT = (3.05, 10)  # (connect, read) seconds
     
-    def __init__(self):
-        self.api_key = os.getenv('EVENTBRITE_API_KEY')
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_ttl: int = 300,
+        pool_size: int = 10
+    ):
+        self.api_key = api_key or os.getenv('EVENTBRITE_API_KEY')
         if not self.api_key:
             print("Warning: EVENTBRITE_API_KEY not set in environment")
         
+        self.base_url = base_url or os.getenv('EVENTBRITE_BASE_URL', self.BASE_URL)
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
+        
+        # One pooled keep-alive session per process instead of a new connection per call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=('GET',))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Transformed results, keyed on the search arguments
+        self.cache = LRUCache(max_entries=256, default_ttl=cache_ttl)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='eventbrite')
+    
+    def _fetch(self, path: str, params: Dict) -> Dict:
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    
+    def search_events_async(self, **kwargs):
+        """Runs search_events on the worker pool; returns a Future."""
+        return self.executor.submit(self.search_events, **kwargs)
     
     # Category mapping: Eventbrite -> Ticketi
     CATEGORY_MAP = {
@@ -53,7 +89,10 @@ class EventbriteService:
         page: int = 1,
         per_page: int = 20,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        use_cache: bool = True,
+        raise_errors: bool = False
     ) -> Dict:
         """
         Search for events on Eventbrite
@@ -65,6 +104,9 @@ class EventbriteService:
             per_page: Results per page (max 50)
             start_date: Filter events starting from this date (YYYY-MM-DD)
             end_date: Filter events ending before this date (YYYY-MM-DD)
+            sort_by: Eventbrite ordering ('date', 'best'; '-date' for latest first)
+            use_cache: Serve repeated searches from the in-process cache
+            raise_errors: Raise API errors instead of returning no events
         
         Returns:
             Dict with 'events' list and 'pagination' info
@@ -72,7 +114,10 @@ class EventbriteService:
         if not self.api_key:
             return {'events': [], 'pagination': {'page_count': 0}}
         
-        url = f"{self.BASE_URL}/events/search/"
+        cache_key = ('search', location, category, start_date, end_date, sort_by, page, per_page)
+        cached = self.cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            return cached
         
         params = {
             'location.address': location,
@@ -82,6 +127,9 @@ class EventbriteService:
             'page_size': min(per_page, 50)  # Eventbrite max is 50
         }
         
+        if sort_by:
+            params['sort_by'] = sort_by
+        
         # Add date filters
         if start_date:
             params['start_date.range_start'] = f"{start_date}T00:00:00Z"
@@ -96,20 +144,21 @@ class EventbriteService:
                 params['categories'] = eventbrite_category
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._fetch('/events/search/', params)
             
             # Transform events to our format
             events = [self._transform_event(event) for event in data.get('events', [])]
             
-            return {
+            result = {
                 'events': events,
                 'pagination': data.get('pagination', {})
             }
+            self.cache.set(cache_key, result)
+            return result
         
         except requests.exceptions.RequestException as e:
+            if raise_errors:
+                raise
             print(f"Error fetching Eventbrite events: {e}")
             return {'events': [], 'pagination': {'page_count': 0}}
     
@@ -137,7 +186,11 @@ class EventbriteService:
         if not self.api_key:
             return []
         
-        url = f"{self.BASE_URL}/events/search/"
+        # ~1km grid so nearby callers share cache entries
+        cache_key = ('near', round(latitude, 2), round(longitude, 2), radius_km, category, limit)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         params = {
             'location.latitude': latitude,
@@ -153,12 +206,10 @@ class EventbriteService:
                 params['categories'] = eventbrite_category
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._fetch('/events/search/', params)
             events = [self._transform_event(event) for event in data.get('events', [])]
             
+            self.cache.set(cache_key, events)
             return events
         
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,281 @@
+"""
+Ticket holds (checkout carts)
+A hold sets seats aside for HOLD_TTL_SECONDS while the buyer pays. Held seats
+are counted in Event.tickets_held, and the availability gate checks sold plus
+held against capacity, so placing, converting and releasing a hold are each a
+conditional UPDATE on the hold plus one on the event counters. Abandoned
+holds are expired in batches by release_expired_holds, which HoldSweeper runs
+periodically (`flask holds run-sweeper`); a sold-out event also sweeps its
+own expired holds before turning a buyer away.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import bindparam, func, select, update
+from server.models import db, Event, TicketHold
+from server.cache import invalidate_event
+
+
+def _is_postgres():
+    return db.session.get_bind().dialect.name == 'postgresql'
+
+
+def reserve_capacity(event_id, quantity, held=False):
+    """Takes `quantity` seats from an event's free capacity, if that many are free.
+
+    The seats are counted as held or, by default, sold. A single conditional
+    UPDATE, so concurrent buyers can never oversell. Returns True on success.
+    """
+    sold = func.coalesce(Event.tickets_sold, 0)
+    in_holds = func.coalesce(Event.tickets_held, 0)
+    values = {'tickets_held': in_holds + quantity} if held else {'tickets_sold': sold + quantity}
+
+    reserved = db.session.execute(
+        update(Event)
+        .where(Event.id == event_id, sold + in_holds + quantity <= Event.capacity)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return reserved.rowcount == 1
+
+
+def convert_hold(hold_id, event_id, user_id, now):
+    """Turns an unexpired hold's seats from held into sold.
+
+    Returns the held quantity, or None if the hold is not the user's, is for
+    another event or is no longer active. Does not commit.
+    """
+    quantity = db.session.execute(
+        update(TicketHold)
+        .where(
+            TicketHold.id == hold_id,
+            TicketHold.event_id == event_id,
+            TicketHold.user_id == user_id,
+            TicketHold.status == 'active',
+            TicketHold.expires_at > now
+        )
+        .values(status='converted')
+        .returning(TicketHold.quantity)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    if quantity is None:
+        return None
+
+    db.session.execute(
+        update(Event)
+        .where(Event.id == event_id)
+        .values(
+            tickets_held=func.coalesce(Event.tickets_held, 0) - quantity,
+            tickets_sold=func.coalesce(Event.tickets_sold, 0) + quantity
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return quantity
+
+
+def _return_held_seats(held_by_event):
+    # Sorted so concurrent sweeps lock event rows in the same order
+    statement = update(Event.__table__).where(
+        Event.__table__.c.id == bindparam('event_key')
+    ).values(tickets_held=func.coalesce(Event.__table__.c.tickets_held, 0) - bindparam('seats'))
+    db.session.connection().execute(statement, [
+        {'event_key': event_id, 'seats': seats}
+        for event_id, seats in sorted(held_by_event.items())
+    ])
+
+
+def release_expired_holds(batch_size=1000, event_id=None, now=None):
+    """Expires active holds past their expiry time and frees their seats.
+
+    Works through the holds `batch_size` at a time, one UPDATE ... RETURNING
+    per batch (FOR UPDATE SKIP LOCKED on Postgres, so parallel sweepers split
+    the work), committing each batch. Returns the number of holds expired.
+    """
+    now = now or datetime.utcnow()
+    released = 0
+
+    while True:
+        candidates = select(TicketHold.id).where(
+            TicketHold.status == 'active',
+            TicketHold.expires_at <= now
+        ).order_by(TicketHold.expires_at).limit(batch_size)
+        if event_id is not None:
+            candidates = candidates.where(TicketHold.event_id == event_id)
+        if _is_postgres():
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        expired = db.session.execute(
+            update(TicketHold)
+            .where(TicketHold.id.in_(candidates), TicketHold.status == 'active')
+            .values(status='expired')
+            .returning(TicketHold.event_id, TicketHold.quantity)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if not expired:
+            break
+
+        held_by_event = defaultdict(int)
+        for hold_event_id, quantity in expired:
+            held_by_event[hold_event_id] += quantity
+        _return_held_seats(held_by_event)
+        db.session.commit()
+
+        for hold_event_id in held_by_event:
+            invalidate_event(hold_event_id)
+        released += len(expired)
+        if len(expired) < batch_size:
+            break
+
+    return released
+
+
+def availability_error(event_id):
+    """The error for a request the event's free seats could not cover."""
+    remaining = max(db.session.get(Event, event_id).available_tickets, 0)
+    if not remaining:
+        return {'error': 'No tickets available'}
+    return {'error': f'Only {remaining} tickets available'}
+
+
+def place_hold(event_id, user_id, quantity):
+    """Holds `quantity` seats of an event for HOLD_TTL_SECONDS."""
+    event = db.session.get(Event, event_id)
+    if not event:
+        return None, {'error': 'Event not found'}
+
+    now = datetime.utcnow()
+    if event.date < now:
+        return None, {'error': 'Event has already taken place'}
+
+    try:
+        if not reserve_capacity(event_id, quantity, held=True):
+            # Abandoned carts may be all that is left; free them and try once more
+            if not (release_expired_holds(event_id=event_id, now=now) and reserve_capacity(event_id, quantity, held=True)):
+                db.session.rollback()
+                return None, availability_error(event_id)
+
+        hold = TicketHold(
+            event_id=event_id,
+            user_id=user_id,
+            quantity=quantity,
+            expires_at=now + timedelta(seconds=current_app.config['HOLD_TTL_SECONDS']),
+            created_at=now
+        )
+        db.session.add(hold)
+        db.session.commit()
+        invalidate_event(event_id)
+
+        return hold, None
+
+    except Exception as e:
+        db.session.rollback()
+        # In a real app, you'd want to log this error
+        return None, {'error': f'Failed to hold tickets: {str(e)}'}
+
+
+def extend_hold(hold, user_id):
+    """Pushes an active hold's expiry out by HOLD_TTL_SECONDS, up to HOLD_MAX_SECONDS after it was placed."""
+    if hold.user_id != user_id:
+        return None, {'error': 'Unauthorized'}
+
+    now = datetime.utcnow()
+    if hold.status != 'active' or hold.expires_at <= now:
+        return None, {'error': 'Hold has expired'}
+
+    expires_at = min(
+        now + timedelta(seconds=current_app.config['HOLD_TTL_SECONDS']),
+        hold.created_at + timedelta(seconds=current_app.config['HOLD_MAX_SECONDS'])
+    )
+    if expires_at <= hold.expires_at:
+        return None, {'error': 'Hold cannot be extended any further'}
+
+    try:
+        # Conditional, so a sweep that expired the hold meanwhile wins
+        extended = db.session.execute(
+            update(TicketHold)
+            .where(TicketHold.id == hold.id, TicketHold.status == 'active', TicketHold.expires_at > now)
+            .values(expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        if extended.rowcount != 1:
+            db.session.rollback()
+            return None, {'error': 'Hold has expired'}
+
+        db.session.commit()
+        db.session.refresh(hold)
+
+        return hold, None
+
+    except Exception as e:
+        db.session.rollback()
+        # In a real app, you'd want to log this error
+        return None, {'error': f'Failed to extend hold: {str(e)}'}
+
+
+def release_hold(hold, user_id):
+    """Gives a hold's seats back before it expires."""
+    if hold.user_id != user_id:
+        return None, {'error': 'Unauthorized'}
+
+    if hold.status != 'active':
+        return None, {'error': 'Hold is no longer active'}
+
+    try:
+        released = db.session.execute(
+            update(TicketHold)
+            .where(TicketHold.id == hold.id, TicketHold.status == 'active')
+            .values(status='released')
+            .execution_options(synchronize_session=False)
+        )
+        if released.rowcount != 1:
+            db.session.rollback()
+            return None, {'error': 'Hold is no longer active'}
+
+        _return_held_seats({hold.event_id: hold.quantity})
+        db.session.commit()
+        invalidate_event(hold.event_id)
+        db.session.refresh(hold)
+
+        return hold, None
+
+    except Exception as e:
+        db.session.rollback()
+        # In a real app, you'd want to log this error
+        return None, {'error': f'Failed to release hold: {str(e)}'}
+
+
+class HoldSweeper:
+    """Runs release_expired_holds every `interval` seconds until stopped."""
+
+    def __init__(self, app, interval=15, batch_size=1000):
+        self.app = app
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+
+    def run_once(self):
+        with self.app.app_context():
+            try:
+                return release_expired_holds(batch_size=self.batch_size)
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f'Hold sweep failed: {e}')
+                return None
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.run_once()
+            self._stop.wait(max(self.interval - (time.monotonic() - started), 0))
+
+    def start(self):
+        """Runs the loop on a daemon thread."""
+        thread = threading.Thread(target=self.run_forever, name='hold-sweeper', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
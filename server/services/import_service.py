@@ -0,0 +1,230 @@
+"""
+Bulk event import from CSV or NDJSON
+Rows are parsed and validated one at a time straight off the request stream
+and written in batches: Postgres loads each batch with COPY, other databases
+with a single executemany INSERT. Bad rows are reported by line number and
+skipped; they never abort the rest of the import.
+"""
+
+import codecs
+import csv
+import io
+import json
+import math
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import insert, text
+from server import geo
+from server.models import db, Event, Ticket
+from server.services.search_service import index_events
+from server.cache import invalidate
+
+REQUIRED_FIELDS = ('name', 'location', 'description', 'date', 'price', 'capacity')
+EVENT_COPY_COLUMNS = (
+    'id', 'name', 'location', 'location_lat', 'location_lng', 'geohash', 'description', 'date',
+    'price', 'image', 'capacity', 'tickets_sold', 'inventory_mode', 'status', 'category',
+    'created_at', 'updated_at', 'version', 'user_id'
+)
+TICKET_COPY_COLUMNS = ('event_id', 'price', 'status', 'created_at')
+
+
+def _records(stream, fmt):
+    """Yields (line number, dict or None) for each record; None means unparseable."""
+    lines = codecs.getreader('utf-8')(stream, errors='replace')
+
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None
+            continue
+        yield line_number, record if isinstance(record, dict) else None
+
+
+def _finite_float(value):
+    value = float(value)
+    if not math.isfinite(value):  # float() takes 'nan' and 'inf'
+        raise ValueError(f'Not a finite number: {value}')
+    return value
+
+
+def _optional_float(value):
+    return None if value in (None, '') else _finite_float(value)
+
+
+def _validate(record, now):
+    """Turns a raw record into Event column values. Returns (values, error)."""
+    if record is None:
+        return None, 'Malformed record'
+
+    missing = [field for field in REQUIRED_FIELDS if record.get(field) in (None, '')]
+    if missing:
+        return None, f'Missing required fields: {", ".join(missing)}'
+
+    try:
+        date = datetime.strptime(str(record['date']), '%Y-%m-%d %H:%M:%S')
+        price = _finite_float(record['price'])
+        capacity = int(record['capacity'])
+        lat = _optional_float(record.get('location_lat'))
+        lng = _optional_float(record.get('location_lng'))
+    except (TypeError, ValueError, OverflowError):
+        return None, 'Invalid price, capacity, coordinates or date format'
+
+    if date <= now:
+        return None, 'Event date must be in the future'
+    if price < 0:
+        return None, 'Price cannot be negative'
+    if capacity <= 0:
+        return None, 'Capacity must be greater than 0'
+    if (lat is not None and not -90 <= lat <= 90) or (lng is not None and not -180 <= lng <= 180):
+        return None, 'Coordinates must be within -90 to 90 latitude and -180 to 180 longitude'
+    if len(str(record['name'])) > 100:
+        return None, 'Name must be at most 100 characters'
+
+    optional = {field: record.get(field) for field in ('image', 'category')}
+    not_text = [field for field, value in optional.items() if value not in (None, '') and not isinstance(value, str)]
+    if not_text:
+        return None, f'Fields must be text: {", ".join(not_text)}'
+
+    return {
+        'name': str(record['name']),
+        'location': str(record['location']),
+        'location_lat': lat,
+        'location_lng': lng,
+        'geohash': geo.encode(lat, lng) if lat is not None and lng is not None else None,
+        'description': str(record['description']),
+        'date': date,
+        'price': price,
+        'image': optional['image'] or None,
+        'capacity': capacity,
+        'category': optional['category'] or None
+    }, None
+
+
+def _copy_field(value):
+    # CSV COPY reads an unquoted empty field as NULL and a quoted one as ''
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime):
+        value = value.isoformat(sep=' ')
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy(cursor, table, columns, rows):
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(','.join(_copy_field(row[column]) for column in columns))
+        buffer.write('\n')
+    buffer.seek(0)
+    cursor.copy_expert(f'COPY {table} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def _insert_batch_postgres(rows, tickets_per_event):
+    """COPY path. Ids are reserved from the sequence first so tickets can refer to them."""
+    ids = db.session.execute(
+        text("SELECT nextval(pg_get_serial_sequence('events', 'id')) FROM generate_series(1, :count)"),
+        {'count': len(rows)}
+    ).scalars().all()
+    for row, event_id in zip(rows, ids):
+        row['id'] = event_id
+
+    cursor = db.session.connection().connection.cursor()
+    try:
+        _copy(cursor, 'events', EVENT_COPY_COLUMNS, rows)
+        if tickets_per_event:
+            _copy(cursor, 'tickets', TICKET_COPY_COLUMNS, tickets_per_event(rows))
+    finally:
+        cursor.close()
+    return ids
+
+
+def _insert_batch(rows, tickets_per_event):
+    ids = db.session.execute(
+        insert(Event).returning(Event.id, sort_by_parameter_order=True),
+        rows
+    ).scalars().all()
+    for row, event_id in zip(rows, ids):
+        row['id'] = event_id
+
+    if tickets_per_event:
+        db.session.execute(insert(Ticket), list(tickets_per_event(rows)))
+    return ids
+
+
+def _materialized_tickets(rows):
+    for row in rows:
+        for _ in range(row['capacity']):
+            yield {'event_id': row['id'], 'price': row['price'], 'status': 'available', 'created_at': row['created_at']}
+
+
+def import_events(stream, fmt, user_id):
+    """Imports events from a CSV or NDJSON byte stream for `user_id`.
+
+    Returns a report: {'imported', 'failed', 'event_ids', 'errors'}, where
+    errors are {'row': line number, 'error': message} (the first
+    IMPORT_MAX_REPORTED_ERRORS of them).
+    """
+    batch_size = current_app.config['IMPORT_BATCH_SIZE']
+    max_errors = current_app.config['IMPORT_MAX_REPORTED_ERRORS']
+    inventory_mode = current_app.config['TICKET_INVENTORY_MODE']
+    use_copy = db.session.get_bind().dialect.name == 'postgresql'
+    tickets_per_event = _materialized_tickets if inventory_mode == 'materialized' else None
+
+    report = {'imported': 0, 'failed': 0, 'event_ids': [], 'errors': []}
+
+    def fail(line_number, error):
+        report['failed'] += 1
+        if len(report['errors']) < max_errors:
+            report['errors'].append({'row': line_number, 'error': error})
+
+    def flush(batch):
+        rows = [row for _, row in batch]
+        try:
+            if use_copy:
+                ids = _insert_batch_postgres(rows, tickets_per_event)
+            else:
+                ids = _insert_batch(rows, tickets_per_event)
+            index_events(ids)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            # In a real app, you'd want to log this error
+            for line_number, _ in batch:
+                fail(line_number, f'Failed to import event: {str(e)}')
+            return
+        report['imported'] += len(ids)
+        report['event_ids'].extend(ids)
+
+    now = datetime.utcnow()
+    batch = []
+    for line_number, record in _records(stream, fmt):
+        values, error = _validate(record, now)
+        if error:
+            fail(line_number, error)
+            continue
+
+        values.update(
+            tickets_sold=0, inventory_mode=inventory_mode, status='upcoming',
+            created_at=now, updated_at=now, version=1, user_id=user_id
+        )
+        batch.append((line_number, values))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+
+    if batch:
+        flush(batch)
+
+    if report['imported']:
+        invalidate('events')
+    return report
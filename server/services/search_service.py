@@ -0,0 +1,148 @@
+"""
+Full-text search over events
+Postgres ranks matches from a generated tsvector column with a GIN index,
+SQLite from an FTS5 table kept in sync by the event service.
+"""
+
+import json
+import re
+from sqlalchemy import DDL, event as sa_event, func, literal_column, or_, select, text, column, table
+from server.models import db, Event
+
+FTS_TABLE = 'events_fts'
+
+_POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(location, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    'CREATE INDEX IF NOT EXISTS ix_events_search_vector ON events USING GIN (search_vector)'
+]
+
+_SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(name, description, location, tokenize='unicode61')"
+]
+
+# Let db.create_all() build the search structures too (tests, fresh databases)
+for _statement in _POSTGRES_SEARCH_DDL:
+    sa_event.listen(Event.__table__, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+for _statement in _SQLITE_SEARCH_DDL:
+    sa_event.listen(Event.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+sa_event.listen(Event.__table__, 'before_drop', DDL(f'DROP TABLE IF EXISTS {FTS_TABLE}').execute_if(dialect='sqlite'))
+
+
+def include_in_autogenerate(object, name, type_, reflected, compare_to):
+    """Keeps Alembic autogenerate from dropping the search structures,
+    which live outside the ORM models."""
+    if type_ == 'table' and name.startswith(FTS_TABLE):
+        return False
+    if name in ('search_vector', 'ix_events_search_vector'):
+        return False
+    return True
+
+
+def _dialect():
+    return db.session.get_bind().dialect.name
+
+
+def _terms(search):
+    """Splits user input into plain word tokens, dropping query syntax."""
+    return re.findall(r'\w+', search.lower())
+
+
+def index_event(event):
+    """Writes an event's searchable text to the index (call before commit).
+
+    Postgres maintains the generated column itself, so this only has work to
+    do on SQLite.
+    """
+    if _dialect() != 'sqlite':
+        return
+
+    remove_event(event.id)
+    db.session.execute(
+        text(f'INSERT INTO {FTS_TABLE} (rowid, name, description, location) VALUES (:id, :name, :description, :location)'),
+        {'id': event.id, 'name': event.name, 'description': event.description, 'location': event.location}
+    )
+
+
+def remove_event(event_id):
+    """Drops an event from the index (call before commit)."""
+    if _dialect() != 'sqlite':
+        return
+
+    db.session.execute(text(f'DELETE FROM {FTS_TABLE} WHERE rowid = :id'), {'id': event_id})
+
+
+def index_events(event_ids):
+    """Indexes many newly inserted events at once (call before commit)."""
+    if _dialect() != 'sqlite' or not event_ids:
+        return
+
+    db.session.execute(
+        text(
+            f'INSERT INTO {FTS_TABLE} (rowid, name, description, location) '
+            'SELECT id, name, description, location FROM events WHERE id IN (SELECT value FROM json_each(:ids))'
+        ),
+        {'ids': json.dumps(list(event_ids))}
+    )
+
+
+def rebuild_index():
+    """Re-indexes every event, e.g. after rows were bulk loaded."""
+    if _dialect() != 'sqlite':
+        return
+
+    db.session.execute(text(f'DELETE FROM {FTS_TABLE}'))
+    db.session.execute(text(
+        f'INSERT INTO {FTS_TABLE} (rowid, name, description, location) '
+        'SELECT id, name, description, location FROM events'
+    ))
+    db.session.commit()
+
+
+def apply_search(query, search, ranked=True):
+    """Filters an Event query down to full-text matches for `search`.
+
+    Every word must match (as a prefix). With `ranked`, results are ordered by
+    relevance, best first.
+    """
+    terms = _terms(search)
+    if not terms:
+        return query
+
+    dialect = _dialect()
+
+    if dialect == 'postgresql':
+        ts_query = func.to_tsquery('simple', ' & '.join(f'{term}:*' for term in terms))
+        vector = literal_column('events.search_vector')
+        query = query.filter(vector.op('@@')(ts_query))
+        if ranked:
+            query = query.order_by(func.ts_rank(vector, ts_query).desc())
+        return query
+
+    if dialect == 'sqlite':
+        fts = table(FTS_TABLE, column('rowid'))
+        matches = select(
+            fts.c.rowid.label('event_id'),
+            func.bm25(literal_column(FTS_TABLE)).label('rank')
+        ).select_from(fts).where(
+            literal_column(FTS_TABLE).op('MATCH')(' '.join(f'"{term}"*' for term in terms))
+        ).subquery()
+        query = query.join(matches, matches.c.event_id == Event.id)
+        if ranked:
+            query = query.order_by(matches.c.rank)
+        return query
+
+    # No full-text engine: fall back to substring matching
+    for term in terms:
+        query = query.filter(or_(
+            Event.name.ilike(f'%{term}%'),
+            Event.description.ilike(f'%{term}%'),
+            Event.location.ilike(f'%{term}%')
+        ))
+    return query
@@ -1,48 +1,138 @@
 from datetime import datetime
+from sqlalchemy import select, update, insert, func, tuple_
+from sqlalchemy.orm import selectinload
 from server.models import db, Event, Ticket, Transaction
+from server.cache import invalidate_event
+from server.services.hold_service import availability_error, convert_hold, release_expired_holds, reserve_capacity
 
-def purchase_ticket(event_id, user_id):
-    """Purchases a ticket for an event."""
-    event = Event.query.get(event_id)
+def _claim_available_tickets(event_id, user_id, quantity, purchase_date):
+    """Atomically marks up to `quantity` available tickets as sold to a user.
+
+    On Postgres the candidate rows are picked with FOR UPDATE SKIP LOCKED so
+    concurrent buyers each claim a different ticket instead of queueing on the
+    first one. Other backends serialize writers, so the single conditional
+    UPDATE is already atomic there. Returns (ticket_id, price) rows.
+    """
+    candidates = select(Ticket.id).where(
+        Ticket.event_id == event_id,
+        Ticket.status == 'available'
+    ).order_by(Ticket.id).limit(quantity)
+
+    if db.session.get_bind().dialect.name == 'postgresql':
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    claimed = db.session.execute(
+        update(Ticket)
+        .where(Ticket.id.in_(candidates), Ticket.status == 'available')
+        .values(status='sold', user_id=user_id, purchase_date=purchase_date)
+        .returning(Ticket.id, Ticket.price)
+        .execution_options(synchronize_session=False)
+    )
+    return claimed.all()
+
+def _issue_virtual_tickets(event, user_id, quantity, purchase_date):
+    """Creates the sold tickets for seats already taken from the event counters.
+
+    Virtual-inventory events keep no 'available' rows, so the counters are the
+    only gate. Returns (ticket_id, price) rows.
+    """
+    issued = db.session.execute(
+        insert(Ticket).returning(Ticket.id, Ticket.price, sort_by_parameter_order=True),
+        [{
+            'event_id': event.id,
+            'user_id': user_id,
+            'price': event.price,
+            'status': 'sold',
+            'purchase_date': purchase_date
+        } for _ in range(quantity)]
+    )
+    return issued.all()
+
+def purchase_tickets(event_id, user_id, quantity=1, hold_id=None):
+    """Purchases `quantity` tickets for an event in a single transaction.
+
+    With `hold_id` the seats come out of the buyer's hold instead, and the
+    quantity is the hold's.
+    """
+    event = db.session.get(Event, event_id)
     if not event:
         return None, {'error': 'Event not found'}
 
-    if event.date < datetime.utcnow():
+    purchase_date = datetime.utcnow()
+    if event.date < purchase_date:
         return None, {'error': 'Event has already taken place'}
 
-    ticket = Ticket.query.filter_by(
-        event_id=event_id,
-        status='available'
-    ).first()
-
-    if not ticket:
-        return None, {'error': 'No tickets available'}
-
     try:
-        ticket.status = 'sold'
-        ticket.user_id = user_id
-        ticket.purchase_date = datetime.utcnow()
+        # Seats are taken from the counters first (sold + held <= capacity), then issued
+        if hold_id is not None:
+            quantity = convert_hold(hold_id, event_id, user_id, purchase_date)
+            if quantity is None:
+                db.session.rollback()
+                return None, {'error': 'Hold not found or expired'}
+        elif not reserve_capacity(event_id, quantity):
+            # Abandoned carts may be all that is left; free them and try once more
+            if not (release_expired_holds(event_id=event_id, now=purchase_date) and reserve_capacity(event_id, quantity)):
+                db.session.rollback()
+                return None, availability_error(event_id)
 
-        transaction = Transaction(
-            ticket_id=ticket.id,
-            seller_id=event.user_id,
-            buyer_id=user_id,
-            price=ticket.price,
-            transaction_type='primary',
-            status='completed'
-        )
+        if event.inventory_mode == 'virtual':
+            claimed = _issue_virtual_tickets(event, user_id, quantity, purchase_date)
+        else:
+            claimed = _claim_available_tickets(event_id, user_id, quantity, purchase_date)
 
-        event.tickets_sold += 1
+        if len(claimed) < quantity:
+            db.session.rollback()
+            return None, availability_error(event_id)
+
+        db.session.execute(insert(Transaction), [{
+            'ticket_id': ticket_id,
+            'seller_id': event.user_id,
+            'buyer_id': user_id,
+            'price': price,
+            'transaction_type': 'primary',
+            'status': 'completed'
+        } for ticket_id, price in claimed])
 
-        db.session.add(transaction)
         db.session.commit()
+        invalidate_event(event_id)
 
-        return ticket, None
+        ticket_ids = [ticket_id for ticket_id, _ in claimed]
+        tickets = Ticket.query.options(
+            selectinload(Ticket.transactions)
+        ).filter(Ticket.id.in_(ticket_ids)).order_by(Ticket.id).all()
+
+        return tickets, None
 
     except Exception as e:
         db.session.rollback()
         # In a real app, you'd want to log this error
-        return None, {'error': f'Failed to purchase ticket: {str(e)}'}
+        return None, {'error': f'Failed to purchase tickets: {str(e)}'}
+
+def purchase_ticket(event_id, user_id):
+    """Purchases a ticket for an event."""
+    tickets, error = purchase_tickets(event_id, user_id, 1)
+    if error:
+        return None, error
+    return tickets[0], None
+
+def _conflict(message):
+    """An error for a write that lost a race; the client can simply retry."""
+    return {'error': message, 'retryable': True}
+
+def _change_listing(ticket_id, values, **expected):
+    """Applies `values` to a ticket only if its columns still hold `expected`.
+
+    The check and the write are one conditional UPDATE, so of two racing
+    writers exactly one matches; the other sees no row change and fails fast
+    instead of waiting on a lock. Returns True if the ticket was updated.
+    """
+    updated = db.session.execute(
+        update(Ticket)
+        .where(Ticket.id == ticket_id, *(getattr(Ticket, column) == value for column, value in expected.items()))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return updated.rowcount == 1
 
 def resell_ticket(ticket, user_id, price):
     """Puts a ticket up for resale."""
@@ -56,9 +146,12 @@ def resell_ticket(ticket, user_id, price):
         return None, {'error': 'Event has already taken place'}
 
     try:
-        ticket.status = 'resale'
-        ticket.resale_price = price
+        if not _change_listing(ticket.id, {'status': 'resale', 'resale_price': price}, user_id=user_id, status='sold'):
+            db.session.rollback()
+            return None, _conflict('Ticket changed while listing it, please try again')
+
         db.session.commit()
+        invalidate_event(ticket.event_id)
 
         return ticket, None
 
@@ -78,23 +171,28 @@ def purchase_resale_ticket(ticket, user_id):
     if ticket.event.date < datetime.utcnow():
         return None, {'error': 'Event has already taken place'}
 
+    seller_id, price = ticket.user_id, ticket.resale_price
+
     try:
-        transaction = Transaction(
+        # Only the listing the buyer saw can be bought: same seller, same price
+        if not _change_listing(
+            ticket.id,
+            {'status': 'sold', 'user_id': user_id, 'purchase_date': datetime.utcnow(), 'resale_price': None},
+            status='resale', user_id=seller_id, resale_price=price
+        ):
+            db.session.rollback()
+            return None, _conflict('Ticket was sold or its listing changed, please try again')
+
+        db.session.add(Transaction(
             ticket_id=ticket.id,
-            seller_id=ticket.user_id,
+            seller_id=seller_id,
             buyer_id=user_id,
-            price=ticket.resale_price,
+            price=price,
             transaction_type='resale',
             status='completed'
-        )
-
-        ticket.status = 'sold'
-        ticket.user_id = user_id
-        ticket.purchase_date = datetime.utcnow()
-        ticket.resale_price = None
-
-        db.session.add(transaction)
+        ))
         db.session.commit()
+        invalidate_event(ticket.event_id)
 
         return ticket, None
 
@@ -112,9 +210,12 @@ def cancel_resale(ticket, user_id):
         return None, {'error': 'Ticket is not listed for resale'}
 
     try:
-        ticket.status = 'sold'
-        ticket.resale_price = None
+        if not _change_listing(ticket.id, {'status': 'sold', 'resale_price': None}, user_id=user_id, status='resale'):
+            db.session.rollback()
+            return None, _conflict('Ticket was sold or its listing changed, please try again')
+
         db.session.commit()
+        invalidate_event(ticket.event_id)
 
         return ticket, None
 
@@ -122,3 +223,108 @@ def cancel_resale(ticket, user_id):
         db.session.rollback()
         # In a real app, you'd want to log this error
         return None, {'error': f'Failed to cancel resale listing: {str(e)}'}
+
+def resale_order_book(event_id, depth=10):
+    """Summarizes an event's resale listings as an order book.
+
+    Returns the best (lowest) ask, the number of listings and the cheapest
+    `depth` price levels with their quantities, all answered from the
+    (event_id, status, resale_price, id) index without reading tickets.
+    """
+    listed = (Ticket.event_id == event_id, Ticket.status == 'resale')
+
+    listings, best_ask = db.session.execute(
+        select(func.count(Ticket.id), func.min(Ticket.resale_price)).where(*listed)
+    ).one()
+    levels = db.session.execute(
+        select(Ticket.resale_price, func.count(Ticket.id))
+        .where(*listed)
+        .group_by(Ticket.resale_price)
+        .order_by(Ticket.resale_price)
+        .limit(depth)
+    ).all()
+
+    book = []
+    cumulative = 0
+    for price, quantity in levels:
+        cumulative += quantity
+        book.append({'price': price, 'quantity': quantity, 'cumulative_quantity': cumulative})
+
+    return {'event_id': event_id, 'best_ask': best_ask, 'listings': listings, 'depth': book}
+
+def purchase_cheapest_resale(event_id, user_id, quantity, max_price=None):
+    """Buys the `quantity` cheapest resale listings of an event, or none of them.
+
+    Listings are taken in (resale_price, id) order, skipping the buyer's own
+    and any above `max_price`. On Postgres they are locked with FOR UPDATE
+    SKIP LOCKED, so concurrent buyers take different tickets; the UPDATE only
+    moves tickets still listed by the seller and at the price that were read,
+    and anything short of `quantity` rolls back. Returns the sale
+    Transactions in ticket id order, their tickets loaded.
+    """
+    event = db.session.get(Event, event_id)
+    if not event:
+        return None, {'error': 'Event not found'}
+
+    purchase_date = datetime.utcnow()
+    if event.date < purchase_date:
+        return None, {'error': 'Event has already taken place'}
+
+    try:
+        candidates = select(Ticket.id, Ticket.user_id, Ticket.resale_price).where(
+            Ticket.event_id == event_id,
+            Ticket.status == 'resale',
+            Ticket.user_id != user_id
+        )
+        if max_price is not None:
+            candidates = candidates.where(Ticket.resale_price <= max_price)
+        matching = candidates
+        candidates = candidates.order_by(Ticket.resale_price, Ticket.id).limit(quantity)
+        if db.session.get_bind().dialect.name == 'postgresql':
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        listings = db.session.execute(candidates).all()
+        if len(listings) < quantity:
+            db.session.rollback()
+            # Listings locked by other buyers were skipped, and may be back on sale in a moment
+            if db.session.scalar(select(func.count()).select_from(matching.subquery())) >= quantity:
+                return None, _conflict('Resale listings are being bought, please try again')
+            if not listings:
+                return None, {'error': 'No resale tickets available'}
+            return None, {'error': f'Only {len(listings)} resale tickets available'}
+
+        bought = db.session.execute(
+            update(Ticket)
+            .where(
+                tuple_(Ticket.id, Ticket.user_id, Ticket.resale_price).in_([tuple(listing) for listing in listings]),
+                Ticket.status == 'resale'
+            )
+            .values(status='sold', user_id=user_id, purchase_date=purchase_date, resale_price=None)
+            .execution_options(synchronize_session=False)
+        )
+        if bought.rowcount != quantity:
+            db.session.rollback()
+            return None, _conflict('Resale listings changed, please try again')
+
+        transaction_ids = db.session.scalars(insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True), [{
+            'ticket_id': ticket_id,
+            'seller_id': seller_id,
+            'buyer_id': user_id,
+            'price': price,
+            'transaction_type': 'resale',
+            'status': 'completed'
+        } for ticket_id, seller_id, price in listings]).all()
+
+        db.session.commit()
+        invalidate_event(event_id)
+
+        sales = Transaction.query.options(
+            selectinload(Transaction.ticket)
+        ).filter(Transaction.id.in_(transaction_ids)).order_by(Transaction.ticket_id).all()
+
+        return sales, None
+
+    except Exception as e:
+        db.session.rollback()
+        # In a real app, you'd want to log this error
+        return None, {'error': f'Failed to purchase resale tickets: {str(e)}'}
@@ -1,7 +1,11 @@
+import time
 import pytest
+from contextlib import contextmanager
+from sqlalchemy import event
 from server.app import create_app
 from server.models import db as sqlalchemy_db
 from server.config import TestingConfig
+from flask_jwt_extended import create_access_token
 
 @pytest.fixture
 def app():
@@ -22,3 +26,55 @@ def client(app):
 def db(app):
     """A fixture to provide the database instance."""
     return sqlalchemy_db
+
+@pytest.fixture
+def auth_headers(app):
+    """Builds Authorization headers carrying a JWT for the given user id."""
+    def _auth_headers(user_id):
+        return {'Authorization': f'Bearer {create_access_token(identity=user_id)}'}
+    return _auth_headers
+
+@pytest.fixture
+def count_queries(app):
+    """Counts the SQL statements executed inside a `with count_queries() as queries:` block."""
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = sqlalchemy_db.engine
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    return _count_queries
+
+class FakeRedis:
+    """Just enough of the redis client API for RedisCache, the rate limiter and idempotency keys."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value, expires_at = self.store.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self.get(key) is not None:
+            return None
+        self.store[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+@pytest.fixture
+def fake_redis():
+    """An in-memory stand-in for a shared Redis store."""
+    return FakeRedis()
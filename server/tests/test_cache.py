@@ -0,0 +1,74 @@
+import time
+from datetime import datetime, timedelta
+from server.cache import LRUCache, RedisCache, ResponseCache
+from server.services.event_service import create_event, update_event
+from server.services.ticket_service import purchase_ticket
+from server.models import User
+
+def _create(db):
+    user = User(username='organizer', email='organizer@test.com', password='password')
+    db.session.add(user)
+    db.session.commit()
+    event, _ = create_event({
+        'name': 'Sauti Sol Live',
+        'location': 'Nairobi',
+        'description': 'Afro-pop concert',
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': 10
+    }, user.id)
+    return event
+
+def test_lru_cache_ttl_and_eviction():
+    cache = LRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)  # Evicts 'b', the least recently used
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+
+    cache.set('short', 'lived', ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get('short') is None
+
+def test_event_endpoints_cached_until_invalidated(app, db, client, count_queries):
+    with app.app_context():
+        event = _create(db)
+
+        assert client.get(f'/events/{event.id}').headers['X-Cache'] == 'MISS'
+        with count_queries() as queries:
+            response = client.get(f'/events/{event.id}')
+        assert response.headers['X-Cache'] == 'HIT'
+        assert queries == []
+
+        # Query args are normalised, so ordering does not matter
+        assert client.get('/events/?page=1&per_page=5').headers['X-Cache'] == 'MISS'
+        assert client.get('/events/?per_page=5&page=1').headers['X-Cache'] == 'HIT'
+
+        update_event(event, {'name': 'Sauti Sol Unplugged'})
+        response = client.get(f'/events/{event.id}')
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['name'] == 'Sauti Sol Unplugged'
+        assert client.get('/events/?page=1&per_page=5').headers['X-Cache'] == 'MISS'
+
+def test_purchase_invalidates_availability(app, db, client):
+    with app.app_context():
+        event = _create(db)
+
+        assert client.get(f'/tickets/available/{event.id}').get_json()['available_tickets'] == 10
+        purchase_ticket(event.id, 100)
+
+        response = client.get(f'/tickets/available/{event.id}')
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['available_tickets'] == 9
+
+def test_redis_compatible_backend(app, db, client, fake_redis):
+    app.extensions['response_cache'] = ResponseCache(RedisCache(fake_redis), default_ttl=30)
+    with app.app_context():
+        event = _create(db)
+
+        assert client.get(f'/events/{event.id}').headers['X-Cache'] == 'MISS'
+        response = client.get(f'/events/{event.id}')
+        assert response.headers['X-Cache'] == 'HIT'
+        assert response.get_json()['name'] == 'Sauti Sol Live'
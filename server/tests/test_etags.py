@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+import pytest
+from server.services.event_service import create_event, update_event
+from server.services.ticket_service import purchase_ticket
+from server.models import User, Event
+
+def _create(db):
+    user = User(username='organizer', email='organizer@test.com', password='password')
+    db.session.add(user)
+    db.session.commit()
+    event, _ = create_event({
+        'name': 'Sauti Sol Live',
+        'location': 'Nairobi',
+        'description': 'Afro-pop concert',
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': 10
+    }, user.id)
+    return event
+
+def test_version_bumps_on_orm_and_core_updates(app, db):
+    with app.app_context():
+        event = _create(db)
+        assert event.version == 1
+
+        update_event(event, {'name': 'Sauti Sol Unplugged'})
+        assert db.session.get(Event, event.id).version == 2
+
+        purchase_ticket(event.id, 100)  # Counter update issued as a Core UPDATE
+        assert db.session.get(Event, event.id).version == 3
+
+@pytest.mark.parametrize('cache_backend', ['memory', 'none'])
+@pytest.mark.parametrize('url', ['/events/{id}', '/events/', '/events/?cursor='])
+def test_conditional_get(app, db, client, url, cache_backend):
+    if cache_backend == 'none':
+        app.extensions.pop('response_cache')
+    with app.app_context():
+        event = _create(db)
+        url = url.format(id=event.id)
+
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+
+        repeat = client.get(url, headers={'If-None-Match': etag})
+        assert repeat.status_code == 304
+        assert repeat.get_data() == b''
+        assert repeat.headers['ETag'] == etag
+
+        purchase_ticket(event.id, 100)
+
+        changed = client.get(url, headers={'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
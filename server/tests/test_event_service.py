@@ -1,9 +1,20 @@
 from datetime import datetime, timedelta
-from server.services.event_service import create_event
+from server.services.event_service import create_event, virtualize_inventory
 from server.models import User, Event, Ticket
 
+def _event_data(capacity=100):
+    return {
+        'name': 'Test Event',
+        'location': 'Test Location',
+        'description': 'Test Description',
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': capacity
+    }
+
 def test_create_event(app, db):
     """Test creating a new event."""
+    app.config['TICKET_INVENTORY_MODE'] = 'materialized'
     with app.app_context():
         # 1. Create a test user
         user = User(username='testuser', email='test@test.com', password='password')
@@ -31,3 +42,40 @@ def test_create_event(app, db):
 
         # 5. Assert that the tickets were created correctly
         assert Ticket.query.count() == 100
+
+def test_create_event_virtual_inventory(app, db):
+    """Virtual events keep availability on the counter and create no ticket rows."""
+    with app.app_context():
+        user = User(username='testuser', email='test@test.com', password='password')
+        db.session.add(user)
+        db.session.commit()
+
+        new_event, error = create_event(_event_data(capacity=5000), user.id)
+
+        assert error is None
+        assert new_event.inventory_mode == 'virtual'
+        assert new_event.available_tickets == 5000
+        assert Ticket.query.count() == 0
+
+def test_virtualize_inventory(app, db):
+    """Converting a materialized event drops unsold rows and keeps sold ones."""
+    app.config['TICKET_INVENTORY_MODE'] = 'materialized'
+    with app.app_context():
+        user = User(username='testuser', email='test@test.com', password='password')
+        db.session.add(user)
+        db.session.commit()
+
+        event, _ = create_event(_event_data(capacity=10), user.id)
+        sold = Ticket.query.filter_by(event_id=event.id).limit(3).all()
+        for ticket in sold:
+            ticket.status = 'sold'
+        event.tickets_sold = 3
+        db.session.commit()
+
+        event, error = virtualize_inventory(event)
+
+        assert error is None
+        assert event.inventory_mode == 'virtual'
+        assert event.tickets_sold == 3
+        assert event.available_tickets == 7
+        assert Ticket.query.count() == 3
@@ -0,0 +1,98 @@
+import json
+import os
+import requests
+from server.models import ExternalEvent
+from server.services import eventbrite_ingest
+from server.services.eventbrite_service import EventbriteService
+from server.services.eventbrite_ingest import IngestionWorker, ingest_events
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+class RecordedEventbriteService(EventbriteService):
+    """EventbriteService answering from recorded API responses instead of the network."""
+
+    def __init__(self):
+        super().__init__(api_key='recorded')
+        self.requests = []
+
+    def _fetch(self, path, params):
+        self.requests.append(params)
+        with open(os.path.join(FIXTURES, f"eventbrite_search_page{params['page']}.json")) as f:
+            return json.load(f)
+
+def test_ingest_pages_and_deduplicates(app, db):
+    with app.app_context():
+        service = RecordedEventbriteService()
+
+        stats = ingest_events(service, ['Nairobi, Kenya'])
+
+        assert [params['page'] for params in service.requests] == [1, 2]
+        assert stats['pages'] == 2
+        assert ExternalEvent.query.count() == 5  # Event 1003 appears on both pages
+
+        event = ExternalEvent.query.filter_by(external_id='eb_1002').one()
+        assert event.category == 'Tech'
+        assert event.region == 'Nairobi, Kenya'
+        assert event.price == 1000.0
+
+def test_reingest_updates_in_place(app, db):
+    with app.app_context():
+        ingest_events(RecordedEventbriteService(), ['Nairobi, Kenya'])
+        first_ids = {event.external_id: event.id for event in ExternalEvent.query}
+
+        ingest_events(RecordedEventbriteService(), ['Nairobi, Kenya'])
+
+        assert {event.external_id: event.id for event in ExternalEvent.query} == first_ids
+
+def test_reingest_without_on_conflict_support(app, db, monkeypatch):
+    monkeypatch.setattr(eventbrite_ingest, 'UPSERT_INSERTS', {})
+    with app.app_context():
+        ingest_events(RecordedEventbriteService(), ['Nairobi, Kenya'])
+        first_ids = {event.external_id: event.id for event in ExternalEvent.query}
+        ExternalEvent.query.filter_by(external_id='eb_1002').update({'name': 'Stale'})
+        db.session.commit()
+
+        ingest_events(RecordedEventbriteService(), ['Nairobi, Kenya'])
+
+        assert {event.external_id: event.id for event in ExternalEvent.query} == first_ids
+        assert ExternalEvent.query.filter_by(external_id='eb_1002').one().name != 'Stale'
+
+class FlakyEventbriteService(RecordedEventbriteService):
+    """Fails on page 2 the first time it is asked for it."""
+
+    def _fetch(self, path, params):
+        if params['page'] == 2 and not any(request['page'] == 2 for request in self.requests):
+            self.requests.append(params)
+            raise requests.exceptions.ConnectionError('connection reset')
+        return super()._fetch(path, params)
+
+def test_worker_logs_api_errors_and_resumes(app, db, caplog):
+    service = FlakyEventbriteService()
+    worker = IngestionWorker(app, service, ['Nairobi, Kenya'])
+
+    stats = worker.run_once()
+    assert stats['pages'] == 1
+    assert worker.resume_from == {'Nairobi, Kenya': 2}
+    assert 'stopped at page 2' in caplog.text
+
+    stats = worker.run_once()
+    assert [params['page'] for params in service.requests] == [1, 2, 2]
+    assert stats['pages'] == 1 and worker.resume_from == {}
+    with app.app_context():
+        assert ExternalEvent.query.count() == 5
+
+def test_events_endpoint_serves_from_mirror(app, db, client, monkeypatch):
+    app.config['EVENTBRITE_SERVE_FROM_MIRROR'] = True
+    with app.app_context():
+        ingest_events(RecordedEventbriteService(), ['Nairobi, Kenya'])
+
+        def no_live_calls(*args, **kwargs):
+            raise AssertionError('the mirror should answer without calling Eventbrite')
+        monkeypatch.setattr('server.eventbrite.eventbrite_service.search_events', no_live_calls)
+
+        body = client.get('/eventbrite/events?per_page=2').get_json()
+        assert [event['id'] for event in body['events']] == ['eb_1001', 'eb_1002']
+        assert body['total_pages'] == 3
+
+        body = client.get('/eventbrite/events?category=Sports').get_json()
+        assert [event['id'] for event in body['events']] == ['eb_1004']
@@ -0,0 +1,83 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from server.services.eventbrite_service import EventbriteService
+
+def _eventbrite_event(event_id, days_ahead):
+    start = (datetime.utcnow() + timedelta(days=days_ahead)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return {
+        'id': str(event_id),
+        'name': {'text': f'Eventbrite Event {event_id}'},
+        'description': {'text': 'From the stub API'},
+        'start': {'utc': start},
+        'venue': {'name': 'KICC', 'address': {'city': 'Nairobi'}, 'latitude': '-1.2884', 'longitude': '36.8233'},
+        'is_free': True,
+        'capacity': 100,
+        'category': {'short_name': 'music'},
+        'url': f'https://eventbrite.test/e/{event_id}'
+    }
+
+@pytest.fixture
+def stub_api():
+    """A local stand-in for the Eventbrite API that records every request."""
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive
+
+        def do_GET(self):
+            calls.append({'path': self.path, 'client_port': self.client_address[1]})
+            body = json.dumps({
+                'events': [_eventbrite_event(1, 3), _eventbrite_event(2, 5)],
+                'pagination': {'page_count': 1}
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}', calls
+    server.shutdown()
+    server.server_close()
+
+def test_search_results_are_cached(stub_api):
+    base_url, calls = stub_api
+    service = EventbriteService(api_key='test', base_url=base_url)
+
+    first = service.search_events(location='Nairobi, Kenya', page=1)
+    second = service.search_events(location='Nairobi, Kenya', page=1)
+    service.search_events(location='Nairobi, Kenya', page=2)
+
+    assert [event['id'] for event in first['events']] == ['eb_1', 'eb_2']
+    assert second == first
+    assert len(calls) == 2  # The repeat of page 1 never left the process
+
+def test_requests_reuse_pooled_connection(stub_api):
+    base_url, calls = stub_api
+    service = EventbriteService(api_key='test', base_url=base_url)
+
+    for page in range(1, 4):
+        service.search_events(page=page)
+
+    assert len(calls) == 3
+    assert len({call['client_port'] for call in calls}) == 1
+
+def test_events_endpoint_fetches_remote_events(app, client, stub_api, monkeypatch):
+    base_url, calls = stub_api
+    monkeypatch.setattr('server.eventbrite.eventbrite_service', EventbriteService(api_key='test', base_url=base_url))
+
+    with app.app_context():
+        response = client.get('/eventbrite/events')
+
+    assert response.status_code == 200
+    assert len(response.get_json()['events']) == 2
+    assert len(calls) == 1
@@ -0,0 +1,124 @@
+import random
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from server import geo
+from server.models import User, Event
+
+NAIROBI = (-1.2921, 36.8219)
+
+def test_encode_matches_reference_hashes():
+    assert geo.encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+
+def test_haversine_nairobi_to_mombasa():
+    assert geo.haversine_km(*NAIROBI, -4.0435, 39.6682) == pytest.approx(440, abs=5)
+
+@pytest.mark.parametrize('lat, lng, radius', [
+    (-1.2921, 36.8219, 25),
+    (0.01, 36.8, 5),  # Straddles the equator
+    (51.5, -0.01, 2),  # Straddles the prime meridian
+    (64.1, -21.9, 40),  # High latitude
+    (-1.2921, 36.8219, 0.5),
+])
+def test_covering_cells_contain_every_point_in_radius(lat, lng, radius):
+    rng = random.Random(7)
+    cells = geo.covering_cells(lat, lng, radius)
+    assert 0 < len(cells) <= geo.MAX_COVERING_CELLS
+
+    for _ in range(2000):
+        point_lat = lat + rng.uniform(-1, 1) * radius / 110
+        point_lng = lng + rng.uniform(-1, 1) * radius / 50
+        if geo.haversine_km(lat, lng, point_lat, point_lng) <= radius:
+            assert any(geo.encode(point_lat, point_lng).startswith(cell) for cell in cells)
+
+def test_covering_cells_fall_back_to_full_scan_for_huge_radius():
+    assert geo.covering_cells(*NAIROBI, 15000) == ['']
+
+def _seed(db, count=500):
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    db.session.execute(insert(User), [{'username': 'organizer', 'email': 'organizer@test.com', 'password_hash': 'x'}])
+    rows = []
+    for i in range(count):
+        lat, lng = NAIROBI[0] + rng.uniform(-1, 1), NAIROBI[1] + rng.uniform(-1, 1)
+        rows.append({
+            'name': f'Event {i}',
+            'location': 'Kenya',
+            'location_lat': lat,
+            'location_lng': lng,
+            'geohash': geo.encode(lat, lng),
+            'description': 'Seeded event',
+            'date': now + timedelta(days=1) if i % 10 else now - timedelta(days=1),
+            'price': 100.0,
+            'capacity': 10,
+            'status': 'upcoming',
+            'category': 'Music' if i % 2 else 'Tech',
+            'user_id': 1
+        })
+    db.session.execute(insert(Event), rows)
+    db.session.commit()
+    return rows
+
+def test_nearby_matches_brute_force(app, db):
+    with app.app_context():
+        rows = _seed(db)
+
+        matches = geo.nearby(Event.query, Event.id, Event.geohash, Event.location_lat, Event.location_lng, *NAIROBI, 20, limit=1000)
+
+        expected = sorted(
+            (geo.haversine_km(*NAIROBI, row['location_lat'], row['location_lng']), row['name'])
+            for row in rows
+            if geo.haversine_km(*NAIROBI, row['location_lat'], row['location_lng']) <= 20
+        )
+        assert expected
+        assert [(distance, event.name) for event, distance in matches] == expected
+
+def test_near_me_endpoint_returns_upcoming_events_by_distance(app, client, db):
+    with app.app_context():
+        _seed(db)
+
+    response = client.get('/events/near-me', query_string={'lat': NAIROBI[0], 'lng': NAIROBI[1], 'radius': 30, 'category': 'Music', 'limit': 5})
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['source'] == 'local'
+    distances = [event['distance_km'] for event in data['events']]
+    assert len(distances) == 5
+    assert distances == sorted(distances)
+    assert all(distance <= 30 for distance in distances)
+    assert all(event['category'] == 'Music' for event in data['events'])
+    assert all(datetime.strptime(event['date'], '%Y-%m-%d %H:%M:%S') > datetime.utcnow() for event in data['events'])
+
+def test_near_me_endpoint_requires_coordinates(client):
+    assert client.get('/events/near-me').status_code == 400
+    assert client.get('/events/near-me', query_string={'lat': 95, 'lng': 0}).status_code == 400
+
+@pytest.mark.parametrize('params', [
+    {'lat': 'nan', 'lng': 36.8},
+    {'lat': -1.3, 'lng': 'inf'},
+    {'lat': -1.3, 'lng': 36.8, 'radius': 'nan'},
+    {'lat': -1.3, 'lng': 36.8, 'radius': '-inf'}
+])
+def test_near_me_endpoint_rejects_non_finite_values(client, db, params):
+    assert client.get('/events/near-me', query_string=params).status_code == 400
+
+def test_event_service_maintains_geohash(app, client, db, auth_headers):
+    with app.app_context():
+        db.session.add(User(username='organizer', email='organizer@test.com', password_hash='x'))
+        db.session.commit()
+
+    response = client.post('/events/', headers=auth_headers('1'), json={
+        'name': 'Jazz Night',
+        'location': 'Nairobi',
+        'location_lat': NAIROBI[0],
+        'location_lng': NAIROBI[1],
+        'description': 'Live jazz',
+        'date': (datetime.utcnow() + timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 500,
+        'capacity': 50
+    })
+    assert response.status_code == 201
+
+    with app.app_context():
+        event = db.session.get(Event, response.get_json()['id'])
+        assert event.geohash == geo.encode(*NAIROBI)
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+import pytest
+from server.services.event_service import create_event
+from server.services.hold_service import place_hold, extend_hold, release_hold, release_expired_holds, HoldSweeper
+from server.services.ticket_service import purchase_tickets
+from server.models import User, Event, Ticket, TicketHold
+
+@pytest.fixture(params=['virtual', 'materialized'])
+def inventory_mode(request, app):
+    """Runs a test against both ticket inventory modes."""
+    app.config['TICKET_INVENTORY_MODE'] = request.param
+    return request.param
+
+def _make_event(db, capacity=5):
+    organizer = User(username='organizer', email='organizer@test.com', password='password')
+    db.session.add(organizer)
+    db.session.commit()
+
+    event, error = create_event({
+        'name': 'Test Event',
+        'location': 'Test Location',
+        'description': 'Test Description',
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': capacity
+    }, organizer.id)
+    assert error is None
+    return event.id
+
+def _counters(db, event_id):
+    event = db.session.get(Event, event_id)
+    db.session.refresh(event)
+    return event.tickets_sold, event.tickets_held, event.available_tickets
+
+def test_hold_takes_seats_off_sale_until_purchased(app, db, inventory_mode):
+    with app.app_context():
+        event_id = _make_event(db, capacity=3)
+
+        hold, error = place_hold(event_id, 100, 2)
+        assert error is None
+        assert _counters(db, event_id) == (0, 2, 1)
+
+        # Only the unheld seat is for sale
+        assert purchase_tickets(event_id, 200, 2) == (None, {'error': 'Only 1 tickets available'})
+
+        tickets, error = purchase_tickets(event_id, 100, hold_id=hold.id)
+        assert error is None
+        assert [ticket.user_id for ticket in tickets] == [100, 100]
+        assert _counters(db, event_id) == (2, 0, 1)
+        assert db.session.get(TicketHold, hold.id).status == 'converted'
+
+        # A hold is bought once
+        assert purchase_tickets(event_id, 100, hold_id=hold.id) == (None, {'error': 'Hold not found or expired'})
+
+def test_hold_belongs_to_its_buyer(app, db):
+    with app.app_context():
+        event_id = _make_event(db)
+        hold, _ = place_hold(event_id, 100, 1)
+
+        assert purchase_tickets(event_id, 200, hold_id=hold.id) == (None, {'error': 'Hold not found or expired'})
+        assert release_hold(hold, 200) == (None, {'error': 'Unauthorized'})
+        assert extend_hold(hold, 200) == (None, {'error': 'Unauthorized'})
+
+def test_release_returns_seats(app, db, client):
+    with app.app_context():
+        event_id = _make_event(db, capacity=2)
+        hold, _ = place_hold(event_id, 100, 2)
+        assert client.get(f'/tickets/available/{event_id}').get_json()['available_tickets'] == 0
+
+        released, error = release_hold(hold, 100)
+        assert error is None
+        assert released.status == 'released'
+        assert _counters(db, event_id) == (0, 0, 2)
+        assert release_hold(hold, 100) == (None, {'error': 'Hold is no longer active'})
+        # The cached availability was invalidated
+        assert client.get(f'/tickets/available/{event_id}').get_json()['available_tickets'] == 2
+
+def test_extend_is_capped(app, db):
+    app.config['HOLD_TTL_SECONDS'] = 60
+    app.config['HOLD_MAX_SECONDS'] = 90
+    with app.app_context():
+        event_id = _make_event(db)
+        hold, _ = place_hold(event_id, 100, 1)
+
+        # Placed 45 seconds ago
+        hold.created_at -= timedelta(seconds=45)
+        hold.expires_at -= timedelta(seconds=45)
+        db.session.commit()
+        first_expiry = hold.expires_at
+        extended, error = extend_hold(hold, 100)
+        assert error is None
+        assert extended.expires_at == hold.created_at + timedelta(seconds=90)
+        assert extended.expires_at > first_expiry
+
+        assert extend_hold(hold, 100) == (None, {'error': 'Hold cannot be extended any further'})
+
+def test_sweeper_expires_holds_in_batches(app, db, inventory_mode):
+    with app.app_context():
+        event_id = _make_event(db, capacity=10)
+        holds = [place_hold(event_id, 100 + i, 1)[0] for i in range(5)]
+        later = datetime.utcnow() + timedelta(seconds=app.config['HOLD_TTL_SECONDS'] + 1)
+
+        assert release_expired_holds(batch_size=2) == 0  # Nothing has expired yet
+        assert release_expired_holds(batch_size=2, now=later) == 5
+
+        assert {hold.status for hold in TicketHold.query} == {'expired'}
+        assert _counters(db, event_id) == (0, 0, 10)
+        assert purchase_tickets(event_id, 100, hold_id=holds[0].id) == (None, {'error': 'Hold not found or expired'})
+        assert release_expired_holds(now=later) == 0
+
+def test_sold_out_event_sweeps_its_own_expired_holds(app, db, inventory_mode):
+    with app.app_context():
+        event_id = _make_event(db, capacity=2)
+        hold, _ = place_hold(event_id, 100, 2)
+        hold.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+        tickets, error = purchase_tickets(event_id, 200, 2)
+        assert error is None
+        assert _counters(db, event_id) == (2, 0, 0)
+        assert db.session.get(TicketHold, hold.id).status == 'expired'
+        assert Ticket.query.filter_by(status='sold').count() == 2
+
+def test_hold_sweeper_run_once(app, db):
+    with app.app_context():
+        event_id = _make_event(db)
+        hold, _ = place_hold(event_id, 100, 3)
+        hold.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+    assert HoldSweeper(app, batch_size=10).run_once() == 1
+
+    with app.app_context():
+        assert _counters(db, event_id) == (0, 0, 5)
+
+def test_hold_endpoints(app, db, client, auth_headers):
+    with app.app_context():
+        event_id = _make_event(db, capacity=4)
+        db.session.add(User(id=100, username='buyer', email='buyer@test.com', password='password'))
+        db.session.commit()
+        headers = auth_headers('100')
+
+    response = client.post(f'/tickets/holds/event/{event_id}', headers=headers, json={'quantity': 3})
+    assert response.status_code == 201
+    hold = response.get_json()
+    assert hold['quantity'] == 3 and hold['status'] == 'active'
+
+    assert client.post(f'/tickets/holds/event/{event_id}', headers=headers, json={'quantity': 2}).get_json() == {'error': 'Only 1 tickets available'}
+    response = client.post(f'/tickets/holds/{hold["hold_id"]}/extend', headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['expires_at'] >= hold['expires_at']
+
+    response = client.post(f'/tickets/purchase/{event_id}', headers=headers, json={'hold_id': hold['hold_id']})
+    assert response.status_code == 201
+    assert response.get_json()['quantity'] == 3
+
+    assert client.delete(f'/tickets/holds/{hold["hold_id"]}', headers=headers).get_json() == {'error': 'Hold is no longer active'}
+    assert client.delete('/tickets/holds/999', headers=headers).status_code == 404
+    assert client.post(f'/tickets/holds/event/{event_id}', headers=headers, json=[3]).status_code == 400
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+import pytest
+from server.cache import RedisCache
+from server.idempotency import IdempotencyStore, _fingerprint
+from server.models import User, Event, Ticket
+
+@pytest.fixture
+def event_id(app, db):
+    with app.app_context():
+        db.session.add_all([
+            User(username='organizer', email='organizer@test.com', password='password'),
+            User(username='alice', email='alice@test.com', password='password'),
+            User(username='bob', email='bob@test.com', password='password')
+        ])
+        event = Event(
+            name='Sauti Sol Live', location='Nairobi', description='Concert', price=1500, capacity=10,
+            date=datetime.utcnow() + timedelta(days=7), user_id=1
+        )
+        db.session.add(event)
+        db.session.commit()
+        return event.id
+
+def _post(client, auth_headers, path, user_id, key, body=None):
+    return client.post(path, json={'quantity': 2} if body is None else body, headers={**auth_headers(user_id), 'Idempotency-Key': key})
+
+def test_retried_purchase_is_replayed_without_a_write(app, client, auth_headers, event_id, count_queries):
+    first = _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1')
+    assert first.status_code == 201
+
+    with count_queries() as statements:
+        retry = _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1')
+
+    assert statements == []
+    assert retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    with app.app_context():
+        assert Ticket.query.count() == 2
+
+def test_key_reused_for_a_different_request(client, auth_headers, event_id):
+    assert _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1').status_code == 201
+
+    response = _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1', {'quantity': 3})
+
+    assert response.status_code == 422
+
+def test_keys_are_scoped_to_the_user(app, client, auth_headers, event_id):
+    assert _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1').status_code == 201
+    assert 'Idempotent-Replayed' not in _post(client, auth_headers, f'/tickets/purchase/{event_id}', 3, 'order-1').headers
+
+    with app.app_context():
+        assert Ticket.query.count() == 4
+
+def test_request_in_flight_gets_409(app, client, auth_headers, event_id):
+    # Claim the key the way a concurrent first request would
+    with app.test_request_context(f'/tickets/purchase/{event_id}', method='POST', json={'quantity': 2}):
+        fingerprint = _fingerprint()
+    assert app.extensions['idempotency'].begin('idem:2:tickets.purchase_ticket:order-1', fingerprint) is None
+
+    response = _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1')
+
+    assert response.status_code == 409
+    assert response.headers['Retry-After'] == '1'
+    with app.app_context():
+        assert Ticket.query.count() == 0
+
+def test_errors_are_replayed_but_server_failures_are_not(app, client, auth_headers, event_id):
+    assert _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1', {'quantity': 11}).status_code == 400
+    assert _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1', {'quantity': 11}).headers['Idempotent-Replayed'] == 'true'
+
+    store = IdempotencyStore(app.extensions['idempotency'].backend)
+    response = app.response_class('{}', status=503, mimetype='application/json')
+    assert store.begin('k', 'f') is None
+    store.finish('k', 'f', response)
+    assert store.begin('k', 'f') is None
+
+def test_resale_endpoints_are_idempotent(app, db, client, auth_headers, event_id):
+    ticket_id = _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1', {'quantity': 1}).get_json()['ticket_id']
+    assert _post(client, auth_headers, f'/tickets/resell/{ticket_id}', 2, 'list-1', {'price': 2000}).status_code == 200
+
+    first = _post(client, auth_headers, f'/tickets/purchase-resale/{ticket_id}', 3, 'buy-1', {})
+    retry = _post(client, auth_headers, f'/tickets/purchase-resale/{ticket_id}', 3, 'buy-1', {})
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    with app.app_context():
+        assert db.session.get(Ticket, ticket_id).user_id == 3
+
+def test_store_over_a_shared_backend(app, fake_redis):
+    store = IdempotencyStore(RedisCache(fake_redis), ttl=60)
+
+    assert store.begin('idem:2:purchase:k', 'f') is None
+    assert store.begin('idem:2:purchase:k', 'f') == {'fingerprint': 'f'}
+
+    store.finish('idem:2:purchase:k', 'f', app.response_class('{"ok": true}', status=201, mimetype='application/json'))
+    assert store.begin('idem:2:purchase:k', 'f')['response'] == {'status': 201, 'body': '{"ok": true}', 'mimetype': 'application/json'}
+
+def test_idempotency_headers_work_cross_origin(client, auth_headers, event_id):
+    origin = {'Origin': 'http://localhost:5173'}
+    preflight = client.options(f'/tickets/purchase/{event_id}', headers={
+        **origin,
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'authorization, content-type, idempotency-key'
+    })
+    assert 'idempotency-key' in preflight.headers['Access-Control-Allow-Headers'].lower()
+
+    _post(client, auth_headers, f'/tickets/purchase/{event_id}', 2, 'order-1')
+    retry = client.post(f'/tickets/purchase/{event_id}', json={'quantity': 2}, headers={**auth_headers(2), **origin, 'Idempotency-Key': 'order-1'})
+    exposed = retry.headers['Access-Control-Expose-Headers'].lower()
+    assert 'idempotent-replayed' in exposed and 'retry-after' in exposed
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from server.models import User, Event
+
+def _user(db, username='alice'):
+    user = User(username=username, email=f'{username}@test.com', password='password')
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+def _user_selects(statements):
+    return [statement for statement in statements if 'FROM users' in statement]
+
+def test_authenticated_requests_reuse_cached_user(app, db, client, auth_headers, count_queries):
+    with app.app_context():
+        headers = auth_headers(_user(db))
+
+    with count_queries() as first:
+        assert client.get('/auth/profile', headers=headers).status_code == 200
+    with count_queries() as second:
+        response = client.get('/auth/profile', headers=headers)
+
+    assert response.get_json()['username'] == 'alice'
+    assert len(_user_selects(first)) == 1
+    assert _user_selects(second) == []
+
+def test_profile_update_invalidates_cached_user(app, db, client, auth_headers):
+    with app.app_context():
+        headers = auth_headers(_user(db))
+
+    assert client.get('/auth/profile', headers=headers).get_json()['username'] == 'alice'
+    response = client.put('/auth/profile', headers=headers, json={'username': 'alicia'})
+    assert response.status_code == 200
+
+    assert client.get('/auth/profile', headers=headers).get_json()['username'] == 'alicia'
+    with app.app_context():
+        assert User.query.one().username == 'alicia'
+
+def test_unknown_user_is_rejected(app, db, client, auth_headers):
+    response = client.get('/auth/profile', headers=auth_headers(42))
+
+    assert response.status_code == 404
+    assert response.get_json() == {'error': 'User not found'}
+
+def test_owner_can_update_event(app, db, client, auth_headers):
+    """Ownership checks compare the event owner with the loaded user."""
+    with app.app_context():
+        owner_headers = auth_headers(_user(db, 'owner'))
+        other_headers = auth_headers(_user(db, 'other'))
+
+    response = client.post('/events/', headers=owner_headers, json={
+        'name': 'Jazz Night',
+        'location': 'Nairobi',
+        'description': 'Live jazz',
+        'date': (datetime.utcnow() + timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 500,
+        'capacity': 50
+    })
+    event_id = response.get_json()['id']
+
+    assert client.put(f'/events/{event_id}', headers=other_headers, json={'name': 'Hijacked'}).status_code == 403
+    response = client.put(f'/events/{event_id}', headers=owner_headers, json={'name': 'Jazz Night II'})
+    assert response.status_code == 200
+    with app.app_context():
+        assert db.session.get(Event, event_id).name == 'Jazz Night II'
@@ -0,0 +1,137 @@
+import json
+from datetime import datetime, timedelta
+import pytest
+from server.models import User, Event, Ticket
+from server.services.search_service import apply_search
+from server.services.import_service import _copy
+
+FUTURE = (datetime.utcnow() + timedelta(days=30)).strftime('%Y-%m-%d %H:%M:%S')
+PAST = (datetime.utcnow() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+
+CSV = f"""name,location,description,date,price,capacity,category,location_lat,location_lng
+Sauti Sol Live,Nairobi,Afro-pop concert,{FUTURE},1500,100,Music,-1.2921,36.8219
+Old Show,Nairobi,Already happened,{PAST},100,10,Music,,
+Tech Summit,Mombasa,"Talks, workshops and demos",{FUTURE},0,50,Tech,,
+Bad Price,Nairobi,Broken row,{FUTURE},free,10,Music,,
+""".encode()
+
+@pytest.fixture
+def organizer(app, db, auth_headers):
+    with app.app_context():
+        db.session.add(User(username='organizer', email='organizer@test.com', password='password'))
+        db.session.commit()
+    return auth_headers(1)
+
+def test_csv_import_reports_bad_rows_and_keeps_the_rest(app, db, client, organizer):
+    response = client.post('/events/import', data=CSV, headers=organizer, content_type='text/csv')
+
+    assert response.status_code == 201
+    report = response.get_json()
+    assert report['imported'] == 2
+    assert report['failed'] == 2
+    assert report['errors'] == [
+        {'row': 3, 'error': 'Event date must be in the future'},
+        {'row': 5, 'error': 'Invalid price, capacity, coordinates or date format'}
+    ]
+
+    with app.app_context():
+        events = Event.query.order_by(Event.id).all()
+        assert [event.name for event in events] == ['Sauti Sol Live', 'Tech Summit']
+        assert events[0].geohash is not None and events[1].geohash is None
+        assert events[1].description == 'Talks, workshops and demos'
+        assert all(event.user_id == 1 and event.inventory_mode == 'virtual' for event in events)
+        assert Ticket.query.count() == 0
+        # Imported events are searchable straight away
+        assert [event.name for event in apply_search(Event.query, 'workshops')] == ['Tech Summit']
+
+def test_ndjson_import_in_batches_with_materialized_inventory(app, db, client, organizer):
+    app.config['IMPORT_BATCH_SIZE'] = 2
+    app.config['TICKET_INVENTORY_MODE'] = 'materialized'
+    lines = [json.dumps({'name': f'Event {i}', 'location': 'Kisumu', 'description': 'Imported', 'date': FUTURE, 'price': 200, 'capacity': 3}) for i in range(5)]
+    lines.insert(2, '{not json')
+    lines.append(json.dumps({'name': 'No capacity', 'location': 'Kisumu', 'description': 'Imported', 'date': FUTURE, 'price': 200}))
+
+    response = client.post('/events/import?format=ndjson', data='\n'.join(lines), headers=organizer)
+
+    report = response.get_json()
+    assert report['imported'] == 5
+    assert report['errors'] == [
+        {'row': 3, 'error': 'Malformed record'},
+        {'row': 7, 'error': 'Missing required fields: capacity'}
+    ]
+    with app.app_context():
+        assert Event.query.count() == 5
+        assert Ticket.query.filter_by(status='available').count() == 15
+        assert {ticket.event_id for ticket in Ticket.query} == set(report['event_ids'])
+
+def test_ndjson_import_rejects_non_text_image_and_category(app, db, client, organizer):
+    event = {'name': 'Gig', 'location': 'Kisumu', 'description': 'Imported', 'date': FUTURE, 'price': 200, 'capacity': 3}
+    lines = [
+        json.dumps({**event, 'category': 'Music', 'image': 'https://example.com/gig.png'}),
+        json.dumps({**event, 'category': ['Music']}),
+        json.dumps({**event, 'image': {'url': 'x'}, 'category': 7})
+    ]
+
+    report = client.post('/events/import?format=ndjson', data='\n'.join(lines), headers=organizer).get_json()
+
+    assert report['imported'] == 1
+    assert report['errors'] == [
+        {'row': 2, 'error': 'Fields must be text: category'},
+        {'row': 3, 'error': 'Fields must be text: image, category'}
+    ]
+    with app.app_context():
+        assert Event.query.one().category == 'Music'
+
+def test_csv_import_rejects_non_finite_and_out_of_range_values(app, db, client, organizer):
+    rows = [
+        ('nan', '36.8', '100'),
+        ('-1.3', 'inf', '100'),
+        ('91', '36.8', '100'),
+        ('-1.3', '-181', '100'),
+        ('-1.3', '36.8', 'nan'),
+        ('-1.3', '36.8', '100')
+    ]
+    csv_body = 'name,location,description,date,price,capacity,location_lat,location_lng\n' + ''.join(
+        f'Gig {i},Nairobi,Imported,{FUTURE},{price},10,{lat},{lng}\n' for i, (lat, lng, price) in enumerate(rows)
+    )
+
+    report = client.post('/events/import', data=csv_body.encode(), headers=organizer, content_type='text/csv').get_json()
+
+    invalid = 'Invalid price, capacity, coordinates or date format'
+    out_of_range = 'Coordinates must be within -90 to 90 latitude and -180 to 180 longitude'
+    assert report['imported'] == 1
+    assert [error['error'] for error in report['errors']] == [invalid, invalid, out_of_range, out_of_range, invalid]
+    with app.app_context():
+        assert Event.query.one().name == 'Gig 5'
+
+def test_ndjson_import_rejects_infinite_capacity(client, organizer):
+    record = '{"name": "Gig", "location": "Kisumu", "description": "Imported", "date": "%s", "price": 1, "capacity": Infinity}' % FUTURE
+
+    report = client.post('/events/import?format=ndjson', data=record, headers=organizer).get_json()
+
+    assert report['errors'] == [{'row': 1, 'error': 'Invalid price, capacity, coordinates or date format'}]
+
+def test_import_invalidates_cached_listings(app, db, client, organizer):
+    assert client.get('/events/').get_json()['events'] == []
+
+    client.post('/events/import', data=CSV, headers=organizer, content_type='text/csv')
+
+    assert len(client.get('/events/').get_json()['events']) == 2
+
+def test_import_rejects_unknown_format(client, organizer):
+    response = client.post('/events/import', data=b'<events/>', headers=organizer, content_type='application/xml')
+
+    assert response.status_code == 415
+
+def test_copy_buffer_distinguishes_null_from_empty():
+    class Cursor:
+        def copy_expert(self, sql, buffer):
+            self.sql, self.data = sql, buffer.read()
+
+    cursor = Cursor()
+    _copy(cursor, 'events', ('name', 'image', 'category', 'date'), [
+        {'name': 'Say "hi", Nairobi', 'image': None, 'category': '', 'date': datetime(2030, 1, 2, 18, 30)}
+    ])
+
+    assert cursor.sql == 'COPY events (name, image, category, date) FROM STDIN WITH (FORMAT csv)'
+    assert cursor.data == '"Say ""hi"", Nairobi",,"","2030-01-02 18:30:00"\n'
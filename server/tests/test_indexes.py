@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from server.models import User, Event, Ticket, Transaction
+
+def _seed(db):
+    """Loads enough rows that the planner has a real choice to make."""
+    now = datetime.utcnow()
+    db.session.execute(insert(User), [{
+        'username': f'user{i}',
+        'email': f'user{i}@test.com',
+        'password_hash': 'x'
+    } for i in range(50)])
+    db.session.execute(insert(Event), [{
+        'name': f'Event {i}',
+        'location': 'Nairobi',
+        'description': 'Seeded event',
+        'date': now + timedelta(days=i),
+        'price': 100.0,
+        'capacity': 10,
+        'status': 'upcoming' if i % 3 else 'completed',
+        'category': ['Music', 'Tech', 'Food'][i % 3],
+        'user_id': i % 50 + 1
+    } for i in range(200)])
+    db.session.execute(insert(Ticket), [{
+        'event_id': i % 200 + 1,
+        'user_id': i % 50 + 1 if i % 2 else None,
+        'price': 100.0,
+        'status': 'sold' if i % 2 else 'available'
+    } for i in range(2000)])
+    db.session.execute(insert(Transaction), [{
+        'ticket_id': i * 2 + 1,
+        'buyer_id': i % 50 + 1,
+        'price': 100.0,
+        'transaction_type': 'primary'
+    } for i in range(1000)])
+    db.session.commit()
+    db.session.connection().exec_driver_sql('ANALYZE')
+
+def _query_plan(db, query):
+    compiled = query.statement.compile(dialect=db.engine.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', params).all()
+    return ' | '.join(row[-1] for row in rows)
+
+@pytest.mark.parametrize('build_query, index_name', [
+    (lambda: Ticket.query.filter_by(event_id=7, status='available'), 'ix_tickets_event_id_status_resale_price'),
+    (lambda: Ticket.query.filter_by(event_id=7, status='resale').order_by(Ticket.resale_price, Ticket.id), 'ix_tickets_event_id_status_resale_price'),
+    (lambda: Ticket.query.filter_by(user_id=3), 'ix_tickets_user_id_purchase_date'),
+    (lambda: Ticket.query.filter_by(user_id=3).order_by(Ticket.purchase_date.desc(), Ticket.id.desc()), 'ix_tickets_user_id_purchase_date'),
+    (lambda: Event.query.filter(Event.status == 'upcoming').order_by(Event.date), 'ix_events_status_date'),
+    (lambda: Event.query.filter_by(category='Music'), 'ix_events_category'),
+    (lambda: Event.query.filter_by(user_id=3), 'ix_events_user_id'),
+    (lambda: Event.query.filter(Event.geohash >= 'kzf0', Event.geohash < 'kzf0{'), 'ix_events_geohash'),
+    (lambda: Transaction.query.filter_by(ticket_id=5), 'ix_transactions_ticket_id'),
+    (lambda: User.query.filter_by(username='user3'), 'ix_users_username'),
+])
+def test_hot_queries_use_index(app, db, build_query, index_name):
+    """The filters behind the API routes are answered from an index, not a table scan."""
+    with app.app_context():
+        _seed(db)
+
+        plan = _query_plan(db, build_query())
+
+        assert index_name in plan
+        assert 'SCAN' not in plan.replace(f'SCAN {index_name}', '')
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from server.app import create_app
+from server.config import TestingConfig
+from server.models import db as sqlalchemy_db, Event
+
+class MetricsConfig(TestingConfig):
+    METRICS_ENABLED = True
+
+def test_metrics_disabled_by_default(client):
+    response = client.get('/events/')
+    assert 'Server-Timing' not in response.headers
+    assert client.get('/metrics').status_code == 404
+
+def test_metrics_and_server_timing():
+    app = create_app(MetricsConfig)
+    with app.app_context():
+        sqlalchemy_db.create_all()
+        sqlalchemy_db.session.add(Event(
+            name='Test Event',
+            location='Nairobi',
+            description='Test Description',
+            date=datetime.utcnow() + timedelta(days=1),
+            price=10.0,
+            capacity=10,
+            status='upcoming'
+        ))
+        sqlalchemy_db.session.commit()
+
+        client = app.test_client()
+        response = client.get('/events/')
+        assert response.status_code == 200
+        assert 'app;dur=' in response.headers['Server-Timing']
+        assert 'desc="2 queries"' in response.headers['Server-Timing']
+
+        body = client.get('/metrics').get_data(as_text=True)
+        assert 'ticketi_http_requests_total{endpoint="events.get_events",method="GET",status="200"} 1' in body
+        assert 'ticketi_db_statements_total{endpoint="events.get_events"} 2' in body
+        assert 'ticketi_http_request_duration_seconds_count{endpoint="events.get_events",method="GET"} 1' in body
+        assert 'ticketi_db_slowest_statement_seconds{statement="SELECT' in body
+
+        sqlalchemy_db.drop_all()
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from server.models import Event, ExternalEvent
+from server.services.eventbrite_service import eventbrite_service
+
+def _seed(db, local_count=7, remote_count=9):
+    base = datetime.utcnow() + timedelta(days=1)
+    db.session.execute(insert(Event), [{
+        'name': f'Local {i}',
+        'location': 'Nairobi',
+        'description': 'Local event',
+        'date': base + timedelta(hours=2 * i),
+        'price': 100.0,
+        'capacity': 10,
+        'status': 'upcoming'
+    } for i in range(local_count)])
+    remote = [{
+        'external_id': f'eb_{i}',
+        'source': 'eventbrite',
+        'region': 'Nairobi, Kenya',
+        'name': f'Remote {i}',
+        'date': base + timedelta(hours=3 * i),  # Some timestamps collide with local ones
+        'category': 'Music'
+    } for i in range(remote_count)]
+    if remote:
+        db.session.execute(insert(ExternalEvent), remote)
+    db.session.commit()
+
+def _expected_order():
+    rows = [(e.date, 'local', e.id, e.name) for e in Event.query] + \
+           [(e.date, 'eventbrite', e.id, e.name) for e in ExternalEvent.query]
+    return [row[3] for row in sorted(rows, reverse=True)]
+
+def test_mixed_cursor_streams_every_event_once(app, db, client):
+    with app.app_context():
+        _seed(db)
+
+        names = []
+        cursor = ''
+        while True:
+            body = client.get('/eventbrite/events/mixed', query_string={'cursor': cursor, 'per_page': 4}).get_json()
+            assert len(body['events']) <= 4
+            names.extend(event['name'] for event in body['events'])
+            if not body['has_next']:
+                break
+            cursor = body['next_cursor']
+
+        assert names == _expected_order()
+
+def test_mixed_page_mode_has_deep_pages_and_totals(app, db, client):
+    with app.app_context():
+        _seed(db)
+
+        body = client.get('/eventbrite/events/mixed?page=3&per_page=5').get_json()
+
+        assert body['total_events'] == 16
+        assert body['total_pages'] == 4
+        assert [event['name'] for event in body['events']] == _expected_order()[10:15]
+        assert body['local_count'] + body['eventbrite_count'] == 5
+
+def test_mixed_feed_only_has_upcoming_events(app, db, client):
+    with app.app_context():
+        _seed(db, local_count=2, remote_count=2)
+        past = datetime.utcnow() - timedelta(days=1)
+        db.session.add(Event(name='Local past', location='Nairobi', description='Over', date=past, price=100.0, capacity=10))
+        db.session.add(ExternalEvent(external_id='eb_past', source='eventbrite', region='Nairobi, Kenya', name='Remote past', date=past))
+        db.session.commit()
+
+        body = client.get('/eventbrite/events/mixed?per_page=10').get_json()
+
+        assert body['total_events'] == 4
+        assert [event['name'] for event in body['events']] == ['Remote 1', 'Local 1', 'Local 0', 'Remote 0']
+
+def _fake_live_search(monkeypatch, remote):
+    """Serves `remote` (a list of event dicts) as the live API would, latest first."""
+    calls = []
+    ordered = sorted(remote, key=lambda event: event['date'], reverse=True)
+
+    def search_events(page=1, per_page=20, sort_by=None, **kwargs):
+        calls.append((page, per_page, sort_by))
+        return {
+            'events': ordered[(page - 1) * per_page:page * per_page],
+            'pagination': {'object_count': len(ordered)}
+        }
+    monkeypatch.setattr(eventbrite_service, 'search_events', search_events)
+    return calls
+
+def test_mixed_feed_goes_live_while_the_mirror_is_stale(app, db, client, monkeypatch):
+    with app.app_context():
+        _seed(db)
+        remote = [dict(event.to_dict(), id=f'live_{event.id}') for event in ExternalEvent.query]
+        expected = _expected_order()
+        # The last sync was long ago, so the mirror is not trusted
+        ExternalEvent.query.update({'synced_at': datetime.utcnow() - timedelta(days=1)})
+        db.session.commit()
+        calls = _fake_live_search(monkeypatch, remote)
+
+        body = client.get('/eventbrite/events/mixed?page=3&per_page=5').get_json()
+
+        assert calls == [(1, 15, '-date')]
+        assert body['total_events'] == 16 and body['total_pages'] == 4
+        assert [event['name'] for event in body['events']] == expected[10:15]
+
+        client.get('/eventbrite/events/mixed?page=2&per_page=30')
+        assert calls[1:] == [(1, 50, '-date'), (2, 50, '-date')]
+
+def test_mixed_feed_goes_live_without_a_mirror(app, db, client, monkeypatch):
+    with app.app_context():
+        _seed(db, remote_count=0)
+        calls = _fake_live_search(monkeypatch, [])
+
+        body = client.get('/eventbrite/events/mixed').get_json()
+
+        assert len(calls) == 1
+        assert body['local_count'] == 7 and body['total_events'] == 7
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from server.pagination import encode_cursor
+from server.models import User, Event, Ticket
+
+def _seed_events(db, count):
+    now = datetime.utcnow()
+    db.session.execute(insert(Event), [{
+        'name': f'Event {i}',
+        'location': 'Nairobi',
+        'description': 'Seeded event',
+        'date': now + timedelta(days=i // 3),  # Shared dates exercise the id tie-breaker
+        'price': 100.0,
+        'capacity': 10,
+        'status': 'upcoming'
+    } for i in range(count)])
+    db.session.commit()
+
+def test_events_cursor_pagination_walks_every_row_once(app, db, client):
+    with app.app_context():
+        _seed_events(db, 25)
+
+        seen = []
+        cursor = ''
+        while True:
+            response = client.get('/events/', query_string={'cursor': cursor, 'per_page': 10})
+            assert response.status_code == 200
+            body = response.get_json()
+            assert 'total_pages' not in body
+            seen.extend(event['id'] for event in body['events'])
+            if not body['has_next']:
+                break
+            cursor = body['next_cursor']
+
+        ordered = [event.id for event in Event.query.order_by(Event.date, Event.id)]
+        assert seen == ordered
+
+def test_events_page_mode_still_supported(app, db, client):
+    with app.app_context():
+        _seed_events(db, 25)
+
+        body = client.get('/events/?page=3&per_page=10').get_json()
+        assert body['current_page'] == 3
+        assert body['total_pages'] == 3
+        assert len(body['events']) == 5
+
+def test_invalid_cursor_rejected(app, db, client):
+    with app.app_context():
+        response = client.get('/events/?cursor=not-a-cursor')
+        assert response.status_code == 400
+
+@pytest.mark.parametrize('values', [
+    ['2026-10-18T12:00:00', 'abc'],
+    ['2026-10-18T12:00:00', True],
+    ['2026-10-18T12:00:00', 1.5],
+    [1700000000, 1],
+    ['yesterday', 1]
+])
+def test_cursor_values_must_match_column_types(app, db, client, values):
+    with app.app_context():
+        _seed_events(db, 3)
+        response = client.get('/events/', query_string={'cursor': encode_cursor(values)})
+        assert response.status_code == 400
+
+def test_my_tickets_cursor_pagination(app, db, client, auth_headers):
+    with app.app_context():
+        user = User(username='buyer', email='buyer@test.com', password='password')
+        db.session.add(user)
+        db.session.commit()
+        _seed_events(db, 1)
+        now = datetime.utcnow()
+        db.session.execute(insert(Ticket), [{
+            'event_id': 1,
+            'user_id': user.id,
+            'price': 100.0,
+            'status': 'sold',
+            'purchase_date': now - timedelta(minutes=i // 2)
+        } for i in range(7)])
+        db.session.commit()
+
+        first = client.get('/tickets/my-tickets?cursor=&per_page=4', headers=auth_headers(user.id)).get_json()
+        second = client.get(f"/tickets/my-tickets?cursor={first['next_cursor']}&per_page=4", headers=auth_headers(user.id)).get_json()
+
+        assert len(first['tickets']) == 4
+        assert len(second['tickets']) == 3
+        assert second['next_cursor'] is None
+
+        ordered = [ticket.id for ticket in Ticket.query.order_by(Ticket.purchase_date.desc(), Ticket.id.desc())]
+        assert [t['ticket_id'] for t in first['tickets'] + second['tickets']] == ordered
@@ -0,0 +1,80 @@
+import threading
+import pytest
+from werkzeug.security import generate_password_hash
+from server.models import User
+from server.passwords import PasswordHasher, PasswordHasherBusy
+
+@pytest.mark.parametrize('executor', ['inline', 'thread', 'process'])
+def test_hasher_round_trip(executor):
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000', executor=executor, max_workers=2)
+    try:
+        password_hash = hasher.hash('secret123')
+
+        assert password_hash.startswith('pbkdf2:sha256:1000$')
+        assert hasher.verify(password_hash, 'secret123')
+        assert not hasher.verify(password_hash, 'wrong')
+        assert not hasher.needs_rehash(password_hash)
+        assert hasher.needs_rehash(generate_password_hash('secret123', method='pbkdf2:sha256:2000'))
+    finally:
+        hasher.shutdown()
+
+def test_full_queue_fails_fast():
+    """Callers beyond workers + pending are turned away instead of queueing forever."""
+    release = threading.Event()
+    started = threading.Event()
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000', executor='thread', max_workers=1, max_pending=0, queue_timeout=0.05)
+
+    def slow_hash(password):
+        started.set()
+        release.wait(5)
+        return password
+
+    worker = threading.Thread(target=hasher._run, args=(slow_hash, 'x'))
+    worker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash('secret123')
+    finally:
+        release.set()
+        worker.join()
+        hasher.shutdown()
+
+    assert hasher.verify(hasher.hash('secret123'), 'secret123')
+
+def _register(client):
+    return client.post('/auth/register', json={'username': 'alice', 'email': 'alice@test.com', 'password': 'secret123'})
+
+def test_register_and_login_use_configured_method(app, client, db):
+    assert _register(client).status_code == 201
+
+    with app.app_context():
+        assert User.query.one().password_hash.startswith(app.config['PASSWORD_HASH_METHOD'] + '$')
+
+    response = client.post('/auth/login', json={'email': 'alice@test.com', 'password': 'secret123'})
+    assert response.status_code == 200
+    response = client.post('/auth/login', json={'email': 'alice@test.com', 'password': 'wrong'})
+    assert response.status_code == 401
+
+def test_login_rehashes_when_cost_changes(app, client, db):
+    with app.app_context():
+        user = User(username='alice', email='alice@test.com')
+        user.password_hash = generate_password_hash('secret123', method='pbkdf2:sha256:500')
+        db.session.add(user)
+        db.session.commit()
+
+    response = client.post('/auth/login', json={'email': 'alice@test.com', 'password': 'secret123'})
+
+    assert response.status_code == 200
+    with app.app_context():
+        assert User.query.one().password_hash.startswith('pbkdf2:sha256:1000$')
+
+def test_busy_hasher_returns_503(app, client, db, monkeypatch):
+    def busy(*args):
+        raise PasswordHasherBusy()
+    monkeypatch.setattr(app.extensions['password_hasher'], '_run', busy)
+
+    response = _register(client)
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from server.models import User, Event, Ticket
+
+def _seed(db, ticket_count):
+    """One buyer owning `ticket_count` tickets, each for a different event,
+    and `ticket_count` resale listings by different sellers: two on event 2,
+    the rest on event 1."""
+    now = datetime.utcnow()
+    db.session.execute(insert(User), [{
+        'username': f'user{i}',
+        'email': f'user{i}@test.com',
+        'password_hash': 'x'
+    } for i in range(ticket_count + 1)])
+    db.session.execute(insert(Event), [{
+        'name': f'Event {i}',
+        'location': 'Nairobi',
+        'description': 'Seeded event',
+        'date': now + timedelta(days=i + 1),
+        'price': 100.0,
+        'capacity': 10,
+        'status': 'upcoming'
+    } for i in range(ticket_count)])
+    db.session.execute(insert(Ticket), [{
+        'event_id': i + 1,
+        'user_id': 1,
+        'price': 100.0,
+        'status': 'sold',
+        'purchase_date': now
+    } for i in range(ticket_count)])
+    db.session.execute(insert(Ticket), [{
+        'event_id': 2 if i < 2 else 1,
+        'user_id': i + 2,
+        'price': 100.0,
+        'resale_price': 150.0,
+        'status': 'resale',
+        'purchase_date': now
+    } for i in range(ticket_count)])
+    db.session.commit()
+
+@pytest.mark.parametrize('url, small_url', [
+    ('/tickets/my-tickets?per_page=50', '/tickets/my-tickets?per_page=2'),
+    ('/tickets/my-tickets?cursor=&per_page=50', '/tickets/my-tickets?cursor=&per_page=2'),
+    ('/tickets/resale/1?cursor=&per_page=50', '/tickets/resale/1?cursor=&per_page=2'),
+    ('/tickets/resale/1', '/tickets/resale/2'),  # Unpaged: 18 listings against 2
+])
+def test_listing_query_count_does_not_grow_with_page_size(app, db, client, auth_headers, count_queries, url, small_url):
+    """Regression guard against per-row lazy loads (N+1 queries)."""
+    with app.app_context():
+        _seed(db, 20)
+        headers = auth_headers(1)
+
+        assert small_url != url
+        client.get(small_url, headers=headers)  # Warm the user cache
+        with count_queries() as small_page:
+            assert client.get(small_url, headers=headers).status_code == 200
+        with count_queries() as large_page:
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+
+        assert len(large_page) == len(small_page)
+        assert len(large_page) <= 2
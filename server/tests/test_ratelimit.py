@@ -0,0 +1,102 @@
+import pytest
+from server.app import create_app
+from server.config import TestingConfig
+from server.models import db as sqlalchemy_db
+from server.cache import LRUCache, RedisCache
+from server.ratelimit import RateLimiter, parse_limit
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_parse_limit():
+    assert parse_limit('5/minute') == (5 / 60, 5)
+    assert parse_limit('10 / hour') == (10 / 3600, 10)
+    with pytest.raises(ValueError):
+        parse_limit('lots')
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_bucket_spends_burst_then_refills(shared, fake_redis):
+    clock = Clock()
+    backend = RedisCache(fake_redis) if shared else LRUCache()
+    limiter = RateLimiter(backend, clock=clock)
+    rate, burst = parse_limit('3/minute')
+
+    assert [limiter.consume('login_ip', '1.2.3.4', rate, burst)[0] for _ in range(4)] == [True, True, True, False]
+    allowed, retry_after = limiter.consume('login_ip', '1.2.3.4', rate, burst)
+    assert not allowed
+    assert retry_after == pytest.approx(20)
+
+    # Other keys have their own bucket
+    assert limiter.consume('login_ip', '5.6.7.8', rate, burst)[0]
+
+    clock.now += 20
+    assert limiter.consume('login_ip', '1.2.3.4', rate, burst)[0]
+    assert not limiter.consume('login_ip', '1.2.3.4', rate, burst)[0]
+
+    assert limiter.stats() == {'login_ip': {'allowed': 5, 'limited': 3}}
+
+def test_shared_backend_is_seen_by_every_worker(fake_redis):
+    clock = Clock()
+    rate, burst = parse_limit('2/minute')
+    worker_a = RateLimiter(RedisCache(fake_redis), clock=clock)
+    worker_b = RateLimiter(RedisCache(fake_redis), clock=clock)
+
+    assert worker_a.consume('login_email', 'a@test.com', rate, burst)[0]
+    assert worker_b.consume('login_email', 'a@test.com', rate, burst)[0]
+    assert not worker_a.consume('login_email', 'a@test.com', rate, burst)[0]
+
+def test_login_throttled_per_email_across_ips(app, client, db):
+    app.config['RATELIMIT_LOGIN_EMAIL'] = '3/minute'
+    credentials = {'email': 'victim@test.com', 'password': 'guess'}
+
+    statuses = [
+        client.post('/auth/login', json=credentials, environ_base={'REMOTE_ADDR': f'10.0.0.{i}'}).status_code
+        for i in range(4)
+    ]
+
+    assert statuses == [401, 401, 401, 429]
+    response = client.post('/auth/login', json=credentials)
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+
+    # A different account is unaffected
+    assert client.post('/auth/login', json={'email': 'other@test.com', 'password': 'guess'}).status_code == 401
+
+def test_register_throttled_per_ip(app, client, db):
+    app.config['RATELIMIT_REGISTER_IP'] = '2/hour'
+
+    statuses = [
+        client.post('/auth/register', json={'username': f'user{i}', 'email': f'user{i}@test.com', 'password': 'secret123'}).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [201, 201, 429]
+    assert app.extensions['rate_limiter'].stats()['register_ip'] == {'allowed': 2, 'limited': 1}
+
+@pytest.mark.parametrize('proxy_count', [0, 1])
+def test_client_ip_from_trusted_proxy(proxy_count):
+    class ProxyConfig(TestingConfig):
+        TRUSTED_PROXY_COUNT = proxy_count
+        RATELIMIT_REGISTER_IP = '1/hour'
+
+    app = create_app(ProxyConfig)
+    with app.app_context():
+        sqlalchemy_db.create_all()
+        client = app.test_client()
+        statuses = [
+            client.post(
+                '/auth/register',
+                json={'username': f'user{i}', 'email': f'user{i}@test.com', 'password': 'secret123'},
+                headers={'X-Forwarded-For': f'203.0.113.{i}'},
+                environ_base={'REMOTE_ADDR': '10.0.0.1'}
+            ).status_code
+            for i in range(2)
+        ]
+        sqlalchemy_db.drop_all()
+
+    # Without a trusted proxy the header could be forged, so the proxy's own address is limited
+    assert statuses == ([201, 201] if proxy_count else [201, 429])
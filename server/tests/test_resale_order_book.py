@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert, update
+from server.models import User, Event, Ticket, Transaction
+from server.services import ticket_service
+from server.services.ticket_service import purchase_cheapest_resale, resale_order_book
+
+# (seller, resale price) of each listing, in ticket id order
+LISTINGS = [(2, 3000.0), (2, 1800.0), (3, 2500.0), (3, 1800.0), (2, 2500.0), (3, 2500.0)]
+
+@pytest.fixture
+def event_id(app, db):
+    with app.app_context():
+        db.session.execute(insert(User), [
+            {'username': name, 'email': f'{name}@test.com', 'password_hash': 'x'}
+            for name in ('organizer', 'alice', 'bob', 'carol')
+        ])
+        event = Event(
+            name='Sauti Sol Live', location='Nairobi', description='Concert', price=1500, capacity=100,
+            tickets_sold=len(LISTINGS), date=datetime.utcnow() + timedelta(days=7), user_id=1
+        )
+        db.session.add(event)
+        db.session.flush()
+        db.session.execute(insert(Ticket), [{
+            'event_id': event.id, 'user_id': seller, 'price': 1500.0, 'status': 'resale', 'resale_price': price
+        } for seller, price in LISTINGS])
+        db.session.commit()
+        return event.id
+
+def test_order_book_summary(app, db, event_id):
+    with app.app_context():
+        book = resale_order_book(event_id, depth=2)
+
+    assert book == {
+        'event_id': event_id,
+        'best_ask': 1800.0,
+        'listings': 6,
+        'depth': [
+            {'price': 1800.0, 'quantity': 2, 'cumulative_quantity': 2},
+            {'price': 2500.0, 'quantity': 3, 'cumulative_quantity': 5}
+        ]
+    }
+
+def test_buy_cheapest_takes_lowest_prices_first(app, db, event_id):
+    with app.app_context():
+        sales, error = purchase_cheapest_resale(event_id, 4, 3)
+
+        assert error is None
+        assert [sale.ticket_id for sale in sales] == [2, 3, 4]  # 1800, 1800, then the older 2500 listing
+        assert all(sale.buyer_id == 4 and sale.transaction_type == 'resale' for sale in sales)
+        assert all(sale.ticket.user_id == 4 and sale.ticket.status == 'sold' and sale.ticket.resale_price is None for sale in sales)
+        assert sorted((t.seller_id, t.price) for t in Transaction.query) == [(2, 1800.0), (3, 1800.0), (3, 2500.0)]
+        assert resale_order_book(event_id)['best_ask'] == 2500.0
+
+def test_buy_cheapest_is_all_or_nothing(app, db, event_id):
+    with app.app_context():
+        # Alice can't buy her own listings, which leaves one at or under 2000
+        sales, error = purchase_cheapest_resale(event_id, 2, 2, max_price=2000)
+
+        assert sales is None
+        assert error == {'error': 'Only 1 resale tickets available'}
+        assert Ticket.query.filter_by(status='resale').count() == 6
+        assert Transaction.query.count() == 0
+
+def test_buy_cheapest_conflicts_when_a_listing_changes_hands(app, db, event_id, monkeypatch):
+    """A listing bought and relisted at the same price after it was read must not pay its old seller."""
+    def relist_then_update(*args):
+        db.session.execute(
+            update(Ticket).where(Ticket.id == 2).values(user_id=3)
+            .execution_options(synchronize_session=False)
+        )
+        monkeypatch.undo()
+        return update(*args)
+
+    with app.app_context():
+        monkeypatch.setattr(ticket_service, 'update', relist_then_update)
+        sales, error = purchase_cheapest_resale(event_id, 4, 2)
+
+        assert sales is None
+        assert error == {'error': 'Resale listings changed, please try again', 'retryable': True}
+        assert Ticket.query.filter_by(status='resale').count() == 6
+        assert Transaction.query.count() == 0
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+def test_buy_cheapest_retries_when_listings_were_skipped(app, db, event_id, monkeypatch):
+    """SKIP LOCKED passing over another buyer's listings is a conflict, not a shortage."""
+    with app.app_context():
+        execute = db.session.execute
+
+        def skip_one_locked(statement, *args, **kwargs):
+            monkeypatch.undo()
+            return _Rows(execute(statement, *args, **kwargs).all()[:-1])
+
+        monkeypatch.setattr(db.session, 'execute', skip_one_locked)
+        sales, error = purchase_cheapest_resale(event_id, 4, 2)
+
+        assert sales is None
+        assert error == {'error': 'Resale listings are being bought, please try again', 'retryable': True}
+
+def test_order_book_endpoints(app, db, client, auth_headers, event_id):
+    assert client.get(f'/tickets/resale/{event_id}/book').get_json()['best_ask'] == 1800.0
+    with app.app_context():
+        # Each ticket's original sale, which the resale response must not report
+        db.session.execute(insert(Transaction), [{
+            'ticket_id': ticket_id, 'seller_id': 1, 'buyer_id': seller, 'price': 1500.0, 'transaction_type': 'primary'
+        } for ticket_id, (seller, _) in enumerate(LISTINGS, start=1)])
+        db.session.commit()
+
+    response = client.post(f'/tickets/resale/{event_id}/buy', headers=auth_headers(4), json={'quantity': 2, 'max_price': 2000})
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['total_price'] == 3600.0
+    with app.app_context():
+        resales = Transaction.query.filter_by(transaction_type='resale').order_by(Transaction.ticket_id)
+        assert body['transaction_ids'] == [sale.id for sale in resales]
+        assert body['ticket_ids'] == [2, 4]
+
+    # The cached book was invalidated by the purchase
+    book = client.get(f'/tickets/resale/{event_id}/book?depth=1').get_json()
+    assert book['best_ask'] == 2500.0 and book['listings'] == 4
+
+    assert client.post(f'/tickets/resale/{event_id}/buy', headers=auth_headers(4), json={'quantity': 1, 'max_price': -1}).status_code == 400
+    assert client.post(f'/tickets/resale/{event_id}/buy', headers=auth_headers(4), json=[1]).status_code == 400
+
+def test_resale_listing_is_price_ordered_and_pages(app, db, client, event_id):
+    listing = client.get(f'/tickets/resale/{event_id}').get_json()
+    assert [ticket['resale_price'] for ticket in listing] == [1800.0, 1800.0, 2500.0, 2500.0, 2500.0, 3000.0]
+
+    page = client.get(f'/tickets/resale/{event_id}?cursor=&per_page=4').get_json()
+    assert [ticket['ticket_id'] for ticket in page['tickets']] == [2, 4, 3, 5]
+    page = client.get(f'/tickets/resale/{event_id}?cursor={page["next_cursor"]}&per_page=4').get_json()
+    assert [ticket['ticket_id'] for ticket in page['tickets']] == [6, 1]
+    assert page['has_next'] is False
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from server.services.event_service import create_event, update_event, delete_event
+from server.services.search_service import apply_search
+from server.models import User, Event
+
+def _create(db, user, name, description, location='Nairobi'):
+    event, error = create_event({
+        'name': name,
+        'location': location,
+        'description': description,
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': 10
+    }, user.id)
+    assert error is None
+    return event
+
+def _search(term):
+    return [event.name for event in apply_search(Event.query, term).all()]
+
+def test_search_ranks_and_tracks_updates(app, db):
+    with app.app_context():
+        user = User(username='testuser', email='test@test.com', password='password')
+        db.session.add(user)
+        db.session.commit()
+
+        jazz = _create(db, user, 'Jazz Night', 'Live jazz and soul')
+        _create(db, user, 'Food Festival', 'Street food, with a short jazz set')
+        _create(db, user, 'Tech Meetup', 'Talks on Python', location='Mombasa')
+
+        # Name matches outrank description matches; prefixes match
+        assert _search('jaz') == ['Jazz Night', 'Food Festival']
+        assert _search('python mombasa') == ['Tech Meetup']
+        assert _search('%') == ['Jazz Night', 'Food Festival', 'Tech Meetup']
+
+        update_event(jazz, {'name': 'Blues Night', 'description': 'Live blues'})
+        assert _search('jazz') == ['Food Festival']
+        assert _search('blues') == ['Blues Night']
+
+        delete_event(jazz)
+        assert _search('blues') == []
+
+def test_events_endpoint_search(app, db, client):
+    with app.app_context():
+        user = User(username='testuser', email='test@test.com', password='password')
+        db.session.add(user)
+        db.session.commit()
+        _create(db, user, 'Sauti Sol Live', 'Afro-pop concert')
+        _create(db, user, 'Tech Meetup', 'Talks on Python')
+
+        response = client.get('/events/?search=sauti')
+        assert response.status_code == 200
+        assert [event['name'] for event in response.get_json()['events']] == ['Sauti Sol Live']
@@ -0,0 +1,48 @@
+from sqlalchemy import func, select
+from server.models import User, Event, Ticket, Transaction
+from server.seed import KENYAN_EVENTS, RECURRING_DAYS, RECURRING_EVENTS
+
+CATALOG_SIZE = len(KENYAN_EVENTS) + len(RECURRING_DAYS) * len(RECURRING_EVENTS)
+
+def _snapshot(db):
+    return db.session.execute(
+        select(Event.name, Event.date, Event.tickets_sold, Event.user_id).order_by(Event.id)
+    ).all(), db.session.execute(
+        select(Ticket.event_id, Ticket.user_id, Ticket.status, Ticket.resale_price).order_by(Ticket.id)
+    ).all()
+
+def test_seed_command_builds_consistent_data(app, db):
+    result = app.test_cli_runner().invoke(args=['seed', '--scale', '2', '--batch-size', '500'])
+
+    assert result.exit_code == 0, result.output
+    assert Event.query.count() == 2 * CATALOG_SIZE
+    assert User.query.count() == 3 + 2 * 50
+    sold = db.session.scalar(select(func.sum(Event.tickets_sold)))
+    assert Ticket.query.count() == sold
+    assert Transaction.query.count() == sold
+    # Every ticket has exactly one transaction pointing at it
+    assert Transaction.query.filter(Transaction.ticket_id.is_(None)).count() == 0
+    assert db.session.scalar(select(func.count(func.distinct(Transaction.ticket_id)))) == sold
+    assert f'{2 * CATALOG_SIZE} events' in result.output
+
+def test_same_seed_gives_same_data(app, db):
+    runner = app.test_cli_runner()
+    runner.invoke(args=['seed', '--seed', '7'])
+    first = _snapshot(db)
+
+    result = runner.invoke(args=['seed', '--seed', '7', '--reset'])
+    assert result.exit_code == 0, result.output
+    second = _snapshot(db)
+
+    assert [row[0] for row in first[0]] == [row[0] for row in second[0]]
+    assert [row[2:] for row in first[0]] == [row[2:] for row in second[0]]
+    assert [(row[1], row[2], row[3]) for row in first[1]] == [(row[1], row[2], row[3]) for row in second[1]]
+
+def test_seed_refuses_to_overwrite_without_reset(app, db):
+    runner = app.test_cli_runner()
+    runner.invoke(args=['seed'])
+
+    result = runner.invoke(args=['seed'])
+
+    assert result.exit_code != 0
+    assert '--reset' in result.output
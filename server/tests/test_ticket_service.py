@@ -0,0 +1,265 @@
+import threading
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import update
+from server.app import create_app
+from server.config import TestingConfig
+from server.services.event_service import create_event
+from server.services import ticket_service
+from server.services.ticket_service import purchase_ticket, purchase_tickets, resell_ticket, purchase_resale_ticket, purchase_cheapest_resale
+from server.models import db as sqlalchemy_db, User, Event, Ticket, Transaction
+
+@pytest.fixture(params=['virtual', 'materialized'])
+def inventory_mode(request, app):
+    """Runs a test against both ticket inventory modes."""
+    app.config['TICKET_INVENTORY_MODE'] = request.param
+    return request.param
+
+def _make_event(db, capacity=5):
+    organizer = User(username='organizer', email='organizer@test.com', password='password')
+    db.session.add(organizer)
+    db.session.commit()
+
+    event, error = create_event({
+        'name': 'Test Event',
+        'location': 'Test Location',
+        'description': 'Test Description',
+        'date': (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'price': 10.0,
+        'capacity': capacity
+    }, organizer.id)
+    assert error is None
+    return event
+
+def test_purchase_ticket_claims_distinct_tickets(app, db, inventory_mode):
+    """Each purchase claims a different ticket until the event sells out."""
+    with app.app_context():
+        event = _make_event(db, capacity=3)
+
+        ticket_ids = set()
+        for buyer_id in range(100, 103):
+            ticket, error = purchase_ticket(event.id, buyer_id)
+            assert error is None
+            assert ticket.status == 'sold'
+            assert ticket.user_id == buyer_id
+            ticket_ids.add(ticket.id)
+
+        assert len(ticket_ids) == 3
+
+        ticket, error = purchase_ticket(event.id, 200)
+        assert ticket is None
+        assert error == {'error': 'No tickets available'}
+
+        assert db.session.get(Event, event.id).tickets_sold == 3
+        assert Transaction.query.filter_by(transaction_type='primary').count() == 3
+
+def test_purchase_ticket_unknown_event(app, db):
+    with app.app_context():
+        ticket, error = purchase_ticket(999, 1)
+        assert ticket is None
+        assert error == {'error': 'Event not found'}
+
+def test_purchase_tickets_batch(app, db, inventory_mode):
+    """A batch purchase claims every ticket and bumps the counter once."""
+    with app.app_context():
+        event = _make_event(db, capacity=5)
+
+        tickets, error = purchase_tickets(event.id, 100, 4)
+        assert error is None
+        assert len({ticket.id for ticket in tickets}) == 4
+        assert all(ticket.user_id == 100 and ticket.status == 'sold' for ticket in tickets)
+        assert all(len(ticket.transactions) == 1 for ticket in tickets)
+        assert db.session.get(Event, event.id).tickets_sold == 4
+
+def test_purchase_tickets_batch_is_all_or_nothing(app, db, inventory_mode):
+    """Asking for more tickets than remain leaves the inventory untouched."""
+    with app.app_context():
+        event = _make_event(db, capacity=3)
+
+        tickets, error = purchase_tickets(event.id, 100, 4)
+        assert tickets is None
+        assert error == {'error': 'Only 3 tickets available'}
+        assert Ticket.query.filter_by(status='sold').count() == 0
+        assert Transaction.query.count() == 0
+        assert db.session.get(Event, event.id).tickets_sold == 0
+
+def test_purchase_endpoint_quantity(app, db, client, auth_headers):
+    with app.app_context():
+        event = _make_event(db, capacity=12)
+        db.session.add(User(id=100, username='buyer', email='buyer@test.com', password='password'))
+        db.session.commit()
+
+        response = client.post(f'/tickets/purchase/{event.id}', json={'quantity': 3}, headers=auth_headers(100))
+        assert response.status_code == 201
+        assert len(response.get_json()['ticket_ids']) == 3
+        assert len(response.get_json()['transaction_ids']) == 3
+
+        response = client.post(f'/tickets/purchase/{event.id}', headers=auth_headers(100))
+        assert response.status_code == 201
+        assert response.get_json()['quantity'] == 1
+
+        response = client.post(f'/tickets/purchase/{event.id}', json={'quantity': 11}, headers=auth_headers(100))
+        assert response.status_code == 400
+
+        for body in ([1], 3, 'hold'):
+            response = client.post(f'/tickets/purchase/{event.id}', json=body, headers=auth_headers(100))
+            assert response.status_code == 400
+
+@pytest.fixture(params=['virtual', 'materialized'])
+def file_app(request, tmp_path):
+    """An app backed by an on-disk SQLite database so threads get their own connections."""
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "ticketi.db"}'
+
+    _app = create_app(FileConfig)
+    _app.config['TICKET_INVENTORY_MODE'] = request.param
+    with _app.app_context():
+        sqlalchemy_db.create_all()
+    yield _app
+    with _app.app_context():
+        sqlalchemy_db.drop_all()
+
+def test_concurrent_purchases_never_oversell(file_app):
+    """Parallel buyers must sell exactly `capacity` tickets, each one once."""
+    with file_app.app_context():
+        event_id = _make_event(sqlalchemy_db, capacity=20).id
+
+    sold = []
+    lock = threading.Lock()
+
+    def buyer(buyer_id):
+        with file_app.app_context():
+            while True:
+                ticket, error = purchase_ticket(event_id, buyer_id)
+                if error:
+                    break
+                with lock:
+                    sold.append(ticket.id)
+
+    threads = [threading.Thread(target=buyer, args=(100 + i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sold) == 20
+    assert len(set(sold)) == 20
+
+    with file_app.app_context():
+        assert sqlalchemy_db.session.get(Event, event_id).tickets_sold == 20
+        assert Ticket.query.filter_by(event_id=event_id, status='sold').count() == 20
+        assert Transaction.query.count() == 20
+
+def _listed_ticket(db, price=150.0):
+    event = _make_event(db, capacity=1)
+    ticket, _ = purchase_ticket(event.id, 100)
+    ticket, error = resell_ticket(ticket, 100, price)
+    assert error is None
+    return ticket.id
+
+def test_resale_ticket_is_sold_once_under_contention(file_app):
+    """Buyers racing for one listing: one wins, the rest get a retryable conflict."""
+    with file_app.app_context():
+        ticket_id = _listed_ticket(sqlalchemy_db)
+
+    start = threading.Barrier(8)
+    results = []
+    lock = threading.Lock()
+
+    def buyer(buyer_id):
+        with file_app.app_context():
+            ticket = sqlalchemy_db.session.get(Ticket, ticket_id)  # Everyone sees the listing
+            start.wait()
+            _, error = purchase_resale_ticket(ticket, buyer_id)
+            with lock:
+                results.append((buyer_id, error))
+
+    threads = [threading.Thread(target=buyer, args=(200 + i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    winners = [buyer_id for buyer_id, error in results if error is None]
+    assert len(winners) == 1
+    assert all(error.get('retryable') for _, error in results if error is not None)
+
+    with file_app.app_context():
+        ticket = sqlalchemy_db.session.get(Ticket, ticket_id)
+        assert (ticket.status, ticket.user_id, ticket.resale_price) == ('sold', winners[0], None)
+        assert Transaction.query.filter_by(transaction_type='resale').count() == 1
+
+def test_buy_cheapest_resale_under_contention(file_app):
+    """Buyers racing for the cheapest listings each pay the right seller for every ticket, once."""
+    with file_app.app_context():
+        event = _make_event(sqlalchemy_db, capacity=6)
+        listed = {}
+        for i in range(6):
+            ticket, _ = purchase_ticket(event.id, 100 + i % 2)
+            resell_ticket(ticket, 100 + i % 2, 100.0 + 10 * (i % 3))
+            listed[ticket.id] = (100 + i % 2, 100.0 + 10 * (i % 3))
+        event_id = event.id
+
+    start = threading.Barrier(4)
+    bought = []
+    lock = threading.Lock()
+
+    def buyer(buyer_id):
+        with file_app.app_context():
+            start.wait()
+            while True:
+                sales, error = purchase_cheapest_resale(event_id, buyer_id, 2)
+                if error and not error.get('retryable'):
+                    break
+                with lock:
+                    bought.extend((sale.ticket_id, buyer_id) for sale in sales or [])
+
+    threads = [threading.Thread(target=buyer, args=(200 + i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ticket_id for ticket_id, _ in bought) == sorted(listed)
+
+    with file_app.app_context():
+        sales = Transaction.query.filter_by(transaction_type='resale').all()
+        assert sorted((t.ticket_id, t.buyer_id) for t in sales) == sorted(bought)
+        assert all((t.seller_id, t.price) == listed[t.ticket_id] for t in sales)
+
+def test_stale_listing_cannot_be_bought(app, db):
+    """A buyer who saw an old price gets a conflict, not a charge at the new one."""
+    with app.app_context():
+        ticket_id = _listed_ticket(db)
+        seen = db.session.get(Ticket, ticket_id)
+
+        # The seller reprices behind the buyer's back
+        db.session.execute(
+            update(Ticket).where(Ticket.id == ticket_id).values(resale_price=500.0)
+            .execution_options(synchronize_session=False)
+        )
+        _, error = purchase_resale_ticket(seen, 200)
+
+        assert error == {'error': 'Ticket was sold or its listing changed, please try again', 'retryable': True}
+        assert Transaction.query.filter_by(transaction_type='resale').count() == 0
+
+def test_resale_conflict_endpoint_returns_409(app, db, client, auth_headers, monkeypatch):
+    with app.app_context():
+        ticket_id = _listed_ticket(db)
+        db.session.add(User(id=200, username='buyer', email='buyer@test.com', password='password'))
+        db.session.commit()
+
+    monkeypatch.setattr(ticket_service, '_change_listing', lambda *args, **kwargs: False)  # Always lose the race
+    response = client.post(f'/tickets/purchase-resale/{ticket_id}', headers=auth_headers(200))
+
+    assert response.status_code == 409
+    assert response.get_json()['retryable'] is True
+
+def test_available_tickets_endpoint(app, db, client, inventory_mode):
+    with app.app_context():
+        event = _make_event(db, capacity=5)
+        purchase_tickets(event.id, 100, 2)
+
+        response = client.get(f'/tickets/available/{event.id}')
+        assert response.status_code == 200
+        assert response.get_json()['available_tickets'] == 3
@@ -0,0 +1,108 @@
+import io
+import os
+import pytest
+from server.app import create_app
+from server.config import TestingConfig
+from server.models import db as sqlalchemy_db, User
+from flask_jwt_extended import create_access_token
+from server.uploads import ThumbnailWorker, UnsupportedImage, UploadTooLarge, save_image
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+
+@pytest.fixture
+def upload_app(tmp_path):
+    class UploadConfig(TestingConfig):
+        UPLOAD_FOLDER = str(tmp_path / 'uploads')
+        PROFILE_PICTURE_MAX_BYTES = 1024
+
+    _app = create_app(UploadConfig)
+    with _app.app_context():
+        sqlalchemy_db.create_all()
+        sqlalchemy_db.session.add(User(username='alice', email='alice@test.com', password='password'))
+        sqlalchemy_db.session.commit()
+        yield _app
+        sqlalchemy_db.drop_all()
+
+def _headers():
+    return {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+def _upload(client, headers, content, filename='me.png'):
+    return client.post('/auth/profile/picture', headers=headers, data={'file': (io.BytesIO(content), filename)}, content_type='multipart/form-data')
+
+def test_save_image_is_content_addressed(tmp_path):
+    first = save_image(io.BytesIO(PNG), str(tmp_path), max_bytes=1024)
+    second = save_image(io.BytesIO(PNG), str(tmp_path), max_bytes=1024)
+
+    assert first == second
+    assert first.endswith('.png') and first[:2] == first[3:5]
+    assert sorted(os.listdir(tmp_path / first[:2])) == [first[3:]]
+
+def test_save_image_enforces_limit_and_type(tmp_path):
+    with pytest.raises(UploadTooLarge):
+        save_image(io.BytesIO(PNG + b'\x00' * 2000), str(tmp_path), max_bytes=1024)
+    with pytest.raises(UnsupportedImage):
+        save_image(io.BytesIO(b'<?php echo 1; ?>'), str(tmp_path), max_bytes=1024)
+
+    assert os.listdir(tmp_path) == []  # Temp files are cleaned up
+
+def test_upload_and_serve_profile_picture(upload_app):
+    client = upload_app.test_client()
+    headers = _headers()
+
+    response = _upload(client, headers, PNG, filename='../../etc/passwd.png')
+    assert response.status_code == 200
+    path = response.get_json()['profile_picture']
+    assert '..' not in path and path.endswith('.png')
+
+    response = client.get(f'/uploads/{path}')
+    assert response.status_code == 200
+    assert response.data == PNG
+    assert 'immutable' in response.headers['Cache-Control']
+    assert response.cache_control.max_age == 365 * 24 * 3600
+
+    # Until a thumbnail exists the original stands in for it
+    response = client.get(f'/uploads/thumbs/160/{path}')
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 60
+
+def test_upload_rejects_oversized_and_non_images(upload_app):
+    client = upload_app.test_client()
+    headers = _headers()
+
+    assert _upload(client, headers, PNG + b'\x00' * 20000).status_code == 413
+    assert _upload(client, headers, b'GIF-but-not-really', filename='me.gif').status_code == 400
+    assert User.query.one().profile_picture is None
+
+def test_thumbnails_are_generated_in_background(upload_app):
+    Image = pytest.importorskip('PIL.Image')
+    buffer = io.BytesIO()
+    Image.new('RGB', (800, 600), 'red').save(buffer, format='PNG')
+    upload_app.config['PROFILE_PICTURE_MAX_BYTES'] = 1024 * 1024
+    client = upload_app.test_client()
+
+    path = _upload(client, _headers(), buffer.getvalue()).get_json()['profile_picture']
+    upload_app.extensions['thumbnails'].join()
+
+    response = client.get(f'/uploads/thumbs/160/{path}')
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 365 * 24 * 3600
+    assert Image.open(io.BytesIO(response.data)).size == (160, 120)
+
+def test_thumbnail_failures_are_logged(tmp_path, caplog):
+    pytest.importorskip('PIL.Image')
+    path = save_image(io.BytesIO(PNG), str(tmp_path), max_bytes=1024)  # A PNG signature and no image
+    worker = ThumbnailWorker(str(tmp_path))
+
+    worker.submit(path)
+    worker.join()
+
+    assert f'Thumbnails failed for {path}' in caplog.text
+    assert not [entry for entry in (tmp_path / 'thumbs').rglob('*') if entry.is_file()]
+
+def test_bodies_over_max_content_length_are_refused(upload_app):
+    upload_app.config['MAX_CONTENT_LENGTH'] = 2048
+    client = upload_app.test_client()
+
+    response = client.post('/events/import', headers=_headers(), data=b'x' * 4096, content_type='text/csv')
+
+    assert response.status_code == 413
@@ -0,0 +1,182 @@
+import threading
+from datetime import datetime, timedelta
+import pytest
+from server.app import create_app
+from server.config import TestingConfig
+from server.models import db as sqlalchemy_db, User, Event
+from flask_jwt_extended import create_access_token
+from server.waiting_room import NotAdmittedYet, QueueTokenInvalid, QueueTokenUsed, WaitingRoom, WaitingRoomBusy
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def room():
+    return WaitingRoom('secret', rate=2.0, burst=1, max_concurrent=1, queue_timeout=0.01, clock=Clock())
+
+def test_queue_admits_at_the_configured_rate(room):
+    tokens = [room.join(7, str(user_id)) for user_id in range(5)]
+
+    assert [status['admitted'] for _, status in tokens] == [True, False, False, False, False]
+    assert [status['position'] for _, status in tokens] == [0, 1, 2, 3, 4]
+    assert tokens[4][1]['eta_seconds'] == 2
+
+    room.clock.now += 1  # Two more admitted
+    assert [room.status(token, 7)['admitted'] for token, _ in tokens] == [True, True, True, False, False]
+    assert room.status(tokens[4][0], 7)['position'] == 2
+
+def test_rejoining_keeps_your_place(room):
+    first, _ = room.join(7, '1')
+    room.join(7, '2')
+    _, status = room.join(7, '2')
+
+    assert status['position'] == 1
+    assert room.status(first, 7)['admitted']
+
+def test_tokens_are_single_use_and_bound_to_user_and_event(room):
+    token, _ = room.join(7, '1')
+
+    with pytest.raises(QueueTokenInvalid):
+        room.admit(token, 8, '1')
+    with pytest.raises(QueueTokenInvalid):
+        room.admit(token, 7, '2')
+    with pytest.raises(QueueTokenInvalid):
+        room.admit(token + 'x', 7, '1')
+
+    key = room.admit(token, 7, '1')
+    with pytest.raises(QueueTokenUsed):
+        room.admit(token, 7, '1')
+
+    room.release(key)  # The order failed
+    assert room.admit(token, 7, '1') == key
+
+    # A used token sends its owner to the back of the queue
+    room.join(7, '2')
+    _, status = room.join(7, '1')
+    assert status == {'event_id': 7, 'admitted': False, 'position': 2, 'eta_seconds': 1}
+
+def test_not_admitted_reports_position(room):
+    room.join(7, '1')
+    token, _ = room.join(7, '2')
+
+    with pytest.raises(NotAdmittedYet) as excinfo:
+        room.admit(token, 7, '2')
+    assert excinfo.value.status['position'] == 1
+
+def test_purchase_slots_are_bounded(room):
+    with room.slot():
+        with pytest.raises(WaitingRoomBusy):
+            with room.slot():
+                pass
+
+def test_idle_queues_and_stale_places_are_dropped():
+    room = WaitingRoom('secret', rate=1.0, burst=1, token_ttl=60, max_tokens=2, max_queues=2, clock=Clock())
+    for user_id in range(3):
+        room.join(7, str(user_id))
+    assert list(room._queues[7].positions) == ['1', '2']
+
+    room.clock.now += 30
+    room.join(8, '1')
+    room.join(9, '1')  # Over max_queues: the least recently active queue goes
+    assert list(room._queues) == [8, 9]
+
+    room.clock.now += 60
+    token, status = room.join(7, '1')
+    assert list(room._queues) == [7]
+    assert status['admitted'] and room.admit(token, 7, '1')
+
+@pytest.fixture
+def queue_app():
+    class QueueConfig(TestingConfig):
+        WAITING_ROOM_ENABLED = True
+        WAITING_ROOM_ADMIT_RATE = 0.001
+        WAITING_ROOM_ADMIT_BURST = 1
+
+    _app = create_app(QueueConfig)
+    with _app.app_context():
+        sqlalchemy_db.create_all()
+        sqlalchemy_db.session.add_all([
+            User(username=name, email=f'{name}@test.com', password='password') for name in ('organizer', 'alice', 'bob')
+        ])
+        sqlalchemy_db.session.add(Event(
+            name='Sauti Sol Live', location='Nairobi', description='Concert', price=1500, capacity=10,
+            date=datetime.utcnow() + timedelta(days=7), user_id=1
+        ))
+        sqlalchemy_db.session.commit()
+        yield _app
+        sqlalchemy_db.drop_all()
+
+def _headers(user_id, token=None):
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(user_id))}'}
+    if token:
+        headers['X-Queue-Token'] = token
+    return headers
+
+def test_purchase_goes_through_the_queue(queue_app):
+    client = queue_app.test_client()
+
+    assert client.post('/tickets/purchase/1', headers=_headers(2), json={'quantity': 1}).status_code == 403
+
+    alice = client.post('/tickets/queue/1', headers=_headers(2)).get_json()
+    bob = client.post('/tickets/queue/1', headers=_headers(3)).get_json()
+    assert alice['admitted'] and not bob['admitted']
+
+    status = client.get('/tickets/queue/1', headers={'X-Queue-Token': bob['token']}).get_json()
+    assert status['position'] == 1
+    assert client.get('/tickets/queue/1?token=nonsense').status_code == 400
+
+    response = client.post('/tickets/purchase/1', headers=_headers(3, bob['token']), json={'quantity': 1})
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+
+    # A failed order does not use up the token
+    assert client.post('/tickets/purchase/1', headers=_headers(2, alice['token']), json={'quantity': 50}).status_code == 400
+    assert client.post('/tickets/purchase/1', headers=_headers(2, alice['token']), json={'quantity': 2}).status_code == 201
+    assert client.post('/tickets/purchase/1', headers=_headers(2, alice['token']), json={'quantity': 1}).status_code == 409
+
+    assert Event.query.one().tickets_sold == 2
+
+def test_hold_checkout_needs_no_second_token(queue_app):
+    client = queue_app.test_client()
+    token = client.post('/tickets/queue/1', headers=_headers(2)).get_json()['token']
+
+    hold = client.post('/tickets/holds/event/1', headers=_headers(2, token), json={'quantity': 2}).get_json()
+    response = client.post('/tickets/purchase/1', headers=_headers(2), json={'hold_id': hold['hold_id']})
+
+    assert response.status_code == 201
+
+def test_concurrent_buyers_never_exceed_the_slot_count(queue_app):
+    room = queue_app.extensions['waiting_room']
+    room._slots = threading.BoundedSemaphore(2)
+    room.queue_timeout = 5
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def buy():
+        with room.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=buy) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+
+def test_queue_token_header_is_allowed_cross_origin(client):
+    response = client.options('/tickets/purchase/1', headers={
+        'Origin': 'http://localhost:5173',
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'authorization, content-type, x-queue-token'
+    })
+
+    assert 'x-queue-token' in response.headers['Access-Control-Allow-Headers'].lower()
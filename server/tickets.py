@@ -1,79 +1,224 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, current_user, get_jwt_identity
 from datetime import datetime
-from server.models import db, Event, Ticket, Transaction, User
+from server.models import db, Event, Ticket, TicketHold, Transaction, User
 from sqlalchemy import and_
-from server.services.ticket_service import purchase_ticket as purchase_ticket_service, resell_ticket as resell_ticket_service, purchase_resale_ticket as purchase_resale_ticket_service, cancel_resale as cancel_resale_service
+from sqlalchemy.orm import joinedload
+from server.pagination import keyset_page
+from server.cache import cached_response
+from server.idempotency import idempotent
+from server.waiting_room import TOKEN_HEADER, QueueTokenInvalid, admission_required, get_waiting_room
+from server.services.ticket_service import purchase_tickets as purchase_tickets_service, resell_ticket as resell_ticket_service, purchase_resale_ticket as purchase_resale_ticket_service, cancel_resale as cancel_resale_service, resale_order_book, purchase_cheapest_resale
+from server.services.hold_service import place_hold as place_hold_service, extend_hold as extend_hold_service, release_hold as release_hold_service
 
 tickets_bp = Blueprint('tickets', __name__)
 
 @tickets_bp.route('/available/<int:event_id>', methods=['GET'])
+@cached_response(lambda event_id: f'event:{event_id}')
 def get_available_tickets(event_id):
     """Get available tickets for an event"""
     event = Event.query.get_or_404(event_id)
-    available_tickets = Ticket.query.filter_by(
-        event_id=event_id,
-        status='available'
-    ).count()
 
     return jsonify({
         'event': event.to_dict(),
-        'available_tickets': available_tickets
+        'available_tickets': max(event.available_tickets, 0)
     }), 200
 
 
 
+@tickets_bp.route('/queue/<int:event_id>', methods=['POST'])
+@jwt_required()
+def join_queue(event_id):
+    """Join an event's waiting room; send the token as X-Queue-Token once admitted"""
+    room = get_waiting_room()
+    if room is None:
+        return jsonify({'event_id': event_id, 'token': None, 'admitted': True, 'position': 0, 'eta_seconds': 0}), 200
+
+    token, status = room.join(event_id, get_jwt_identity())
+    return jsonify({'token': token, **status}), 200
+
+@tickets_bp.route('/queue/<int:event_id>', methods=['GET'])
+def get_queue_position(event_id):
+    """Poll a queue token's position and estimated wait"""
+    room = get_waiting_room()
+    if room is None:
+        return jsonify({'event_id': event_id, 'admitted': True, 'position': 0, 'eta_seconds': 0}), 200
+
+    try:
+        status = room.status(request.headers.get(TOKEN_HEADER) or request.args.get('token'), event_id)
+    except QueueTokenInvalid:
+        return jsonify({'error': 'Invalid queue token'}), 400
+
+    return jsonify(status), 200
+
+def _json_object():
+    """The JSON body as a dict ({} without one), or None if it is not an object."""
+    data = request.get_json(silent=True)
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+def _pays_for_hold():
+    # Holds were placed through the queue already
+    data = _json_object()
+    return data is not None and data.get('hold_id') is not None
+
 @tickets_bp.route('/purchase/<int:event_id>', methods=['POST'])
 @jwt_required()
+@idempotent
+@admission_required(exempt=_pays_for_hold)
 def purchase_ticket(event_id):
-    """Purchase a ticket for an event"""
-    current_user_id = get_jwt_identity()
-
-    ticket, error = purchase_ticket_service(event_id, current_user_id)
+    """Purchase one or more tickets for an event, or the tickets in a hold"""
+    current_user_id = current_user.id
+    data = _json_object()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    hold_id = data.get('hold_id')
+    if hold_id is not None:
+        if not isinstance(hold_id, int) or isinstance(hold_id, bool):
+            return jsonify({'error': 'Invalid hold'}), 400
+        tickets, error = purchase_tickets_service(event_id, current_user_id, hold_id=hold_id)
+    else:
+        quantity, error = _order_quantity(data)
+        if error:
+            return jsonify(error), 400
+        tickets, error = purchase_tickets_service(event_id, current_user_id, quantity)
 
     if error:
         return jsonify(error), 400
 
+    quantity = len(tickets)
+
     return jsonify({
-        'message': 'Ticket purchased successfully',
-        'ticket_id': ticket.id,
-        'transaction_id': ticket.transactions[-1].id
+        'message': 'Tickets purchased successfully' if quantity > 1 else 'Ticket purchased successfully',
+        'ticket_id': tickets[0].id,
+        'transaction_id': tickets[0].transactions[-1].id,
+        'ticket_ids': [ticket.id for ticket in tickets],
+        'transaction_ids': [ticket.transactions[-1].id for ticket in tickets],
+        'quantity': quantity
     }), 201
 
+def _error_status(error):
+    # Lost races on a listing are worth retrying; everything else is the request's fault
+    return 409 if error.get('retryable') else 400
+
+def _order_quantity(data):
+    quantity = data.get('quantity', 1)
+    max_quantity = current_app.config['MAX_TICKETS_PER_ORDER']
+    if not isinstance(quantity, int) or isinstance(quantity, bool) or not 1 <= quantity <= max_quantity:
+        return None, {'error': f'Quantity must be between 1 and {max_quantity}'}
+    return quantity, None
+
+
+
+@tickets_bp.route('/holds/event/<int:event_id>', methods=['POST'])
+@jwt_required()
+@admission_required()
+def place_hold(event_id):
+    """Hold tickets for an event while the buyer checks out"""
+    data = _json_object()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    quantity, error = _order_quantity(data)
+    if error:
+        return jsonify(error), 400
+
+    hold, error = place_hold_service(event_id, current_user.id, quantity)
+
+    if error:
+        return jsonify(error), 400
+
+    return jsonify(hold.to_dict()), 201
+
+@tickets_bp.route('/holds/<int:hold_id>/extend', methods=['POST'])
+@jwt_required()
+def extend_hold(hold_id):
+    """Extend a hold's expiry"""
+    hold = TicketHold.query.get_or_404(hold_id)
+
+    extended_hold, error = extend_hold_service(hold, current_user.id)
+
+    if error:
+        return jsonify(error), 400
+
+    return jsonify(extended_hold.to_dict()), 200
+
+@tickets_bp.route('/holds/<int:hold_id>', methods=['DELETE'])
+@jwt_required()
+def release_hold(hold_id):
+    """Release a hold's tickets"""
+    hold = TicketHold.query.get_or_404(hold_id)
+
+    released_hold, error = release_hold_service(hold, current_user.id)
+
+    if error:
+        return jsonify(error), 400
+
+    return jsonify(released_hold.to_dict()), 200
+
+
+
 @tickets_bp.route('/my-tickets', methods=['GET'])
 @jwt_required()
 def get_my_tickets():
     """Get all tickets owned by the current user"""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
-    current_user_id = get_jwt_identity()
+    cursor = request.args.get('cursor')  # Present (even empty) selects cursor pagination
+    current_user_id = current_user.id
     
-    query = Ticket.query.filter_by(user_id=current_user_id)
+    # Load each ticket's event in the same query instead of one lazy load per row
+    query = Ticket.query.options(joinedload(Ticket.event)).filter_by(user_id=current_user_id)
+
+    if cursor is not None:
+        try:
+            tickets, next_cursor = keyset_page(
+                query.filter(Ticket.purchase_date.isnot(None)),
+                [Ticket.purchase_date, Ticket.id],
+                cursor,
+                min(max(per_page, 1), 100),
+                descending=True
+            )
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+        return jsonify({
+            'tickets': [_my_ticket_dict(ticket) for ticket in tickets],
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }), 200
+
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     tickets = pagination.items
     
     return jsonify({
-        'tickets': [{
-            'ticket_id': ticket.id,
-            'event': ticket.event.to_dict(),
-            'status': ticket.status,
-            'purchase_date': ticket.purchase_date.isoformat() if ticket.purchase_date else None,
-            'price': ticket.price,
-            'resale_price': ticket.resale_price
-        } for ticket in tickets],
+        'tickets': [_my_ticket_dict(ticket) for ticket in tickets],
         'total_pages': pagination.pages,
         'current_page': pagination.page,
         'has_next': pagination.has_next,
         'has_prev': pagination.has_prev
     }), 200
 
+def _my_ticket_dict(ticket):
+    return {
+        'ticket_id': ticket.id,
+        'event': ticket.event.to_dict(),
+        'status': ticket.status,
+        'purchase_date': ticket.purchase_date.isoformat() if ticket.purchase_date else None,
+        'price': ticket.price,
+        'resale_price': ticket.resale_price
+    }
+
 
 
 @tickets_bp.route('/resell/<int:ticket_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def resell_ticket(ticket_id):
     """Put a ticket up for resale"""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
     data = request.get_json()
 
     if 'price' not in data or not isinstance(data['price'], (int, float)) or data['price'] < 0:
@@ -84,7 +229,7 @@ def resell_ticket(ticket_id):
     resold_ticket, error = resell_ticket_service(ticket, current_user_id, data['price'])
 
     if error:
-        return jsonify(error), 400
+        return jsonify(error), _error_status(error)
 
     return jsonify({
         'message': 'Ticket listed for resale',
@@ -94,33 +239,102 @@ def resell_ticket(ticket_id):
 
 @tickets_bp.route('/resale/<int:event_id>', methods=['GET'])
 def get_resale_tickets(event_id):
-    """Get all tickets available for resale for an event"""
-    resale_tickets = Ticket.query.filter_by(
-        event_id=event_id,
-        status='resale'
-    ).all()
-    
-    return jsonify([{
+    """Get the tickets listed for resale for an event, cheapest first"""
+    cursor = request.args.get('cursor')  # Present (even empty) selects cursor pagination
+    per_page = request.args.get('per_page', 20, type=int)
+
+    query = db.session.query(
+        Ticket.id,
+        Ticket.price,
+        Ticket.resale_price,
+        User.username
+    ).join(User, Ticket.user_id == User.id).filter(
+        Ticket.event_id == event_id,
+        Ticket.status == 'resale'
+    )
+
+    if cursor is not None:
+        try:
+            resale_tickets, next_cursor = keyset_page(
+                query,
+                [Ticket.resale_price, Ticket.id],
+                cursor,
+                min(max(per_page, 1), 100)
+            )
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+        return jsonify({
+            'tickets': [_resale_ticket_dict(ticket) for ticket in resale_tickets],
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }), 200
+
+    resale_tickets = query.order_by(Ticket.resale_price, Ticket.id).all()
+
+    return jsonify([_resale_ticket_dict(ticket) for ticket in resale_tickets]), 200
+
+def _resale_ticket_dict(ticket):
+    return {
         'ticket_id': ticket.id,
         'original_price': ticket.price,
         'resale_price': ticket.resale_price,
-        'seller': ticket.owner.username
-    } for ticket in resale_tickets]), 200
+        'seller': ticket.username
+    }
+
+@tickets_bp.route('/resale/<int:event_id>/book', methods=['GET'])
+@cached_response(lambda event_id: f'event:{event_id}')
+def get_resale_order_book(event_id):
+    """Best ask and depth of an event's resale listings"""
+    depth = min(max(request.args.get('depth', 10, type=int), 1), 50)
+
+    return jsonify(resale_order_book(event_id, depth)), 200
+
+@tickets_bp.route('/resale/<int:event_id>/buy', methods=['POST'])
+@jwt_required()
+@idempotent
+def buy_cheapest_resale(event_id):
+    """Buy the cheapest resale tickets for an event in one order"""
+    data = _json_object()
+    if data is None:
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    quantity, error = _order_quantity(data)
+    if error:
+        return jsonify(error), 400
+
+    max_price = data.get('max_price')
+    if max_price is not None and (not isinstance(max_price, (int, float)) or isinstance(max_price, bool) or max_price < 0):
+        return jsonify({'error': 'Invalid maximum price'}), 400
+
+    sales, error = purchase_cheapest_resale(event_id, current_user.id, quantity, max_price)
+
+    if error:
+        return jsonify(error), _error_status(error)
+
+    return jsonify({
+        'message': 'Resale tickets purchased successfully' if quantity > 1 else 'Resale ticket purchased successfully',
+        'ticket_ids': [sale.ticket_id for sale in sales],
+        'transaction_ids': [sale.id for sale in sales],
+        'total_price': sum(sale.price for sale in sales),
+        'quantity': quantity
+    }), 201
 
 
 
 @tickets_bp.route('/purchase-resale/<int:ticket_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def purchase_resale_ticket(ticket_id):
     """Purchase a resale ticket"""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
 
     ticket = Ticket.query.get_or_404(ticket_id)
 
     purchased_ticket, error = purchase_resale_ticket_service(ticket, current_user_id)
 
     if error:
-        return jsonify(error), 400
+        return jsonify(error), _error_status(error)
 
     return jsonify({
         'message': 'Resale ticket purchased successfully',
@@ -132,16 +346,17 @@ def purchase_resale_ticket(ticket_id):
 
 @tickets_bp.route('/cancel-resale/<int:ticket_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def cancel_resale(ticket_id):
     """Cancel a ticket's resale listing"""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_user.id
 
     ticket = Ticket.query.get_or_404(ticket_id)
 
     cancelled_ticket, error = cancel_resale_service(ticket, current_user_id)
 
     if error:
-        return jsonify(error), 400
+        return jsonify(error), _error_status(error)
 
     return jsonify({
         'message': 'Resale listing cancelled successfully',
@@ -0,0 +1,193 @@
+"""
+Image uploads
+Uploads are streamed to disk in chunks under a hard size cap and stored by
+the SHA-256 of their content (<aa>/<sha256>.<ext>), so identical files are
+kept once and a stored file never changes. Thumbnails are made by a
+background worker (needs Pillow; without it the original is served) and
+everything content-addressed is served with a year-long immutable
+Cache-Control through send_file, which uses X-Sendfile or the server's
+file wrapper when available.
+"""
+
+import hashlib
+import logging
+import os
+import queue
+import re
+import tempfile
+import threading
+from flask import current_app, send_from_directory
+from werkzeug.exceptions import NotFound
+
+try:
+    from PIL import Image
+except ImportError:  # Thumbnails are optional
+    Image = None
+
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Magic numbers of the image types we accept; the client's filename is not trusted
+SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+
+PIL_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'gif': 'GIF'}
+
+CONTENT_ADDRESSED = re.compile(r'^(thumbs/\d+/)?[0-9a-f]{2}/[0-9a-f]{64}\.(png|jpg|gif)$')
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds its size limit."""
+
+
+class UnsupportedImage(Exception):
+    """Raised when an upload is not a PNG, JPEG or GIF image."""
+
+
+def _image_extension(head):
+    for signature, extension in SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    raise UnsupportedImage()
+
+
+def save_image(stream, upload_folder, max_bytes):
+    """Copies an image from `stream` into content-addressed storage.
+
+    Returns the stored path relative to `upload_folder`. Stops reading as
+    soon as `max_bytes` is exceeded.
+    """
+    os.makedirs(upload_folder, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    head = b''
+
+    handle, temp_path = tempfile.mkstemp(dir=upload_folder, prefix='.upload-')
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge()
+                if len(head) < 8:
+                    head += chunk[:8 - len(head)]
+                digest.update(chunk)
+                temp_file.write(chunk)
+
+        name = digest.hexdigest()
+        relative_path = f'{name[:2]}/{name}.{_image_extension(head)}'
+        destination = os.path.join(upload_folder, relative_path)
+        if os.path.exists(destination):
+            os.remove(temp_path)  # Already stored
+        else:
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            os.replace(temp_path, destination)
+        return relative_path
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def thumbnail_path(relative_path, size):
+    return f'thumbs/{size}/{relative_path}'
+
+
+class ThumbnailWorker:
+    """Background thread that writes resized copies of stored images."""
+
+    def __init__(self, upload_folder, sizes=(64, 160), logger=None):
+        self.upload_folder = upload_folder
+        self.sizes = tuple(sizes)
+        self.logger = logger or logging.getLogger(__name__)  # The worker thread has no app context
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return Image is not None and bool(self.sizes)
+
+    def submit(self, relative_path):
+        """Queues thumbnails for a stored image (no-op without Pillow)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='thumbnail-worker', daemon=True)
+                self._thread.start()
+        self._queue.put(relative_path)
+
+    def join(self):
+        """Blocks until every queued image has been processed."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            relative_path = self._queue.get()
+            try:
+                self.make_thumbnails(relative_path)
+            except Exception:
+                # A broken image just keeps being served full size
+                self.logger.exception(f'Thumbnails failed for {relative_path}')
+            finally:
+                self._queue.task_done()
+
+    def make_thumbnails(self, relative_path):
+        source = os.path.join(self.upload_folder, relative_path)
+        for size in self.sizes:
+            destination = os.path.join(self.upload_folder, thumbnail_path(relative_path, size))
+            if os.path.exists(destination):
+                continue
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            extension = relative_path.rsplit('.', 1)[1]
+            with Image.open(source) as image:
+                image.thumbnail((size, size))
+                if extension == 'jpg' and image.mode not in ('RGB', 'L'):
+                    image = image.convert('RGB')
+                handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(destination), prefix='.thumb-')
+                os.close(handle)
+                try:
+                    image.save(temp_path, format=PIL_FORMATS[extension])
+                    os.replace(temp_path, destination)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+
+
+def init_uploads(app):
+    """Starts the thumbnail worker and serves /uploads/<path>."""
+    worker = ThumbnailWorker(app.config['UPLOAD_FOLDER'], app.config.get('PROFILE_THUMBNAIL_SIZES', (64, 160)), app.logger)
+    app.extensions['thumbnails'] = worker
+
+    @app.route('/uploads/<path:filename>')  # Profile pictures and their thumbnails
+    def uploaded_file(filename):
+        if not CONTENT_ADDRESSED.match(filename):
+            # Files from before content addressing may still be replaced
+            return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+
+        try:
+            response = send_from_directory(app.config['UPLOAD_FOLDER'], filename, max_age=IMMUTABLE_MAX_AGE)
+        except NotFound:
+            if not filename.startswith('thumbs/'):
+                raise
+            # Thumbnail not made (yet): fall back to the original, briefly cacheable
+            original = filename.split('/', 2)[2]
+            return send_from_directory(app.config['UPLOAD_FOLDER'], original, max_age=60)
+
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+    return worker
+
+
+def get_thumbnail_worker():
+    return current_app.extensions['thumbnails']
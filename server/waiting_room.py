@@ -0,0 +1,246 @@
+"""
+Waiting room for high-demand on-sales
+With WAITING_ROOM_ENABLED, buying or holding tickets needs a queue token for
+the event. Buyers join the event's queue, poll their position, and are let
+through WAITING_ROOM_ADMIT_RATE per second once the first
+WAITING_ROOM_ADMIT_BURST are in, so a rush reaches the database at a steady
+rate. Admitted requests also share WAITING_ROOM_MAX_CONCURRENT slots, which
+bounds concurrent purchase transactions however many tokens are out.
+
+Queues live in process memory: with several workers the rate applies per
+worker, and a token is judged against the queue of the worker serving it.
+A queue left idle for WAITING_ROOM_TOKEN_TTL is dropped, since every token it
+issued has expired by then.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity
+from itsdangerous import BadData, URLSafeTimedSerializer
+from server.cache import LRUCache
+
+TOKEN_HEADER = 'X-Queue-Token'
+
+
+class QueueTokenInvalid(Exception):
+    """Raised for a missing, forged, expired or someone else's queue token."""
+
+
+class QueueTokenUsed(Exception):
+    """Raised when an admitted token has already paid for an order."""
+
+
+class NotAdmittedYet(Exception):
+    """Raised when the token's place in the queue has not come up yet."""
+
+    def __init__(self, status):
+        super().__init__()
+        self.status = status
+
+
+class WaitingRoomBusy(Exception):
+    """Raised when no purchase slot frees up within the queue timeout."""
+
+
+class _Queue:
+    """One event's queue: positions issued so far and how far admission has reached."""
+    __slots__ = ('issued', 'admitted', 'updated', 'positions')
+
+    def __init__(self, now, burst):
+        self.issued = 0
+        self.admitted = float(burst)
+        self.updated = now
+        self.positions = OrderedDict()  # user id -> (sequence number, last joined), oldest first
+
+
+class WaitingRoom:
+    """Per-event admission queues with a shared cap on concurrent purchases."""
+
+    def __init__(self, secret, rate=5.0, burst=20, max_concurrent=8, queue_timeout=2.0,
+                 token_ttl=1800, max_tokens=100000, max_queues=1000, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.queue_timeout = queue_timeout
+        self.token_ttl = token_ttl
+        self.max_tokens = max_tokens
+        self.max_queues = max_queues
+        self.clock = clock
+        self._serializer = URLSafeTimedSerializer(secret, salt='waiting-room')
+        self._queues = OrderedDict()  # event id -> _Queue, least recently active first
+        self._used = LRUCache(max_entries=max_tokens, default_ttl=token_ttl)
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+
+    def _advance(self, event_id):
+        # Admission runs ahead of the queue by at most `burst`, so an idle
+        # event lets newcomers straight through
+        now = self.clock()
+        self._expire(now)
+        queue = self._queues.get(event_id)
+        if queue is None:
+            queue = self._queues[event_id] = _Queue(now, self.burst)
+            while len(self._queues) > self.max_queues:
+                self._queues.popitem(last=False)
+        else:
+            self._queues.move_to_end(event_id)
+        queue.admitted = min(queue.admitted + (now - queue.updated) * self.rate, queue.issued + self.burst)
+        queue.updated = now
+        return queue
+
+    def _expire(self, now):
+        # Tokens outlive neither the queue's last activity nor a user's last
+        # join by more than token_ttl, so older entries can go
+        while self._queues:
+            event_id, queue = next(iter(self._queues.items()))
+            if now - queue.updated < self.token_ttl:
+                break
+            del self._queues[event_id]
+
+    def _status(self, event_id, queue, sequence):
+        # `admitted` counts the positions let through so far, fractions included
+        admitted = sequence + 1 <= queue.admitted
+        return {
+            'event_id': event_id,
+            'admitted': admitted,
+            'position': 0 if admitted else sequence - math.floor(queue.admitted) + 1,
+            'eta_seconds': 0 if admitted else math.ceil((sequence + 1 - queue.admitted) / self.rate)
+        }
+
+    def join(self, event_id, user_id):
+        """Puts a user in an event's queue, or finds their existing place.
+
+        Returns (token, status).
+        """
+        with self._lock:
+            queue = self._advance(event_id)
+            sequence, _ = queue.positions.pop(user_id, (None, None))
+            if sequence is None or self._used.get(f'{event_id}:{sequence}'):
+                sequence = queue.issued
+                queue.issued += 1
+            queue.positions[user_id] = (sequence, queue.updated)
+            while queue.positions:
+                _, (_, joined) = next(iter(queue.positions.items()))
+                if len(queue.positions) <= self.max_tokens and queue.updated - joined < self.token_ttl:
+                    break
+                queue.positions.popitem(last=False)
+            status = self._status(event_id, queue, sequence)
+        return self._serializer.dumps([event_id, sequence, user_id]), status
+
+    def _decode(self, token):
+        if not token:
+            raise QueueTokenInvalid()
+        try:
+            event_id, sequence, user_id = self._serializer.loads(token, max_age=self.token_ttl)
+        except (BadData, TypeError, ValueError):
+            raise QueueTokenInvalid()
+        return event_id, sequence, user_id
+
+    def status(self, token, event_id):
+        """Position and ETA for a token; polling never touches the database."""
+        token_event_id, sequence, _ = self._decode(token)
+        if token_event_id != event_id:
+            raise QueueTokenInvalid()
+        with self._lock:
+            return self._status(event_id, self._advance(event_id), sequence)
+
+    def admit(self, token, event_id, user_id):
+        """Claims an admitted token for one order.
+
+        Returns a key for release() should the order fail.
+        """
+        token_event_id, sequence, token_user_id = self._decode(token)
+        if token_event_id != event_id or token_user_id != user_id:
+            raise QueueTokenInvalid()
+
+        key = f'{event_id}:{sequence}'
+        with self._lock:
+            status = self._status(event_id, self._advance(event_id), sequence)
+            if not status['admitted']:
+                raise NotAdmittedYet(status)
+            if self._used.get(key):
+                raise QueueTokenUsed()
+            self._used.set(key, True)
+        return key
+
+    def release(self, key):
+        """Lets a claimed token be used again (its order failed)."""
+        self._used.delete(key)
+
+    @contextmanager
+    def slot(self):
+        """Holds one of the concurrent purchase slots."""
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise WaitingRoomBusy()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+
+def init_waiting_room(app):
+    """Creates the waiting room configured by the WAITING_ROOM_* settings."""
+    if not app.config.get('WAITING_ROOM_ENABLED', False):
+        return None
+
+    room = WaitingRoom(
+        app.config.get('SECRET_KEY') or app.config['JWT_SECRET_KEY'],
+        rate=app.config.get('WAITING_ROOM_ADMIT_RATE', 5.0),
+        burst=app.config.get('WAITING_ROOM_ADMIT_BURST', 20),
+        max_concurrent=app.config.get('WAITING_ROOM_MAX_CONCURRENT', 8),
+        queue_timeout=app.config.get('WAITING_ROOM_QUEUE_TIMEOUT', 2.0),
+        token_ttl=app.config.get('WAITING_ROOM_TOKEN_TTL', 1800)
+    )
+    app.extensions['waiting_room'] = room
+    return room
+
+
+def get_waiting_room():
+    """The app's waiting room, or None when it is disabled."""
+    return current_app.extensions.get('waiting_room')
+
+
+def admission_required(exempt=None):
+    """Admits a view for an `event_id` through the event's waiting room.
+
+    Needs an admitted X-Queue-Token unless `exempt()` is true, and always
+    runs the view in a purchase slot. A token that fails to buy anything
+    can be used again. Goes inside jwt_required.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            room = get_waiting_room()
+            if room is None:
+                return view(*args, **kwargs)
+
+            key = None
+            if not (exempt and exempt()):
+                try:
+                    key = room.admit(request.headers.get(TOKEN_HEADER), kwargs['event_id'], get_jwt_identity())
+                except QueueTokenInvalid:
+                    return jsonify({'error': 'Join the queue for this event first'}), 403
+                except QueueTokenUsed:
+                    return jsonify({'error': 'Queue token has already been used'}), 409
+                except NotAdmittedYet as e:
+                    response = jsonify({'error': 'Not admitted yet', **e.status})
+                    response.headers['Retry-After'] = str(e.status['eta_seconds'])
+                    return response, 429
+
+            try:
+                with room.slot():
+                    response = make_response(view(*args, **kwargs))
+            except WaitingRoomBusy:
+                response = jsonify({'error': 'Too many purchases in progress, please try again'})
+                response.status_code = 503
+                response.headers['Retry-After'] = '1'
+
+            if key is not None and response.status_code >= 400:
+                room.release(key)
+            return response
+        return wrapper
+    return decorator
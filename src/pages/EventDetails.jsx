@@ -51,6 +51,7 @@ function EventDetails() {
   const [bookingDialogOpen, setBookingDialogOpen] = useState(false);
   const [quantity, setQuantity] = useState(1);
   const [bookmarked, setBookmarked] = useState(false);
+  const [queueStatus, setQueueStatus] = useState(null);
 
   useEffect(() => {
     setLoading(true);
@@ -85,15 +86,32 @@ function EventDetails() {
     setQuantity(1);
   };
 
+  // Waits in the event's queue (when the server runs one) and returns the headers that admit the purchase
+  const admissionHeaders = async () => {
+    const { data } = await api.post(`/tickets/queue/${id}`);
+    if (!data.token) return {};
+
+    const headers = { 'X-Queue-Token': data.token };
+    let status = data;
+    while (!status.admitted) {
+      setQueueStatus(status);
+      await new Promise(resolve => setTimeout(resolve, Math.min(status.eta_seconds, 5) * 1000));
+      status = (await api.get(`/tickets/queue/${id}`, { headers })).data;
+    }
+    setQueueStatus(null);
+    return headers;
+  };
+
   const handleConfirmBooking = async () => {
     setBuying(true);
     setError(null);
 
     try {
-      // Purchase tickets based on quantity
-      for (let i = 0; i < quantity; i++) {
-        await api.post(`/tickets/purchase/${id}`);
-      }
+      const headers = await admissionHeaders();
+      // Purchase all requested tickets in a single order; the key makes a retried request safe
+      await api.post(`/tickets/purchase/${id}`, { quantity }, {
+        headers: { ...headers, 'Idempotency-Key': crypto.randomUUID() }
+      });
 
       setSuccess(`Successfully purchased ${quantity} ticket${quantity > 1 ? 's' : ''}!`);
       setAvailable(a => a - quantity);
@@ -102,6 +120,7 @@ function EventDetails() {
     } catch (err) {
       setError(err.response?.data?.error || "Failed to purchase tickets");
     } finally {
+      setQueueStatus(null);
       setBuying(false);
     }
   };
@@ -114,7 +133,9 @@ function EventDetails() {
 
     setBuying(true);
     try {
-      await api.post(`/tickets/purchase-resale/${ticketId}`);
+      await api.post(`/tickets/purchase-resale/${ticketId}`, null, {
+        headers: { 'Idempotency-Key': crypto.randomUUID() }
+      });
       setSuccess("Resale ticket purchased successfully!");
       setResaleTickets(tickets => tickets.filter(t => t.ticket_id !== ticketId));
     } catch (err) {
@@ -456,6 +477,12 @@ function EventDetails() {
               </Typography>
             </Box>
           </Box>
+
+          {queueStatus && (
+            <Alert severity="info" sx={{ mt: 2 }}>
+              You're in the queue: position {queueStatus.position}, about {queueStatus.eta_seconds}s to go
+            </Alert>
+          )}
         </DialogContent>
 
         <DialogActions sx={{ p: 3, pt: 0 }}>
@@ -468,7 +495,7 @@ function EventDetails() {
             disabled={buying || quantity < 1}
             startIcon={buying ? null : <CheckCircle />}
           >
-            {buying ? 'Processing...' : 'Confirm Purchase'}
+            {queueStatus ? 'Waiting in queue...' : buying ? 'Processing...' : 'Confirm Purchase'}
           </Button>
         </DialogActions>
       </Dialog>
@@ -77,23 +77,31 @@ function EventsNearMe() {
         setLoading(true);
         setError(null);
 
-        try {
-            const response = await api.get('/eventbrite/events/near-me', {
-                params: {
-                    lat: location.lat,
-                    lng: location.lng,
-                    radius: radius,
-                    category: category || undefined,
-                    limit: 20
-                }
-            });
-
-            setEvents(response.data.events || []);
-            setLoading(false);
-        } catch (err) {
+        const params = {
+            lat: location.lat,
+            lng: location.lng,
+            radius: radius,
+            category: category || undefined,
+            limit: 20
+        };
+
+        // Local events come back sorted by distance; Eventbrite results follow
+        const [local, eventbrite] = await Promise.allSettled([
+            api.get('/events/near-me', { params }),
+            api.get('/eventbrite/events/near-me', { params })
+        ]);
+
+        if (local.status === 'rejected' && eventbrite.status === 'rejected') {
             setError('Failed to load nearby events. Please try again.');
             setLoading(false);
+            return;
         }
+
+        setEvents([
+            ...(local.status === 'fulfilled' ? local.value.data.events || [] : []),
+            ...(eventbrite.status === 'fulfilled' ? eventbrite.value.data.events || [] : [])
+        ]);
+        setLoading(false);
     };
 
     const handleUseMyLocation = () => {